@@ -12,6 +12,8 @@ from settings.config import Config
 from infra.models.base import Base
 from infra.models.name import NameOriginModel  # noqa
 from infra.models.country import CountryModel  # noqa
+from infra.models.job import JobModel  # noqa
+from infra.models.area import NameAreaPopularityModel  # noqa
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,78 @@
+"""add name_key to names_origin
+
+Revision ID: 20261019_09_12_40
+Revises: 20250528_18_06_16
+Create Date: 2026-10-19 09:12:40.512307
+
+"""
+
+import unicodedata
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261019_09_12_40'
+down_revision: Union[str, None] = '20250528_18_06_16'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+names_origin = sa.table(
+    'names_origin',
+    sa.column('id', sa.Integer()),
+    sa.column('name', sa.String(length=100)),
+    sa.column('name_key', sa.String(length=100)),
+)
+
+
+def _canonical(name: str) -> str:
+    # Must stay in sync with domain.values.name.Name.canonical
+    folded = unicodedata.normalize('NFKC', name).casefold()
+    return unicodedata.normalize('NFKC', folded).strip()[:100]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'names_origin',
+        sa.Column('name_key', sa.String(length=100), nullable=True),
+    )
+
+    # Backfill in Python so the key matches Name.canonical exactly
+    connection = op.get_bind()
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(names_origin.c.id, names_origin.c.name)
+            .where(names_origin.c.id > last_id)
+            .order_by(names_origin.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        connection.execute(
+            names_origin.update()
+            .where(names_origin.c.id == sa.bindparam('row_id'))
+            .values(name_key=sa.bindparam('key')),
+            [{'row_id': row.id, 'key': _canonical(row.name)} for row in rows],
+        )
+        last_id = rows[-1].id
+
+    op.alter_column('names_origin', 'name_key', nullable=False)
+    op.create_index(
+        op.f('ix_names_origin_name_key'), 'names_origin', ['name_key'], unique=False
+    )
+    op.drop_index(op.f('ix_names_origin_name'), table_name='names_origin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        op.f('ix_names_origin_name'), 'names_origin', ['name'], unique=False
+    )
+    op.drop_index(op.f('ix_names_origin_name_key'), table_name='names_origin')
+    op.drop_column('names_origin', 'name_key')
@@ -0,0 +1,65 @@
+"""add names area popularity table
+
+Revision ID: 20261019_12_41_27
+Revises: 20261019_11_20_08
+Create Date: 2026-10-19 12:41:27.804113
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261019_12_41_27'
+down_revision: Union[str, None] = '20261019_11_20_08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must stay in sync with NameSQLAlchemyRepository.refresh_area_popularity
+BACKFILL = """
+INSERT INTO names_area_popularity
+    (area_type, area, name_key, name, weight, countries, updated_at)
+SELECT '{area_type}', countries.{area_column}, names_origin.name_key,
+       MAX(names_origin.name),
+       SUM(names_origin.probability * names_origin.count_of_requests),
+       COUNT(*), CURRENT_TIMESTAMP
+FROM names_origin
+JOIN countries ON countries.iso_alpha2_code = names_origin.country_code
+WHERE countries.{area_column} IS NOT NULL AND countries.{area_column} != ''
+GROUP BY countries.{area_column}, names_origin.name_key
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'names_area_popularity',
+        sa.Column('area_type', sa.String(length=16), nullable=False),
+        sa.Column('area', sa.String(length=50), nullable=False),
+        sa.Column('name_key', sa.String(length=100), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('weight', sa.Float(), nullable=False),
+        sa.Column('countries', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('area_type', 'area', 'name_key'),
+    )
+    op.create_index(
+        'ix_names_area_popularity_area_weight',
+        'names_area_popularity',
+        ['area_type', 'area', 'weight', 'name_key'],
+        unique=False,
+    )
+
+    for area_type, area_column in (('region', 'region'), ('sub_region', 'sub_region')):
+        op.execute(BACKFILL.format(area_type=area_type, area_column=area_column))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_names_area_popularity_area_weight', table_name='names_area_popularity'
+    )
+    op.drop_table('names_area_popularity')
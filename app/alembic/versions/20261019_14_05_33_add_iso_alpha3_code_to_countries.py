@@ -0,0 +1,33 @@
+"""add iso_alpha3_code to countries
+
+Revision ID: 20261019_14_05_33
+Revises: 20261019_12_41_27
+Create Date: 2026-10-19 14:05:33.271946
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261019_14_05_33'
+down_revision: Union[str, None] = '20261019_12_41_27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Filled in by the country graph rebuild, which fetches the codes once
+    op.add_column(
+        'countries',
+        sa.Column('iso_alpha3_code', sa.String(length=3), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('countries', 'iso_alpha3_code')
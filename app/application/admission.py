@@ -0,0 +1,95 @@
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from urllib.parse import parse_qs
+
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from domain.exceptions.base import ApplicationException
+from domain.values.name import Name
+from infra.indexes.hot_names import HotNameTracker
+from utils.admission import AdmissionController, AdmissionPriority
+
+
+NAMES_PATH = '/api/v1/names/'
+POPULAR_NAMES_PATH = '/api/v1/names/popular-names/'
+AUTOCOMPLETE_PATH = '/api/v1/names/autocomplete/'
+
+
+@dataclass
+class NameRequestClassifier:
+    """Gives requests that can be served from the database priority over cold ones.
+
+    A name lookup is high priority while its stored origins are fresh according to
+    the hot names tracker, since it needs no upstream call; so are popular names,
+    which only read the database, and autocomplete, served from memory. Other name
+    requests are low priority, and requests outside the name API bypass admission
+    control.
+    """
+
+    hot_names: HotNameTracker
+
+    def __call__(self, scope: Scope) -> AdmissionPriority | None:
+        path: str = scope['path']
+        if not path.startswith(NAMES_PATH):
+            return None
+        if path.startswith((POPULAR_NAMES_PATH, AUTOCOMPLETE_PATH)):
+            return AdmissionPriority.HIGH
+        if path == NAMES_PATH and scope['method'] == 'GET':
+            return self._lookup_priority(scope)
+        return AdmissionPriority.LOW
+
+    def _lookup_priority(self, scope: Scope) -> AdmissionPriority:
+        names = parse_qs(scope['query_string'].decode(errors='replace')).get('name')
+        try:
+            key = Name(value=names[0].strip()).canonical if names else None
+        except ApplicationException:
+            # Rejected by the handler without any I/O
+            return AdmissionPriority.HIGH
+        expires_at = self.hot_names.expires_at(key) if key else None
+        if expires_at and expires_at > datetime.now():
+            return AdmissionPriority.HIGH
+        return AdmissionPriority.LOW
+
+
+class AdmissionControlMiddleware:
+    """ASGI middleware admitting requests through an AdmissionController.
+
+    Requests that are not admitted get a 503 with Retry-After at once, before any
+    routing, dependency or database work is done for them.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        controller: AdmissionController,
+        classify: Callable[[Scope], AdmissionPriority | None],
+        retry_after: float = 1.0,
+    ) -> None:
+        self.app = app
+        self.controller = controller
+        self.classify = classify
+        self.retry_after = retry_after
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        priority = self.classify(scope) if scope['type'] == 'http' else None
+        if priority is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await self.controller.acquire(priority):
+            response = ORJSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={'detail': {'error': 'Server is overloaded, retry later'}},
+                headers={'Retry-After': str(math.ceil(self.retry_after))},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release()
@@ -0,0 +1,82 @@
+import asyncio
+from collections.abc import Awaitable
+from typing import TypeVar
+
+from fastapi import Depends, Header, HTTPException, Request
+
+from logic.mediator import Mediator
+from settings.config import Config
+from utils.deadline import deadline_after
+
+
+T = TypeVar('T')
+
+# Non-standard status code (nginx) for requests the client abandoned
+CLIENT_CLOSED_REQUEST = 499
+
+
+def get_mediator(request: Request) -> Mediator:
+    """Returns the mediator built once at startup and stored on app.state."""
+    return request.app.state.mediator
+
+
+def get_config(request: Request) -> Config:
+    """Returns the configuration stored on app.state at startup."""
+    return request.app.state.config
+
+
+async def get_request_deadline(
+    x_request_timeout: float | None = Header(
+        default=None,
+        gt=0,
+        description='Seconds the client waits for the response',
+    ),
+    config: Config = Depends(dependency=get_config),
+) -> float:
+    """Returns the deadline of the request in event loop time.
+
+    The budget is the X-Request-Timeout header, capped by the configured maximum,
+    or the configured default. The dependency is async so that it runs on the
+    event loop: a sync one would run in a worker thread, which has no loop.
+    """
+    timeout = (
+        min(x_request_timeout, config.request_timeout_max)
+        if x_request_timeout
+        else config.request_timeout
+    )
+    return deadline_after(timeout)
+
+
+async def cancel_on_disconnect(
+    request: Request, work: Awaitable[T], poll_interval: float = 0.1
+) -> T:
+    """Await the work, cancelling it as soon as the client disconnects.
+
+    Args:
+        request: The request the work is done for
+        work: The work to await
+        poll_interval: Seconds between checks of the connection
+
+    Raises:
+        HTTPException: With status 499 if the client disconnected first.
+    """
+    task = asyncio.ensure_future(work)
+
+    async def watch() -> None:
+        while not await request.is_disconnected():
+            await asyncio.sleep(poll_interval)
+        task.cancel()
+
+    watcher = asyncio.create_task(watch())
+    try:
+        return await task
+    except asyncio.CancelledError:
+        if not watcher.done() or watcher.cancelled():
+            raise
+        raise HTTPException(
+            status_code=CLIENT_CLOSED_REQUEST,
+            detail={'error': 'Client closed request'},
+        ) from None
+    finally:
+        watcher.cancel()
+        task.cancel()
@@ -1,10 +1,64 @@
+import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.responses import ORJSONResponse
 
+from application.admission import (
+    AdmissionControlMiddleware,
+    NameRequestClassifier,
+)
+from application.rate_limit import RateLimitMiddleware
 from application.static_docs import register_static_docs_routes
+from application.v1.country.handlers import router as country_router_v1
+from application.v1.health.handlers import router as health_router_v1
+from application.v1.jobs.handlers import router as jobs_router_v1
 from application.v1.name.handlers import router as name_router_v1
 from brotli_asgi import BrotliMiddleware
+from infra.http.clients import HTTPClientRegistry
+from infra.indexes.hot_names import HotNameTracker
+from infra.snapshots.countries import CountrySnapshot
+from logic.commands.country import FetchAndSaveCountriesCommand
+from logic.init import init_container
+from logic.mediator import Mediator
+from punq import Container
+from settings.config import Config
+from utils.admission import AdmissionController
+from utils.rate_limit import ClientRateLimiter
+from utils.scheduler import Scheduler
+from utils.workers import WorkerPool
+
+
+logger = logging.getLogger(__name__)
+
+
+async def seed_countries(container: Container) -> None:
+    """Seed the database and the country catalog from the shipped snapshot.
+
+    Without the snapshot the countries are fetched on demand, as they are when
+    seeding is disabled.
+
+    Args:
+        container: Dependency container of the application
+    """
+    config: Config = container.resolve(Config)
+    if not config.country_snapshot_seed_on_startup:
+        return
+    snapshot: CountrySnapshot = container.resolve(CountrySnapshot)
+    if not snapshot.exists():
+        logger.warning(
+            'Country snapshot %s is missing; countries are fetched on demand. '
+            'Build it with "make country-snapshot"',
+            snapshot.path,
+        )
+        return
+
+    try:
+        await container.resolve(Mediator).handle_command(
+            FetchAndSaveCountriesCommand(from_snapshot=True)
+        )
+    except Exception:
+        # Countries are still fetched on demand, so serve requests regardless
+        logger.exception('Could not seed countries from %s', snapshot.path)
 
 
 @asynccontextmanager
@@ -15,8 +69,76 @@ async def lifespan(app: FastAPI):
         app: FastAPI application instance
     """
     # Startup
+    container = init_container()
+    # Resolved once here so that request handlers only read app.state
+    app.state.container = container
+    app.state.config = container.resolve(Config)
+    app.state.mediator = container.resolve(Mediator)
+    http_clients: HTTPClientRegistry = container.resolve(HTTPClientRegistry)
+    await http_clients.warm_up()
+    await seed_countries(container)
+    # Bulk enrichment jobs; unfinished ones are resumed by the scheduler
+    jobs_worker_pool: WorkerPool = container.resolve(WorkerPool)
+    jobs_worker_pool.start()
+    scheduler: Scheduler = container.resolve(Scheduler)
+    scheduler.start()
     yield
     # Shutdown
+    await scheduler.aclose()
+    # Interrupted jobs resume from their last checkpoint
+    await jobs_worker_pool.aclose()
+    await http_clients.aclose()
+
+
+def add_admission_control(app: FastAPI, container: Container) -> None:
+    """Shed load with 503s once the name API is saturated.
+
+    Runs inside the rate limiter, which create_app adds after it: a request is
+    first charged a token of its client, then admitted or shed, so shed requests
+    still count against the rate of their client. It still runs before any other
+    work is done for the request.
+
+    Args:
+        app: FastAPI application instance
+        container: Dependency container of the application
+    """
+    config: Config = container.resolve(Config)
+    if config.admission_max_concurrency <= 0:
+        return
+
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        controller=AdmissionController(
+            max_concurrency=config.admission_max_concurrency,
+            queue_size=config.admission_queue_size,
+            queue_timeout=config.admission_queue_timeout,
+        ),
+        classify=NameRequestClassifier(hot_names=container.resolve(HotNameTracker)),
+        retry_after=config.admission_retry_after,
+    )
+
+
+def add_rate_limiting(app: FastAPI, container: Container) -> None:
+    """Limit the rate of each client of the name API.
+
+    Added after admission control, so it is the outermost of the two: throttled
+    clients are turned away before they take a place in its queue.
+
+    Args:
+        app: FastAPI application instance
+        container: Dependency container of the application
+    """
+    config: Config = container.resolve(Config)
+    if config.rate_limit_rate <= 0:
+        return
+
+    app.add_middleware(
+        RateLimitMiddleware,
+        limiter=container.resolve(ClientRateLimiter),
+        upstream_cost=config.rate_limit_upstream_cost,
+        api_key_header=config.rate_limit_api_key_header,
+        trusted_proxies=config.rate_limit_trusted_proxies,
+    )
 
 
 def create_app() -> FastAPI:
@@ -35,11 +157,16 @@ def create_app() -> FastAPI:
         default_response_class=ORJSONResponse,
     )
 
-    # Add middleware
+    # Add middleware; the last added runs first: rate limit, admission control
     app.add_middleware(BrotliMiddleware)
+    add_admission_control(app, init_container())
+    add_rate_limiting(app, init_container())
 
     # Register routes
     app.include_router(name_router_v1, prefix='/api/v1')
+    app.include_router(health_router_v1, prefix='/api/v1')
+    app.include_router(jobs_router_v1, prefix='/api/v1')
+    app.include_router(country_router_v1, prefix='/api/v1')
 
     # Register static docs routes
     register_static_docs_routes(app)
@@ -0,0 +1,78 @@
+import hashlib
+import math
+
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from utils.rate_limit import ClientRateLimiter, count_request_cost
+
+
+class RateLimitMiddleware:
+    """ASGI middleware limiting the rate of each client of the name API.
+
+    Clients are identified by their API key header, or by their address without
+    one. Behind trusted_proxies reverse proxies, each appending the address it
+    got the request from to X-Forwarded-For, the address is the one the
+    outermost proxy appended; entries further left can be forged by the client. A request costs one token up front and upstream_cost more per name it
+    had to look up upstream, charged once it completes, so cold lookups drain a
+    bucket faster than reads served from the database. A client without tokens
+    gets a 429 with Retry-After before any other work is done.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: ClientRateLimiter,
+        path_prefix: str = '/api/v1/names/',
+        upstream_cost: float = 5.0,
+        api_key_header: str = 'X-API-Key',
+        trusted_proxies: int = 0,
+    ) -> None:
+        self.app = app
+        self.limiter = limiter
+        self.path_prefix = path_prefix
+        self.upstream_cost = upstream_cost
+        self.api_key_header = api_key_header
+        self.trusted_proxies = trusted_proxies
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or not scope['path'].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        client = self._client(scope)
+        retry_after = self.limiter.try_acquire(client)
+        if retry_after:
+            response = ORJSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={'detail': {'error': 'Rate limit exceeded'}},
+                headers={'Retry-After': str(math.ceil(retry_after))},
+            )
+            await response(scope, receive, send)
+            return
+
+        with count_request_cost() as cost:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                self.limiter.charge(client, cost.upstream_lookups * self.upstream_cost)
+
+    def _client(self, scope: Scope) -> str:
+        headers = Headers(scope=scope)
+        api_key = headers.get(self.api_key_header)
+        if api_key:
+            # Keys are shared with the other workers through a file; keep them out
+            return f'key:{hashlib.sha256(api_key.encode()).hexdigest()[:32]}'
+        if self.trusted_proxies:
+            forwarded = [
+                address.strip()
+                for value in headers.getlist('x-forwarded-for')
+                for address in value.split(',')
+                if address.strip()
+            ]
+            if len(forwarded) >= self.trusted_proxies:
+                return f'ip:{forwarded[-self.trusted_proxies]}'
+        host = scope['client'][0] if scope.get('client') else 'unknown'
+        return f'ip:{host}'
@@ -0,0 +1,29 @@
+from fastapi.responses import StreamingResponse
+
+from starlette.requests import ClientDisconnect
+from starlette.types import (
+    Receive,
+    Scope,
+    Send,
+)
+
+
+class RequestStreamingResponse(StreamingResponse):
+    """StreamingResponse whose body is produced while the request body is read.
+
+    Under ASGI spec versions below 2.4, which uvicorn reports, StreamingResponse
+    listens on receive for a disconnect while it streams, and that listener would
+    swallow the request body messages its iterator waits for. This response
+    leaves receive to the request: a client that goes away ends the request
+    stream with ClientDisconnect, or fails the next send.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        except (ClientDisconnect, OSError):
+            # The client went away; there is nobody left to answer
+            return
+
+        if self.background is not None:
+            await self.background()
@@ -0,0 +1,137 @@
+from fastapi import (
+    Depends,
+    HTTPException,
+    Query,
+    status,
+)
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRouter
+
+from application.dependencies import get_mediator
+from application.v1.country.schemas import (
+    CountryNeighborsOutSchema,
+    CountryPathOutSchema,
+)
+from application.v1.exceptions.schemas import ErrorResponseSchema
+from logic.commands.country import (
+    GetCountryNeighborsCommand,
+    GetCountryPathCommand,
+)
+from logic.exceptions.country import (
+    CountryGraphIncompleteException,
+    CountryNotFoundException,
+    NoLandPathException,
+)
+from logic.mediator import Mediator
+
+
+router = APIRouter(tags=['Country'], prefix='/countries')
+
+
+COUNTRY_NOT_FOUND_RESPONSE = {
+    'model': ErrorResponseSchema,
+    'description': 'Country not found',
+    'content': {
+        'application/json': {
+            'example': {
+                'detail': {
+                    'error': 'Country with code "XX" not found',
+                },
+            },
+        },
+    },
+}
+
+
+@router.get(
+    path='/{country_code}/neighbors/',
+    status_code=status.HTTP_200_OK,
+    response_model=CountryNeighborsOutSchema,
+    responses={status.HTTP_404_NOT_FOUND: COUNTRY_NOT_FOUND_RESPONSE},
+)
+async def get_country_neighbors_handler(
+    country_code: str,
+    hops: int = Query(default=1, ge=1, le=10, description='Most borders crossed'),
+    mediator: Mediator = Depends(dependency=get_mediator),
+) -> ORJSONResponse:
+    """Get the countries up to a number of land borders away from a country.
+
+    Answered from an in-memory graph of the borders, without a database query.
+
+    Args:
+        country_code: ISO alpha-2 code of the country, e.g. "PL"
+        hops: Maximum number of borders crossed (1 by default)
+
+    Returns:
+        The countries grouped by the number of borders crossed to reach them
+    """
+    try:
+        levels, *_ = await mediator.handle_command(
+            command=GetCountryNeighborsCommand(iso_alpha2_code=country_code, hops=hops),
+        )
+    except CountryNotFoundException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                'error': exception.message,
+            },
+        ) from exception
+
+    return ORJSONResponse(
+        content=CountryNeighborsOutSchema.dump_levels(
+            country_code.strip().upper(), levels
+        )
+    )
+
+
+@router.get(
+    path='/{country_code}/path/{target_code}/',
+    status_code=status.HTTP_200_OK,
+    response_model=CountryPathOutSchema,
+    responses={
+        status.HTTP_404_NOT_FOUND: {
+            **COUNTRY_NOT_FOUND_RESPONSE,
+            'description': 'Country not found, or no land path between the two',
+        },
+        status.HTTP_503_SERVICE_UNAVAILABLE: {
+            'model': ErrorResponseSchema,
+            'description': 'No land path found while some countries are not loaded',
+        },
+    },
+)
+async def get_country_path_handler(
+    country_code: str,
+    target_code: str,
+    mediator: Mediator = Depends(dependency=get_mediator),
+) -> ORJSONResponse:
+    """Get a shortest land path between two countries.
+
+    Answered from an in-memory graph of the borders, without a database query.
+
+    Args:
+        country_code: ISO alpha-2 code of the first country, e.g. "PL"
+        target_code: ISO alpha-2 code of the last country, e.g. "ES"
+
+    Returns:
+        The countries crossed, from the first to the last one
+    """
+    try:
+        path, *_ = await mediator.handle_command(
+            command=GetCountryPathCommand(source=country_code, target=target_code),
+        )
+    except (CountryNotFoundException, NoLandPathException) as exception:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                'error': exception.message,
+            },
+        ) from exception
+    except CountryGraphIncompleteException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                'error': exception.message,
+            },
+        ) from exception
+
+    return ORJSONResponse(content=CountryPathOutSchema.dump_path(path))
@@ -0,0 +1,74 @@
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from domain.entities.country import CountryEntity
+
+
+class CountryNodeOutSchema(BaseModel):
+    country_code: str = Field(..., description='ISO alpha-2 code (e.g., "PL")')
+    country: str = Field(
+        ...,
+        description="Comma-separated list of country code and names (e.g., 'CA,Canada,Canada')",
+    )
+    region: str = Field(
+        ..., description='Region and sub-region in format "Region,Sub-region"'
+    )
+
+    @staticmethod
+    def dump_entity(country: CountryEntity) -> dict[str, Any]:
+        """Serialize an entity to the fields of the schema without validating them."""
+        return {
+            'country_code': country.iso_alpha2_code,
+            'country': country.country_name,
+            'region': country.region_full,
+        }
+
+
+class CountryNeighborsLevelOutSchema(BaseModel):
+    hops: int = Field(..., description='Land borders crossed to reach the countries')
+    countries: list[CountryNodeOutSchema] = Field(
+        ..., description='Countries first reached after this many borders'
+    )
+
+
+class CountryNeighborsOutSchema(BaseModel):
+    country_code: str = Field(..., description='ISO alpha-2 code of the country')
+    levels: list[CountryNeighborsLevelOutSchema] = Field(
+        ..., description='One level per number of borders, empty for an island'
+    )
+
+    @staticmethod
+    def dump_levels(
+        country_code: str, levels: list[list[CountryEntity]]
+    ) -> dict[str, Any]:
+        """Serialize the levels to the fields of the schema without validating them."""
+        return {
+            'country_code': country_code,
+            'levels': [
+                {
+                    'hops': hops,
+                    'countries': [
+                        CountryNodeOutSchema.dump_entity(country) for country in level
+                    ],
+                }
+                for hops, level in enumerate(levels, start=1)
+            ],
+        }
+
+
+class CountryPathOutSchema(BaseModel):
+    borders_crossed: int = Field(..., description='Land borders along the path')
+    countries: list[CountryNodeOutSchema] = Field(
+        ..., description='Countries of the path, from the source to the target'
+    )
+
+    @staticmethod
+    def dump_path(path: list[CountryEntity]) -> dict[str, Any]:
+        """Serialize the path to the fields of the schema without validating them."""
+        return {
+            'borders_crossed': len(path) - 1,
+            'countries': [
+                CountryNodeOutSchema.dump_entity(country) for country in path
+            ],
+        }
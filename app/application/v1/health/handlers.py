@@ -0,0 +1,47 @@
+from fastapi import (
+    Depends,
+    status,
+)
+from fastapi.routing import APIRouter
+
+from punq import Container
+from logic.init import init_container
+from infra.http.clients import HTTPClientRegistry
+from application.v1.health.schemas import HealthOutSchema, UpstreamMetricsOutSchema
+
+
+router = APIRouter(tags=['Health'], prefix='/health')
+
+
+@router.get(
+    path='/',
+    status_code=status.HTTP_200_OK,
+    response_model=HealthOutSchema,
+)
+async def health_handler() -> HealthOutSchema:
+    """Check that the service is up.
+
+    Returns:
+        Status of the service
+    """
+    return HealthOutSchema(status='ok')
+
+
+@router.get(
+    path='/upstreams/',
+    status_code=status.HTTP_200_OK,
+    response_model=dict[str, UpstreamMetricsOutSchema],
+)
+async def upstreams_metrics_handler(
+    container: Container = Depends(dependency=init_container),
+) -> dict[str, UpstreamMetricsOutSchema]:
+    """Get request metrics of the upstream APIs.
+
+    Returns:
+        Metrics keyed by upstream name ("nationalize", "rest_countries")
+    """
+    http_clients: HTTPClientRegistry = container.resolve(HTTPClientRegistry)
+    return {
+        upstream: UpstreamMetricsOutSchema(**metrics)
+        for upstream, metrics in http_clients.metrics().items()
+    }
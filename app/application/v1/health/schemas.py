@@ -0,0 +1,18 @@
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+
+class HealthOutSchema(BaseModel):
+    status: str = Field(..., description='Service status')
+
+
+class UpstreamMetricsOutSchema(BaseModel):
+    requests: int = Field(..., description='Requests sent to the upstream')
+    errors: int = Field(..., description='Failed requests and 5xx responses')
+    in_flight: int = Field(..., description='Requests currently waiting for a response')
+    average_latency_ms: float = Field(
+        ..., description='Average time to response headers in milliseconds'
+    )
+    http2_responses: int = Field(..., description='Responses received over HTTP/2')
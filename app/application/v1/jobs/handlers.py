@@ -0,0 +1,179 @@
+from fastapi import (
+    Depends,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import FileResponse
+from fastapi.routing import APIRouter
+
+from application.dependencies import get_mediator
+from application.v1.exceptions.schemas import ErrorResponseSchema
+from application.v1.jobs.schemas import JobOutSchema
+from infra.exceptions.jobs import JobInputTooLargeException
+from logic.commands.job import (
+    CreateNamesJobCommand,
+    GetNamesJobCommand,
+    GetNamesJobResultsCommand,
+)
+from logic.exceptions.job import (
+    EmptyJobException,
+    JobNotCompletedException,
+    JobNotFoundException,
+)
+from logic.mediator import Mediator
+from utils.streams import iter_lines, parse_text_line
+
+
+router = APIRouter(tags=['Jobs'], prefix='/jobs')
+
+
+JOB_NOT_FOUND_RESPONSE = {
+    'model': ErrorResponseSchema,
+    'description': 'Job not found',
+    'content': {
+        'application/json': {
+            'example': {
+                'detail': {
+                    'error': 'Job "0192d0a4-..." not found',
+                },
+            },
+        },
+    },
+}
+
+
+@router.post(
+    path='/',
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=JobOutSchema,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            'model': ErrorResponseSchema,
+            'description': 'The uploaded file has no names',
+        },
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE: {
+            'model': ErrorResponseSchema,
+            'description': 'The uploaded file exceeds JOBS_MAX_UPLOAD_BYTES',
+        },
+    },
+)
+async def create_names_job_handler(
+    request: Request,
+    response: Response,
+    mediator: Mediator = Depends(dependency=get_mediator),
+) -> JobOutSchema:
+    """Create a job resolving the origins of every name of the uploaded file.
+
+    The body holds one name per line, as plain text or as a JSON string, and is
+    written to disk as it arrives. The job runs in the background; poll the URL in
+    the Location header for its progress and download its results once it is
+    completed.
+
+    Returns:
+        The pending job
+    """
+    names = (parse_text_line(line) async for line in iter_lines(request.stream()))
+    try:
+        job, *_ = await mediator.handle_command(CreateNamesJobCommand(names=names))
+    except EmptyJobException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={'error': exception.message},
+        ) from exception
+    except JobInputTooLargeException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail={'error': exception.message},
+        ) from exception
+
+    response.headers['Location'] = request.url_for(
+        'get_names_job_handler', job_id=job.id
+    ).path
+    return JobOutSchema.from_entity(job)
+
+
+@router.get(
+    path='/{job_id}',
+    status_code=status.HTTP_200_OK,
+    response_model=JobOutSchema,
+    responses={status.HTTP_404_NOT_FOUND: JOB_NOT_FOUND_RESPONSE},
+)
+async def get_names_job_handler(
+    job_id: str,
+    mediator: Mediator = Depends(dependency=get_mediator),
+) -> JobOutSchema:
+    """Get the status and progress of a job.
+
+    Args:
+        job_id: Identifier of the job
+
+    Returns:
+        The job as of its last checkpoint
+    """
+    try:
+        job, *_ = await mediator.handle_command(GetNamesJobCommand(job_id=job_id))
+    except JobNotFoundException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={'error': exception.message},
+        ) from exception
+    return JobOutSchema.from_entity(job)
+
+
+@router.get(
+    path='/{job_id}/results',
+    status_code=status.HTTP_200_OK,
+    response_class=FileResponse,
+    responses={
+        status.HTTP_200_OK: {
+            'description': 'One JSON object per line and name, in the uploaded order',
+            'content': {
+                'application/x-ndjson': {
+                    'example': (
+                        '{"name":"Anna","origins":[{"country_code":"PL",...}]}\n'
+                        '{"name":"Zzzz","error":"..."}\n'
+                    ),
+                },
+            },
+        },
+        status.HTTP_404_NOT_FOUND: JOB_NOT_FOUND_RESPONSE,
+        status.HTTP_409_CONFLICT: {
+            'model': ErrorResponseSchema,
+            'description': 'The job is not completed',
+        },
+    },
+)
+async def get_names_job_results_handler(
+    job_id: str,
+    mediator: Mediator = Depends(dependency=get_mediator),
+) -> FileResponse:
+    """Download the results of a completed job as NDJSON.
+
+    Args:
+        job_id: Identifier of the job
+
+    Returns:
+        Lines of {"name", "origins"} or {"name", "error"}
+    """
+    try:
+        path, *_ = await mediator.handle_command(
+            GetNamesJobResultsCommand(job_id=job_id)
+        )
+    except JobNotFoundException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={'error': exception.message},
+        ) from exception
+    except JobNotCompletedException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={'error': exception.message},
+        ) from exception
+
+    return FileResponse(
+        path,
+        media_type='application/x-ndjson',
+        filename=f'{job_id}.ndjson',
+    )
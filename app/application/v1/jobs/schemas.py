@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from domain.entities.job import JobEntity
+
+
+class JobOutSchema(BaseModel):
+    id: str = Field(..., description='Job identifier')
+    status: str = Field(
+        ..., description='One of "pending", "running", "completed" or "failed"'
+    )
+    total_names: int = Field(..., description='Names in the uploaded file')
+    processed_names: int = Field(..., description='Names with results written')
+    failed_names: int = Field(
+        ..., description='Processed names written with an error instead of origins'
+    )
+    progress: float = Field(..., description='Share of the names processed, 0 to 1')
+    error: str | None = Field(None, description='Why the job failed, if it did')
+    created_at: datetime = Field(..., description='When the job was created')
+    updated_at: datetime = Field(..., description='When the job was last checkpointed')
+
+    @classmethod
+    def from_entity(cls, job: JobEntity) -> 'JobOutSchema':
+        return cls(
+            id=job.id,
+            status=job.status.value,
+            total_names=job.total_names,
+            processed_names=job.processed_names,
+            failed_names=job.failed_names,
+            progress=round(job.progress, 4),
+            error=job.error,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+        )
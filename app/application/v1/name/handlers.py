@@ -1,29 +1,77 @@
+import logging
+import math
+from typing import Any
+
+import orjson
+
 from fastapi import (
     Depends,
     HTTPException,
+    Query,
+    Request,
     status,
 )
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.routing import APIRouter
 
-from punq import Container
-from logic.init import init_container
+from settings.config import Config
+from utils.deadline import deadline_after
+from utils.streams import iter_lines, map_concurrently, parse_text_line
+from application.dependencies import (
+    cancel_on_disconnect,
+    get_config,
+    get_mediator,
+    get_request_deadline,
+)
+from application.responses import RequestStreamingResponse
 from logic.mediator import Mediator
-from logic.commands.name import GetNameOriginsCommand, GetFrequentNamesCountryCommand
+from logic.commands.name import (
+    GetBatchNameOriginsCommand,
+    GetFrequentNamesCountryCommand,
+    GetNameOriginsCommand,
+    GetNameSuggestionsCommand,
+    GetPopularNamesByAreaCommand,
+)
+from logic.exceptions.deadline import DeadlineExceededException
 from logic.exceptions.name import NameNotFoundException
-from logic.exceptions.country import CountryNotFoundException
-from application.v1.name.schemas import NameOriginsOutSchema
+from domain.exceptions.name import EmptyNameException, NameTooLongException
+from domain.exceptions.cursor import InvalidCursorException
+from infra.exceptions.upstream import UpstreamUnavailableException
+from domain.entities.name import NamesPageEntity
+from domain.exceptions.base import ApplicationException
+from domain.entities.country import AreaType
+from logic.exceptions.country import (
+    AreaNotFoundException,
+    CountriesFetchTimeoutException,
+    CountryNotFoundException,
+)
+from application.v1.name.projection import (
+    get_response_projection,
+    ResponseProjection,
+)
+from application.v1.name.schemas import (
+    AreaNameOutSchema,
+    BatchNameErrorSchema,
+    BatchNameOriginsInSchema,
+    BatchNameOriginsOutSchema,
+    CompactNameOriginsOutSchema,
+    NameOriginsOutSchema,
+    NameSuggestionOutSchema,
+)
 from application.v1.exceptions.schemas import (
     ErrorResponseSchema,
 )
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(tags=['Name'], prefix='/names')
 
 
 @router.get(
     path='/',
     status_code=status.HTTP_200_OK,
-    response_model=list[NameOriginsOutSchema],
+    response_model=list[NameOriginsOutSchema] | CompactNameOriginsOutSchema,
     responses={
         status.HTTP_400_BAD_REQUEST: {
             'model': ErrorResponseSchema,
@@ -54,16 +102,63 @@ router = APIRouter(tags=['Name'], prefix='/names')
                 },
             },
         },
+        status.HTTP_503_SERVICE_UNAVAILABLE: {
+            'model': ErrorResponseSchema,
+            'description': 'Upstream API unavailable and no stored origins to serve',
+            'content': {
+                'application/json': {
+                    'example': {
+                        'detail': {
+                            'error': 'Upstream API "nationalize" is unavailable',
+                        },
+                    },
+                },
+            },
+        },
+        status.HTTP_504_GATEWAY_TIMEOUT: {
+            'model': ErrorResponseSchema,
+            'description': 'The request deadline passed before the origins were found',
+            'content': {
+                'application/json': {
+                    'example': {
+                        'detail': {
+                            'error': (
+                                'Deadline exceeded while handling GetNameOriginsCommand'
+                            ),
+                        },
+                    },
+                },
+            },
+        },
     },
 )
 async def get_name_origins_handler(
     name: str,
-    container: Container = Depends(dependency=init_container),
-) -> list[NameOriginsOutSchema]:
+    request: Request,
+    fuzzy: bool = Query(
+        default=False,
+        description='Serve the closest known name when this one is not stored',
+    ),
+    suggest: bool = Query(
+        default=False,
+        description='Name the closest known name in the 404 of an unknown name',
+    ),
+    deadline: float = Depends(dependency=get_request_deadline),
+    projection: ResponseProjection = Depends(dependency=get_response_projection),
+    mediator: Mediator = Depends(dependency=get_mediator),
+) -> ORJSONResponse:
     """Get name origins with country information.
 
+    The lookup is cancelled when its deadline passes or the client disconnects.
+    With fuzzy, a name that is not stored but is a typo or two away from a stored
+    one is answered with the origins of that name, without an upstream lookup.
+
     Args:
         name: The name to get origins for
+        fuzzy: Whether to serve the origins of the closest known name
+        suggest: Whether a 404 names the closest known name
+        deadline: Deadline from the X-Request-Timeout header or the default budget
+        projection: Fields to return and whether countries are deduplicated
 
     Returns:
         List of name origins with country information, sorted by probability in descending order
@@ -79,26 +174,34 @@ async def get_name_origins_handler(
             },
         )
 
-    mediator: Mediator = container.resolve(Mediator)
     try:
-        name_origins, *_ = await mediator.handle_command(
-            command=GetNameOriginsCommand(name=name),
+        name_origins, *_ = await cancel_on_disconnect(
+            request,
+            mediator.handle_command(
+                command=GetNameOriginsCommand(name=name, fuzzy=fuzzy, suggest=suggest),
+                deadline=deadline,
+            ),
         )
-        # Convert to list of schemas and sort by probability in descending order
-        results = [
-            NameOriginsOutSchema.from_entity(name_origin_entity)
-            for name_origin_entity in name_origins
-        ]
-        return results
+        # Origins are already sorted by probability in descending order
+        return ORJSONResponse(content=projection.render(projection.dump(name_origins)))
 
-    except NameNotFoundException as exception:
+    except (EmptyNameException, NameTooLongException) as exception:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
+            status_code=status.HTTP_400_BAD_REQUEST,
             detail={
-                'error': f"Name '{name}' not found",
+                'error': exception.message,
             },
         ) from exception
 
+    except NameNotFoundException as exception:
+        detail = {'error': f"Name '{name}' not found"}
+        if exception.suggestion:
+            detail['suggestion'] = exception.suggestion
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=detail,
+        ) from exception
+
     except CountryNotFoundException as exception:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -107,15 +210,247 @@ async def get_name_origins_handler(
             },
         ) from exception
 
+    except DeadlineExceededException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail={
+                'error': exception.message,
+            },
+        ) from exception
+
+    except CountriesFetchTimeoutException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail={
+                'error': f"Timed out fetching country information for name '{name}'",
+            },
+        ) from exception
+
+    except UpstreamUnavailableException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                'error': exception.message,
+            },
+            headers={'Retry-After': str(math.ceil(exception.retry_after or 1))},
+        ) from exception
+
     except Exception as exception:
         raise exception
 
 
+@router.post(
+    path='/batch/',
+    status_code=status.HTTP_200_OK,
+    response_model=BatchNameOriginsOutSchema,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            'model': ErrorResponseSchema,
+            'description': 'Too many names in the batch',
+            'content': {
+                'application/json': {
+                    'example': {
+                        'detail': {
+                            'error': 'At most 1000 names are accepted per batch',
+                        },
+                    },
+                },
+            },
+        },
+        status.HTTP_504_GATEWAY_TIMEOUT: {
+            'model': ErrorResponseSchema,
+            'description': 'The request deadline passed before the batch was resolved',
+            'content': {
+                'application/json': {
+                    'example': {
+                        'detail': {
+                            'error': (
+                                'Deadline exceeded while handling '
+                                'GetBatchNameOriginsCommand'
+                            ),
+                        },
+                    },
+                },
+            },
+        },
+    },
+)
+async def get_batch_name_origins_handler(
+    body: BatchNameOriginsInSchema,
+    request: Request,
+    deadline: float = Depends(dependency=get_request_deadline),
+    projection: ResponseProjection = Depends(dependency=get_response_projection),
+    mediator: Mediator = Depends(dependency=get_mediator),
+    config: Config = Depends(dependency=get_config),
+) -> ORJSONResponse:
+    """Get the origins of many names with one request.
+
+    Duplicate names are resolved once, stored origins are read with one query and
+    the names missing from the database are fetched from the upstream in batches.
+    A name that cannot be resolved is reported in errors with the status its single
+    lookup would return, without failing the other names.
+
+    Args:
+        body: The names to get origins for
+        deadline: Deadline from the X-Request-Timeout header or the default budget
+        projection: Fields to return and whether countries are deduplicated
+
+    Returns:
+        The origins of the resolved names and the errors of the others, keyed by name
+
+    Raises:
+        HTTPException: If the batch is too large or its deadline passes
+    """
+    if len(body.names) > config.names_batch_max_size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                'error': (
+                    f'At most {config.names_batch_max_size} names are accepted '
+                    'per batch'
+                ),
+            },
+        )
+
+    try:
+        batch, *_ = await cancel_on_disconnect(
+            request,
+            mediator.handle_command(
+                command=GetBatchNameOriginsCommand(names=tuple(body.names)),
+                deadline=deadline,
+            ),
+        )
+    except DeadlineExceededException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail={
+                'error': exception.message,
+            },
+        ) from exception
+
+    results: dict[str, list[dict[str, Any]]] = {}
+    errors: dict[str, dict[str, Any]] = {}
+    for name, outcome in batch.items():
+        if isinstance(outcome, ApplicationException):
+            errors[name] = _batch_error(outcome).model_dump()
+        else:
+            results[name] = projection.dump(outcome)
+
+    content: dict[str, Any] = {'results': results, 'errors': errors}
+    if projection.compact:
+        content['countries'] = projection.countries
+    return ORJSONResponse(content=content)
+
+
+@router.post(
+    path='/stream/',
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            'description': (
+                'One JSON object per line and name, in the order the names resolve'
+            ),
+            'content': {
+                'application/x-ndjson': {
+                    'example': (
+                        '{"name":"Anna","origins":[...]}\n'
+                        '{"name":"Zzzz","error":{"status":404,"error":"..."}}\n'
+                    ),
+                },
+            },
+        },
+    },
+)
+async def stream_name_origins_handler(
+    request: Request,
+    projection: ResponseProjection = Depends(dependency=get_response_projection),
+    mediator: Mediator = Depends(dependency=get_mediator),
+    config: Config = Depends(dependency=get_config),
+) -> StreamingResponse:
+    """Stream the origins of the names in the request body as NDJSON.
+
+    The body holds one name per line, as plain text or as a JSON string. Names are
+    looked up while the body is still arriving, with at most
+    NAMES_STREAM_CONCURRENCY lookups in flight, and every result is written as soon
+    as it is ready, so memory does not grow with the number of names. Each lookup
+    has its own REQUEST_TIMEOUT budget, and a failed name is reported on its line
+    with the status its single lookup would return. With compact=true, a line
+    carries the countries its origins reference that no earlier line carried.
+
+    Returns:
+        NDJSON lines of {"name", "origins"} or {"name", "error"}
+    """
+    sent_countries: set[str] = set()
+
+    async def lookup(line: str) -> bytes:
+        name = parse_text_line(line)
+        try:
+            name_origins, *_ = await mediator.handle_command(
+                command=GetNameOriginsCommand(name=name),
+                deadline=deadline_after(config.request_timeout),
+            )
+        except ApplicationException as exception:
+            result = {'name': name, 'error': _batch_error(exception).model_dump()}
+        except Exception:
+            # One failed name must not abort the stream of the others
+            logger.exception('Could not look up the origins of %r', name)
+            result = {
+                'name': name,
+                'error': {
+                    'status': status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    'error': 'Internal server error',
+                },
+            }
+        else:
+            result = {'name': name, 'origins': projection.dump(name_origins)}
+            new_countries = {
+                code: country
+                for code, country in projection.countries.items()
+                if code not in sent_countries
+            }
+            if new_countries:
+                result['countries'] = new_countries
+                sent_countries.update(new_countries)
+        return orjson.dumps(result) + b'\n'
+
+    # The request body is read while the response streams
+    return RequestStreamingResponse(
+        map_concurrently(
+            iter_lines(request.stream()), lookup, config.names_stream_concurrency
+        ),
+        media_type='application/x-ndjson',
+    )
+
+
+def _batch_error(exception: ApplicationException) -> BatchNameErrorSchema:
+    """Map the error of one name to the status its single lookup would return."""
+    if isinstance(exception, NameNotFoundException | CountryNotFoundException):
+        status_code = status.HTTP_404_NOT_FOUND
+    elif isinstance(
+        exception, CountriesFetchTimeoutException | DeadlineExceededException
+    ):
+        status_code = status.HTTP_504_GATEWAY_TIMEOUT
+    elif isinstance(exception, UpstreamUnavailableException):
+        status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    else:
+        status_code = status.HTTP_400_BAD_REQUEST
+    return BatchNameErrorSchema(status=status_code, error=exception.message)
+
+
 @router.get(
     path='/popular-names/',
     status_code=status.HTTP_200_OK,
-    response_model=list[NameOriginsOutSchema],
+    response_model=list[NameOriginsOutSchema] | CompactNameOriginsOutSchema,
     responses={
+        status.HTTP_200_OK: {
+            'headers': {
+                'X-Next-Cursor': {
+                    'description': 'Cursor of the next page, absent on the last page',
+                    'schema': {'type': 'string'},
+                },
+            },
+        },
         status.HTTP_400_BAD_REQUEST: {
             'model': ErrorResponseSchema,
             'description': 'Invalid request parameters',
@@ -146,18 +481,27 @@ async def get_name_origins_handler(
 )
 async def get_popular_names_by_country_handler(
     country: str,
-    container: Container = Depends(dependency=init_container),
-) -> list[NameOriginsOutSchema]:
-    """Get top 5 most frequent names for a specific country.
+    limit: int = Query(default=5, ge=1, le=100, description='Page size'),
+    cursor: str | None = Query(
+        default=None, description='X-Next-Cursor value of the previous page'
+    ),
+    projection: ResponseProjection = Depends(dependency=get_response_projection),
+    mediator: Mediator = Depends(dependency=get_mediator),
+) -> ORJSONResponse:
+    """Get the most frequent names for a specific country, page by page.
 
     Args:
         country: The country code to get popular names for (e.g. "US", "UA")
+        limit: Maximum number of names to return (5 by default)
+        cursor: Opaque cursor from the X-Next-Cursor header of the previous page
+        projection: Fields to return and whether countries are deduplicated
 
     Returns:
-        List of top 5 most frequent names with country information
+        List of the most frequent names with country information; the X-Next-Cursor
+        response header holds the cursor of the next page if there is one
 
     Raises:
-        HTTPException: If the country parameter is missing or if no names are found
+        HTTPException: If the parameters are invalid or if no names are found
     """
     if not country:
         raise HTTPException(
@@ -167,23 +511,181 @@ async def get_popular_names_by_country_handler(
             },
         )
 
-    mediator: Mediator = container.resolve(Mediator)
     try:
-        top_frequent_names, *_ = await mediator.handle_command(
-            command=GetFrequentNamesCountryCommand(country_name=country.upper()),
+        page: NamesPageEntity
+        page, *_ = await mediator.handle_command(
+            command=GetFrequentNamesCountryCommand(
+                country_name=country.upper(),
+                limit=limit,
+                cursor=cursor,
+            ),
         )
-        if not top_frequent_names:
+        if not page.names and not cursor:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={
                     'error': f'No names found for country {country}',
                 },
             )
-        results = [
-            NameOriginsOutSchema.from_entity(name_origin_entity)
-            for name_origin_entity in top_frequent_names
-        ]
-        return results
+        # Headers of the injected response are not merged into a returned one
+        return ORJSONResponse(
+            content=projection.render(projection.dump(page.names)),
+            headers=(
+                {'X-Next-Cursor': page.next_cursor.as_generic_type()}
+                if page.next_cursor
+                else None
+            ),
+        )
+
+    except InvalidCursorException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                'error': exception.message,
+            },
+        ) from exception
 
     except Exception as exception:
         raise exception
+
+
+@router.get(
+    path='/popular-names/areas/',
+    status_code=status.HTTP_200_OK,
+    response_model=list[AreaNameOutSchema],
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            'model': ErrorResponseSchema,
+            'description': 'Invalid request parameters',
+            'content': {
+                'application/json': {
+                    'example': {
+                        'detail': {
+                            'error': 'Exactly one of region and sub_region is required',
+                        },
+                    },
+                },
+            },
+        },
+        status.HTTP_404_NOT_FOUND: {
+            'model': ErrorResponseSchema,
+            'description': 'No names found for the area',
+            'content': {
+                'application/json': {
+                    'example': {
+                        'detail': {
+                            'error': 'No names found for area "Eastern Europe"',
+                        },
+                    },
+                },
+            },
+        },
+    },
+)
+async def get_popular_names_by_area_handler(
+    region: str | None = Query(default=None, description='e.g. "Europe"'),
+    sub_region: str | None = Query(default=None, description='e.g. "Eastern Europe"'),
+    limit: int = Query(default=5, ge=1, le=100, description='Number of names'),
+    mediator: Mediator = Depends(dependency=get_mediator),
+) -> ORJSONResponse:
+    """Get the most popular names of a region or sub-region.
+
+    Names are ranked by their expected number of bearers in the area: the sum over
+    its countries of probability times count_of_requests. The ranking is read from
+    a rollup kept up to date as origins are stored, in one indexed read.
+
+    Args:
+        region: The region to get popular names for, case-insensitive
+        sub_region: The sub-region to get popular names for, instead of region
+        limit: Maximum number of names to return (5 by default)
+
+    Returns:
+        List of the most popular names of the area, by weight in descending order
+
+    Raises:
+        HTTPException: If the parameters are invalid or if no names are found
+    """
+    if bool(region) == bool(sub_region):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                'error': 'Exactly one of region and sub_region is required',
+            },
+        )
+
+    try:
+        area_names, *_ = await mediator.handle_command(
+            command=GetPopularNamesByAreaCommand(
+                area=region or sub_region,
+                area_type=AreaType.REGION if region else AreaType.SUB_REGION,
+                limit=limit,
+            ),
+        )
+    except AreaNotFoundException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                'error': exception.message,
+            },
+        ) from exception
+
+    return ORJSONResponse(
+        content=[AreaNameOutSchema.dump_entity(area_name) for area_name in area_names]
+    )
+
+
+@router.get(
+    path='/autocomplete/',
+    status_code=status.HTTP_200_OK,
+    response_model=list[NameSuggestionOutSchema],
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            'model': ErrorResponseSchema,
+            'description': 'Invalid prefix',
+            'content': {
+                'application/json': {
+                    'example': {
+                        'detail': {
+                            'error': 'Name cannot be empty',
+                        },
+                    },
+                },
+            },
+        },
+    },
+)
+async def autocomplete_names_handler(
+    prefix: str = Query(..., description='Beginning of the name, case-insensitive'),
+    limit: int = Query(default=10, ge=1, le=20, description='Number of names'),
+    mediator: Mediator = Depends(dependency=get_mediator),
+) -> ORJSONResponse:
+    """Complete a prefix with the names that have stored origins.
+
+    Completions come from an in-memory prefix index updated as names are stored,
+    so no query reaches the database; the most requested names come first.
+
+    Args:
+        prefix: The beginning of the name, e.g. "an"
+        limit: Maximum number of names to return (10 by default)
+
+    Returns:
+        List of the names starting with the prefix, empty if there are none
+    """
+    try:
+        suggestions, *_ = await mediator.handle_command(
+            command=GetNameSuggestionsCommand(prefix=prefix, limit=limit),
+        )
+    except (EmptyNameException, NameTooLongException) as exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                'error': exception.message,
+            },
+        ) from exception
+
+    return ORJSONResponse(
+        content=[
+            NameSuggestionOutSchema.dump_entity(suggestion)
+            for suggestion in suggestions
+        ]
+    )
@@ -0,0 +1,153 @@
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastapi import HTTPException, Query, status
+
+from application.v1.name.schemas import NameOriginsOutSchema
+from domain.entities.country import CountryEntity
+from domain.entities.name import NameEntity
+
+
+ORIGIN_FIELDS: dict[str, Callable[[NameEntity], Any]] = {
+    'name': lambda origin: origin.name.as_generic_type(),
+    'count_of_requests': lambda origin: origin.count_of_requests.as_generic_type(),
+    'last_accessed': lambda origin: getattr(origin, 'last_accessed_at', None),
+    'probability': lambda origin: origin.probability.as_generic_type(),
+    'country_code': lambda origin: origin.country.iso_alpha2_code,
+}
+
+COUNTRY_FIELDS: dict[str, Callable[[CountryEntity], Any]] = {
+    'country': lambda country: country.country_name,
+    'region': lambda country: country.region_full,
+    'independent': lambda country: country.independent,
+    'capital': lambda country: country.capital_name,
+    'capital_coordinates': lambda country: country.capital_coordinates,
+    'flag_png': lambda country: country.flag_png,
+    'flag_svg': lambda country: country.flag_svg,
+    'flag_alt': lambda country: country.flag_alt,
+    'coat_of_arms_png': lambda country: country.coat_of_arms_png,
+    'coat_of_arms_svg': lambda country: country.coat_of_arms_svg,
+    'borders': lambda country: country.borders_str,
+}
+
+
+@dataclass
+class ResponseProjection:
+    """Shapes name origins into the fields a caller asked for.
+
+    Without options every origin is serialized in full. With fields, only those
+    fields are kept. In compact mode an origin holds its own fields and
+    country_code, while the country fields are written once per country into
+    countries, which is filled as origins are dumped.
+
+    Attributes:
+        fields: Fields to keep, None for all of them
+        compact: Whether countries are referenced by code
+        countries: Country fields by ISO alpha-2 code, filled in compact mode
+    """
+
+    fields: tuple[str, ...] | None = None
+    compact: bool = False
+    countries: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def dump(self, name_origins: list[NameEntity]) -> list[dict[str, Any]]:
+        """Serialize name origins without validating them.
+
+        Args:
+            name_origins (list[NameEntity]): The origins to serialize.
+
+        Returns:
+            list[dict[str, Any]]: The projected origins.
+        """
+        if not self.compact and self.fields is None:
+            return [NameOriginsOutSchema.dump_entity(origin) for origin in name_origins]
+
+        origin_getters, country_getters = self._getters
+        if not self.compact:
+            return [
+                {
+                    **{key: get(origin) for key, get in origin_getters},
+                    **{key: get(origin.country) for key, get in country_getters},
+                }
+                for origin in name_origins
+            ]
+
+        dumped = []
+        for origin in name_origins:
+            code = origin.country.iso_alpha2_code
+            if code not in self.countries and country_getters:
+                self.countries[code] = {
+                    key: get(origin.country) for key, get in country_getters
+                }
+            dumped.append({key: get(origin) for key, get in origin_getters})
+        return dumped
+
+    def render(self, origins: Any) -> Any:
+        """Returns the response content for the dumped origins.
+
+        In compact mode the origins are wrapped with the country dictionary.
+        """
+        if not self.compact:
+            return origins
+        return {'origins': origins, 'countries': self.countries}
+
+    @property
+    def _getters(
+        self,
+    ) -> tuple[
+        list[tuple[str, Callable[[NameEntity], Any]]],
+        list[tuple[str, Callable[[CountryEntity], Any]]],
+    ]:
+        fields = self.fields
+        if fields is None:
+            fields = tuple(ORIGIN_FIELDS) + tuple(COUNTRY_FIELDS)
+        elif self.compact and 'country_code' not in fields:
+            # Origins cannot point to their country without it
+            fields = (*fields, 'country_code')
+        return (
+            [(key, ORIGIN_FIELDS[key]) for key in fields if key in ORIGIN_FIELDS],
+            [(key, COUNTRY_FIELDS[key]) for key in fields if key in COUNTRY_FIELDS],
+        )
+
+
+def get_response_projection(
+    fields: str | None = Query(
+        default=None,
+        description=(
+            'Comma-separated fields to return, e.g. "name,probability,country_code"; '
+            f'one of: {", ".join([*ORIGIN_FIELDS, *COUNTRY_FIELDS])}'
+        ),
+    ),
+    compact: bool = Query(
+        default=False,
+        description=(
+            'Reference countries by country_code and return each country once '
+            'in a countries dictionary'
+        ),
+    ),
+) -> ResponseProjection:
+    """Returns the projection requested by the fields and compact parameters.
+
+    Raises:
+        HTTPException: If an unknown field is requested.
+    """
+    if fields is None:
+        return ResponseProjection(compact=compact)
+
+    requested = tuple(
+        dict.fromkeys(key.strip() for key in fields.split(',') if key.strip())
+    )
+    unknown = [
+        key
+        for key in requested
+        if key not in ORIGIN_FIELDS and key not in COUNTRY_FIELDS
+    ]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                'error': f'Unknown fields: {", ".join(unknown)}',
+            },
+        )
+    return ResponseProjection(fields=requested, compact=compact)
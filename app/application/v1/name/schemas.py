@@ -1,7 +1,9 @@
 from datetime import datetime
+from typing import Any
+
 from pydantic import BaseModel, Field
 
-from domain.entities.name import NameEntity
+from domain.entities.name import AreaNameEntity, NameEntity, NameSuggestionEntity
 
 
 class CountryOutSchema(BaseModel):
@@ -70,6 +72,33 @@ class NameOriginsOutSchema(BaseModel):
         description="Comma-separated list of bordering country codes, or 'island' if no borders",
     )
 
+    @staticmethod
+    def dump_entity(name_origin: NameEntity) -> dict[str, Any]:
+        """Serialize an entity to the fields of the schema without validating them.
+
+        Entities are valid by construction, so handlers return these dicts in an
+        ORJSONResponse and skip both from_entity and the response_model validation;
+        the schema still documents the response.
+        """
+        country = name_origin.country
+        return {
+            'name': name_origin.name.as_generic_type(),
+            'count_of_requests': name_origin.count_of_requests.as_generic_type(),
+            'last_accessed': getattr(name_origin, 'last_accessed_at', None),
+            'probability': name_origin.probability.as_generic_type(),
+            'country': country.country_name,
+            'region': country.region_full,
+            'independent': country.independent,
+            'capital': country.capital_name,
+            'capital_coordinates': country.capital_coordinates,
+            'flag_png': country.flag_png,
+            'flag_svg': country.flag_svg,
+            'flag_alt': country.flag_alt,
+            'coat_of_arms_png': country.coat_of_arms_png,
+            'coat_of_arms_svg': country.coat_of_arms_svg,
+            'borders': country.borders_str,
+        }
+
     @classmethod
     def from_entity(cls, name_origin: NameEntity) -> 'NameOriginsOutSchema':
         return cls(
@@ -91,3 +120,119 @@ class NameOriginsOutSchema(BaseModel):
             coat_of_arms_svg=name_origin.country.coat_of_arms_svg,
             borders=name_origin.country.borders_str,
         )
+
+
+class CompactNameOriginOutSchema(BaseModel):
+    name: str = Field(..., description='The name being queried')
+    count_of_requests: int = Field(..., description='Number of requests for this name')
+    last_accessed: datetime | None = Field(
+        None, description='Last time the name was accessed'
+    )
+    probability: float = Field(
+        ..., description='Probability of the name being from this country'
+    )
+    country_code: str = Field(
+        ..., description='ISO alpha-2 code of the country, a key of countries'
+    )
+
+
+class CompactCountryOutSchema(BaseModel):
+    country: str = Field(
+        ...,
+        description="Comma-separated list of country code and names (e.g., 'CA,Canada,Canada')",
+    )
+    region: str = Field(
+        ..., description='Region and sub-region in format "Region,Sub-region"'
+    )
+    independent: bool | None = Field(
+        ..., description='Whether the country is independent'
+    )
+    capital: str | None = Field(..., description='Capital city name')
+    capital_coordinates: str = Field(
+        ..., description='Capital coordinates in format "lat,long"'
+    )
+    flag_png: str = Field(..., description='URL to PNG flag image')
+    flag_svg: str = Field(..., description='URL to SVG flag image')
+    flag_alt: str | None = Field(..., description='Alt text for the flag')
+    coat_of_arms_png: str | None = Field(
+        ..., description='URL to PNG coat of arms image'
+    )
+    coat_of_arms_svg: str | None = Field(
+        ..., description='URL to SVG coat of arms image'
+    )
+    borders: str = Field(
+        ...,
+        description="Comma-separated list of bordering country codes, or 'island' if no borders",
+    )
+
+
+class CompactNameOriginsOutSchema(BaseModel):
+    """Name origins referencing their countries by code (compact=true)."""
+
+    origins: list[CompactNameOriginOutSchema] = Field(
+        ..., description='Origins, sorted by probability in descending order'
+    )
+    countries: dict[str, CompactCountryOutSchema] = Field(
+        ..., description='Countries of the origins keyed by ISO alpha-2 code'
+    )
+
+
+class BatchNameOriginsInSchema(BaseModel):
+    names: list[str] = Field(
+        ..., min_length=1, description='Names to get origins for; duplicates are merged'
+    )
+
+
+class BatchNameErrorSchema(BaseModel):
+    status: int = Field(..., description='HTTP status a single lookup would return')
+    error: str = Field(..., description='Why the origins of the name were not found')
+
+
+class BatchNameOriginsOutSchema(BaseModel):
+    results: dict[
+        str, list[NameOriginsOutSchema] | list[CompactNameOriginOutSchema]
+    ] = Field(..., description='Origins keyed by the name as it was sent')
+    errors: dict[str, BatchNameErrorSchema] = Field(
+        ..., description='Errors keyed by the name as it was sent'
+    )
+    countries: dict[str, CompactCountryOutSchema] | None = Field(
+        None, description='Countries of the origins by code, with compact=true'
+    )
+
+
+class AreaNameOutSchema(BaseModel):
+    name: str = Field(..., description='The name')
+    area_type: str = Field(..., description='"region" or "sub_region"')
+    area: str = Field(..., description='Region or sub-region (e.g., "Eastern Europe")')
+    weight: float = Field(
+        ...,
+        description=(
+            'Sum over the countries of the area of probability times '
+            'count_of_requests, the expected number of bearers'
+        ),
+    )
+    countries: int = Field(..., description='Countries of the area with the name')
+
+    @staticmethod
+    def dump_entity(area_name: AreaNameEntity) -> dict[str, Any]:
+        """Serialize an entity to the fields of the schema without validating them."""
+        return {
+            'name': area_name.name,
+            'area_type': area_name.area_type.value,
+            'area': area_name.area,
+            'weight': area_name.weight,
+            'countries': area_name.countries,
+        }
+
+
+class NameSuggestionOutSchema(BaseModel):
+    name: str = Field(..., description='A stored name starting with the prefix')
+    count_of_requests: int = Field(..., description='Number of requests for this name')
+
+    @staticmethod
+    def dump_entity(suggestion: NameSuggestionEntity) -> dict[str, Any]:
+        """Serialize an entity to the fields of the schema without validating them."""
+        return {
+            'name': suggestion.name,
+            'count_of_requests': suggestion.count_of_requests,
+        }
@@ -1,3 +1,4 @@
+import enum
 from dataclasses import (
     dataclass,
     field,
@@ -5,6 +6,13 @@ from dataclasses import (
 from datetime import datetime
 
 
+class AreaType(enum.StrEnum):
+    """Level of the geographic areas countries are grouped in."""
+
+    REGION = 'region'
+    SUB_REGION = 'sub_region'
+
+
 @dataclass(kw_only=True)
 class CountryEntity:
     """Country entity for country-related data.
@@ -23,7 +31,8 @@ class CountryEntity:
         flag_alt: Alternative text description of the flag (optional)
         coat_of_arms_png: URL to the country's coat of arms in PNG format (optional)
         coat_of_arms_svg: URL to the country's coat of arms in SVG format (optional)
-        borders: Set of ISO alpha-2 codes representing bordering countries (e.g., {'US', 'CA'}), it could be island
+        borders: Set of ISO alpha-3 codes representing bordering countries (e.g., {'USA', 'MEX'}), it could be island
+        iso_alpha3_code: ISO 3166-1 alpha-3 country code (e.g., 'CAN'), the one borders refer to, it could be None
         created_at: Timestamp of entity creation
         updated_at: Timestamp of entity update
     """
@@ -47,6 +56,7 @@ class CountryEntity:
     borders: set[str] = field(
         default_factory=set,
     )
+    iso_alpha3_code: str | None = None
     created_at: datetime = field(
         default_factory=datetime.now,
     )
@@ -92,6 +102,11 @@ class CountryEntity:
         """
         return f'{self.region},{self.sub_region}'
 
+    def area(self, area_type: AreaType) -> str | None:
+        """Returns the region or sub-region of the country, None if it has none."""
+        area = self.region if area_type == AreaType.REGION else self.sub_region
+        return area or None
+
     @property
     def borders_str(self) -> str:
         """Returns all bordering countries combined into a single string.
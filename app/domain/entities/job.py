@@ -0,0 +1,53 @@
+import enum
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from uuid_utils import uuid7
+
+
+class JobStatus(enum.StrEnum):
+    PENDING = 'pending'
+    RUNNING = 'running'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+
+
+@dataclass(kw_only=True)
+class JobEntity:
+    """Bulk enrichment job resolving the origins of the names of an uploaded file.
+
+    The names are processed in chunks; after each chunk the job is checkpointed,
+    so a restarted job resumes after the last finished chunk.
+
+    Attributes:
+        id: Unique identifier using UUID-7
+        status: Where the job is in its lifecycle
+        total_names: Names in the uploaded file
+        processed_names: Names whose results are written, the resume point
+        failed_names: Processed names that could not be resolved
+        results_offset: Size in bytes of the results file at the last checkpoint
+        error: Why the job failed, if it did
+        created_at: Timestamp of job creation
+        updated_at: Timestamp of the last checkpoint
+    """
+
+    id: str = field(default_factory=lambda: str(uuid7()))
+    status: JobStatus = JobStatus.PENDING
+    total_names: int
+    processed_names: int = 0
+    failed_names: int = 0
+    results_offset: int = 0
+    error: str | None = None
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (JobStatus.COMPLETED, JobStatus.FAILED)
+
+    @property
+    def progress(self) -> float:
+        """Returns the share of the names that are processed, from 0 to 1."""
+        if not self.total_names:
+            return 1.0 if self.finished else 0.0
+        return self.processed_names / self.total_names
@@ -1,7 +1,8 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from uuid_utils import UUID, uuid7
-from domain.entities.country import CountryEntity
+from domain.entities.country import AreaType, CountryEntity
+from domain.values.cursor import PageCursor
 from domain.values.name import CountOfRequests, Name, Probability
 
 
@@ -77,3 +78,53 @@ class NameStrEntity(BaseNameEntity):
     country_name: str = field(
         kw_only=True,
     )
+
+
+@dataclass
+class NamesPageEntity:
+    """A page of name origins ordered by probability in descending order.
+
+    Attributes:
+        names: The name origins of the page
+        next_cursor: Cursor of the next page, None when this is the last page
+    """
+
+    names: list[NameEntity] = field(
+        default_factory=list,
+    )
+    next_cursor: PageCursor | None = None
+
+
+@dataclass
+class AreaNameEntity:
+    """Popularity of a name across the countries of a region or sub-region.
+
+    Attributes:
+        area_type: Whether area is a region or a sub-region
+        area: Name of the region or sub-region (e.g., 'Eastern Europe')
+        name: The name as it was stored
+        weight: Sum over the countries of the area of the probability of the name
+            times its count of requests, i.e. its expected number of bearers
+        countries: Countries of the area the name is found in
+    """
+
+    area_type: AreaType
+    area: str
+    name: str
+    weight: float
+    countries: int
+
+
+@dataclass
+class NameSuggestionEntity:
+    """A name with stored origins, offered as a completion of a prefix.
+
+    Attributes:
+        key: Canonical form of the name
+        name: The name as it was stored
+        count_of_requests: Number of requests for the name
+    """
+
+    key: str
+    name: str
+    count_of_requests: int
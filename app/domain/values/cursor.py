@@ -0,0 +1,64 @@
+import base64
+import binascii
+from dataclasses import dataclass
+from domain.exceptions.cursor import InvalidCursorException
+from domain.values.base import BaseValueObject
+
+
+@dataclass(frozen=True)
+class PageCursor(BaseValueObject[str]):
+    """Opaque keyset cursor over (probability, row id) ordered result sets.
+
+    The cursor points at the last row of a page; the next page starts with the rows
+    ordered strictly after it.
+
+    Attributes:
+        value: The URL-safe encoded cursor
+    """
+
+    value: str
+
+    def validate(self) -> None:
+        """Validate that the cursor can be decoded."""
+        self._decode()
+
+    def as_generic_type(self) -> str:
+        """Convert the cursor to a string.
+
+        Returns:
+            str: The encoded cursor
+        """
+        return str(self.value)
+
+    @classmethod
+    def from_position(cls, probability: float, row_id: int) -> 'PageCursor':
+        """Build a cursor pointing at the given row.
+
+        Args:
+            probability (float): Probability of the last row of the page
+            row_id (int): Storage id of the last row of the page
+
+        Returns:
+            PageCursor: The encoded cursor
+        """
+        raw = f'{probability!r}:{row_id}'.encode()
+        return cls(value=base64.urlsafe_b64encode(raw).decode().rstrip('='))
+
+    @property
+    def probability(self) -> float:
+        """Returns the probability of the row the cursor points at."""
+        return self._decode()[0]
+
+    @property
+    def row_id(self) -> int:
+        """Returns the storage id of the row the cursor points at."""
+        return self._decode()[1]
+
+    def _decode(self) -> tuple[float, int]:
+        try:
+            padded = self.value + '=' * (-len(self.value) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode()).decode()
+            probability, row_id = raw.split(':')
+            return float(probability), int(row_id)
+        except (binascii.Error, UnicodeError, ValueError) as exception:
+            raise InvalidCursorException(cursor=self.value) from exception
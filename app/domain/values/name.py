@@ -1,3 +1,4 @@
+import unicodedata
 from dataclasses import dataclass
 from domain.exceptions.name import (
     EmptyNameException,
@@ -23,7 +24,7 @@ class Name(BaseValueObject[str]):
         if not self.value or not self.value.strip():
             raise EmptyNameException()
 
-        if len(self.value) > 100:
+        if len(self.value) > 100 or len(self.canonical) > 100:
             raise NameTooLongException(text=self.value, max_length=100)
 
     def as_generic_type(self) -> str:
@@ -33,6 +34,19 @@ class Name(BaseValueObject[str]):
         """
         return str(object=self.value)
 
+    @property
+    def canonical(self) -> str:
+        """Returns the canonical lookup key of the name.
+
+        The key is NFKC-normalized, case-folded and trimmed, so "Anna", " anna" and
+        NFD-decomposed variants of the same name share one key.
+
+        Returns:
+            str: The canonical form of the name
+        """
+        folded = unicodedata.normalize('NFKC', self.value).casefold()
+        return unicodedata.normalize('NFKC', folded).strip()
+
 
 @dataclass(frozen=True)
 class Probability(BaseValueObject[float]):
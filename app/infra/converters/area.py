@@ -0,0 +1,49 @@
+from datetime import datetime
+
+from domain.entities.country import AreaType
+from domain.entities.name import AreaNameEntity
+from domain.values.name import Name
+from infra.converters.base import BaseConverter
+from infra.models.area import NameAreaPopularityModel
+
+
+class AreaNameConverter(BaseConverter[NameAreaPopularityModel, AreaNameEntity]):
+    """Converter between NameAreaPopularityModel and AreaNameEntity."""
+
+    @classmethod
+    def to_entity(cls, model: NameAreaPopularityModel) -> AreaNameEntity:
+        """Convert NameAreaPopularityModel to AreaNameEntity.
+
+        Args:
+            model (NameAreaPopularityModel): The rollup row to convert.
+
+        Returns:
+            AreaNameEntity: The converted domain entity.
+        """
+        return AreaNameEntity(
+            area_type=AreaType(model.area_type),
+            area=model.area,
+            name=model.name,
+            weight=model.weight,
+            countries=model.countries,
+        )
+
+    @classmethod
+    def to_model(cls, entity: AreaNameEntity) -> NameAreaPopularityModel:
+        """Convert AreaNameEntity to NameAreaPopularityModel.
+
+        Args:
+            entity (AreaNameEntity): The domain entity to convert.
+
+        Returns:
+            NameAreaPopularityModel: The converted rollup row.
+        """
+        return NameAreaPopularityModel(
+            area_type=entity.area_type.value,
+            area=entity.area,
+            name_key=Name(value=entity.name).canonical,
+            name=entity.name,
+            weight=entity.weight,
+            countries=entity.countries,
+            updated_at=datetime.now(),
+        )
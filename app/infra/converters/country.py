@@ -32,6 +32,7 @@ class CountryConverter(BaseConverter[CountryModel, CountryEntity]):
             coat_of_arms_png=model.coat_of_arms_png,
             coat_of_arms_svg=model.coat_of_arms_svg,
             borders=set(model.borders.split(',')) if model.borders else set(),
+            iso_alpha3_code=model.iso_alpha3_code,
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
@@ -62,6 +63,7 @@ class CountryConverter(BaseConverter[CountryModel, CountryEntity]):
             coat_of_arms_png=entity.coat_of_arms_png,
             coat_of_arms_svg=entity.coat_of_arms_svg,
             borders=','.join(sorted(entity.borders)) if entity.borders else None,
+            iso_alpha3_code=entity.iso_alpha3_code,
             created_at=entity.created_at,
             updated_at=entity.updated_at,
         )
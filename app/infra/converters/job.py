@@ -0,0 +1,51 @@
+from domain.entities.job import JobEntity, JobStatus
+from infra.converters.base import BaseConverter
+from infra.models.job import JobModel
+
+
+class JobConverter(BaseConverter[JobModel, JobEntity]):
+    """Converter for transforming between JobModel and JobEntity."""
+
+    @classmethod
+    def to_entity(cls, model: JobModel) -> JobEntity:
+        """Convert JobModel to JobEntity.
+
+        Args:
+            model (JobModel): The SQLAlchemy model instance to convert.
+
+        Returns:
+            JobEntity: The converted domain entity.
+        """
+        return JobEntity(
+            id=model.id,
+            status=JobStatus(model.status),
+            total_names=model.total_names,
+            processed_names=model.processed_names,
+            failed_names=model.failed_names,
+            results_offset=model.results_offset,
+            error=model.error,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+        )
+
+    @classmethod
+    def to_model(cls, entity: JobEntity) -> JobModel:
+        """Convert JobEntity to JobModel.
+
+        Args:
+            entity (JobEntity): The domain entity to convert.
+
+        Returns:
+            JobModel: The converted SQLAlchemy model.
+        """
+        return JobModel(
+            id=entity.id,
+            status=entity.status.value,
+            total_names=entity.total_names,
+            processed_names=entity.processed_names,
+            failed_names=entity.failed_names,
+            results_offset=entity.results_offset,
+            error=entity.error,
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
+        )
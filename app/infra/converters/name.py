@@ -40,6 +40,7 @@ class NameConverter(BaseConverter[NameOriginModel, NameEntity]):
         """
         return NameOriginModel(
             name=entity.name.as_generic_type(),
+            name_key=entity.name.canonical,
             probability=entity.probability.as_generic_type(),
             count_of_requests=entity.count_of_requests.as_generic_type(),
             country_code=entity.country.iso_alpha2_code,
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+from infra.exceptions.base import InfraException
+
+
+@dataclass(eq=False)
+class JobInputTooLargeException(InfraException):
+    max_bytes: int
+
+    @property
+    def message(self) -> str:
+        return f'Uploaded names exceed {self.max_bytes} bytes'
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+from infra.exceptions.base import InfraException
+
+
+@dataclass(eq=False)
+class SnapshotVersionException(InfraException):
+    path: str
+    version: int | None
+
+    @property
+    def message(self) -> str:
+        return f'Snapshot "{self.path}" has unsupported version {self.version}'
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+from infra.exceptions.base import InfraException
+
+
+@dataclass(eq=False)
+class UpstreamUnavailableException(InfraException):
+    upstream: str
+    retry_after: float | None = None
+
+    @property
+    def message(self) -> str:
+        return f'Upstream API "{self.upstream}" is unavailable'
+
+
+@dataclass(eq=False)
+class UpstreamQuotaExhaustedException(UpstreamUnavailableException):
+    @property
+    def message(self) -> str:
+        return f'Quota of upstream API "{self.upstream}" is exhausted'
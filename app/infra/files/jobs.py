@@ -0,0 +1,128 @@
+import asyncio
+import itertools
+import os
+from collections.abc import AsyncIterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from infra.exceptions.jobs import JobInputTooLargeException
+from utils.shared_state import HostLock
+
+
+@dataclass
+class JobFileStore:
+    """Input and result files of the bulk enrichment jobs.
+
+    The input of a job holds one name per line. Its results are NDJSON, one line
+    per name, appended chunk by chunk; the size of the file after a chunk is the
+    checkpoint a resumed job truncates it back to, so a chunk that was written but
+    not checkpointed is written again instead of twice.
+
+    Writes and fsyncs run in a worker thread, so a slow disk never stalls the
+    event loop.
+
+    Attributes:
+        directory: Directory of the files
+        write_block_size: Bytes of an upload buffered before they are written
+    """
+
+    directory: Path
+    write_block_size: int = 64 * 1024
+
+    def input_path(self, job_id: str) -> Path:
+        return self.directory / f'{job_id}.input'
+
+    def results_path(self, job_id: str) -> Path:
+        return self.directory / f'{job_id}.ndjson'
+
+    def lock(self, job_id: str) -> HostLock:
+        """Returns the lock held by the worker processing the job."""
+        return HostLock(path=self.directory / f'{job_id}.lock')
+
+    async def write_input(
+        self, job_id: str, names: AsyncIterable[str], max_bytes: int
+    ) -> int:
+        """Write the names of a job as they arrive.
+
+        Args:
+            job_id (str): The id of the job.
+            names (AsyncIterable[str]): The names, without line breaks.
+            max_bytes (int): Largest size of the input file.
+
+        Returns:
+            int: The number of names written.
+
+        Raises:
+            JobInputTooLargeException: If the names exceed max_bytes; nothing is
+                kept then.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.input_path(job_id)
+        count = size = 0
+        block = bytearray()
+        try:
+            with open(path, 'wb') as file:
+                async for name in names:
+                    line = name.encode() + b'\n'
+                    size += len(line)
+                    if size > max_bytes:
+                        raise JobInputTooLargeException(max_bytes=max_bytes)
+                    block += line
+                    count += 1
+                    if len(block) >= self.write_block_size:
+                        await asyncio.to_thread(file.write, bytes(block))
+                        block.clear()
+                await asyncio.to_thread(file.write, bytes(block))
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+        return count
+
+    def iter_input(self, job_id: str, start: int = 0) -> Iterator[str]:
+        """Read the names of a job, skipping the first start of them."""
+        with open(self.input_path(job_id), 'rb') as file:
+            for line in itertools.islice(file, start, None):
+                yield line.rstrip(b'\n').decode(errors='replace')
+
+    @contextmanager
+    def open_results(self, job_id: str, offset: int) -> Iterator[BinaryIO]:
+        """Open the results of a job for appending after its last checkpoint.
+
+        Args:
+            job_id (str): The id of the job.
+            offset (int): Size of the results file at the last checkpoint.
+
+        Yields:
+            BinaryIO: The results file, positioned at offset.
+        """
+        path = self.results_path(job_id)
+        with open(path, 'r+b' if path.exists() else 'w+b') as file:
+            file.truncate(offset)
+            file.seek(offset)
+            yield file
+
+    @staticmethod
+    async def append(file: BinaryIO, data: bytes) -> int:
+        """Append results and make them durable before they are checkpointed.
+
+        Args:
+            file (BinaryIO): The results file, from open_results.
+            data (bytes): The result lines of a chunk.
+
+        Returns:
+            int: The size of the results file, the next checkpoint.
+        """
+
+        def write() -> int:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+            return file.tell()
+
+        return await asyncio.to_thread(write)
+
+    def delete(self, job_id: str) -> None:
+        for path in (self.input_path(job_id), self.results_path(job_id)):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,209 @@
+import asyncio
+import importlib.util
+import logging
+import time
+from collections.abc import (
+    Awaitable,
+    Callable,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import Any
+
+import httpx
+
+from utils.deadline import remaining
+
+
+logger = logging.getLogger(__name__)
+
+NATIONALIZE = 'nationalize'
+REST_COUNTRIES = 'rest_countries'
+
+
+@dataclass(kw_only=True)
+class UpstreamClientSettings:
+    """Connection settings of the shared client of one upstream API.
+
+    Attributes:
+        base_url: Base URL of the upstream API, also used to pre-warm connections
+        timeout: Total timeout of a request in seconds
+        connect_timeout: Timeout of establishing a connection in seconds
+        max_connections: Maximum number of open connections
+        max_keepalive_connections: Maximum number of idle connections kept alive
+        keepalive_expiry: Seconds an idle connection is kept alive
+        http2: Whether to negotiate HTTP/2 (needs the `h2` package)
+        warmup_connections: Connections opened to the upstream at startup
+        on_response: Called with every response, e.g. to read rate-limit headers
+    """
+
+    base_url: str
+    timeout: float = 5.0
+    connect_timeout: float = 2.0
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = True
+    warmup_connections: int = 1
+    on_response: Callable[[httpx.Response], Awaitable[None]] | None = None
+
+
+@dataclass
+class UpstreamMetrics:
+    """Request metrics of one upstream API."""
+
+    requests: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    total_latency: float = 0.0
+    http2_responses: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'in_flight': self.in_flight,
+            'average_latency_ms': (
+                round(self.total_latency / self.requests * 1000, 3)
+                if self.requests
+                else 0.0
+            ),
+            'http2_responses': self.http2_responses,
+        }
+
+
+@dataclass
+class MeteredTransport(httpx.AsyncBaseTransport):
+    """Transport recording request metrics of an upstream API."""
+
+    transport: httpx.AsyncHTTPTransport
+    metrics: UpstreamMetrics
+    on_response: Callable[[httpx.Response], Awaitable[None]] | None = None
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.metrics.requests += 1
+        self.metrics.in_flight += 1
+        started_at = time.perf_counter()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except Exception:
+            self.metrics.errors += 1
+            raise
+        finally:
+            self.metrics.in_flight -= 1
+            self.metrics.total_latency += time.perf_counter() - started_at
+
+        if response.status_code >= 500:
+            self.metrics.errors += 1
+        if response.http_version == 'HTTP/2':
+            self.metrics.http2_responses += 1
+        if self.on_response is not None:
+            await self.on_response(response)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+@dataclass
+class HTTPClientRegistry:
+    """Registry of the shared, tuned httpx clients of the upstream APIs.
+
+    The FastAPI lifespan pre-warms the clients at startup and closes them on
+    shutdown; a client that was closed is recreated on next use.
+    """
+
+    settings: dict[str, UpstreamClientSettings]
+    _clients: dict[str, httpx.AsyncClient] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _metrics: dict[str, UpstreamMetrics] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def get_client(self, upstream: str) -> httpx.AsyncClient:
+        """Get the shared client of an upstream API.
+
+        Args:
+            upstream (str): Name of the upstream API.
+
+        Returns:
+            httpx.AsyncClient: The shared client of the upstream.
+        """
+        client = self._clients.get(upstream)
+        if client is None or client.is_closed:
+            client = self._clients[upstream] = self._create_client(upstream)
+        return client
+
+    def timeout(self, upstream: str) -> httpx.Timeout:
+        """Get the timeout of a request, capped by the deadline of the current request.
+
+        Args:
+            upstream (str): Name of the upstream API.
+
+        Returns:
+            httpx.Timeout: Timeout to pass to the request.
+        """
+        settings = self.settings[upstream]
+        return httpx.Timeout(
+            remaining(settings.timeout),
+            connect=remaining(settings.connect_timeout),
+        )
+
+    async def warm_up(self) -> None:
+        """Open connections to every upstream before the first request needs them."""
+
+        async def open_connection(upstream: str) -> None:
+            try:
+                await self.get_client(upstream).head(self.settings[upstream].base_url)
+            except httpx.HTTPError as exception:
+                logger.warning('Could not pre-warm %s: %r', upstream, exception)
+
+        await asyncio.gather(
+            *(
+                open_connection(upstream)
+                for upstream, settings in self.settings.items()
+                for _ in range(settings.warmup_connections)
+            )
+        )
+
+    async def aclose(self) -> None:
+        """Close the clients of all upstreams."""
+        clients, self._clients = self._clients, {}
+        await asyncio.gather(*(client.aclose() for client in clients.values()))
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        """Returns the request metrics of every upstream."""
+        return {
+            upstream: self._metrics.setdefault(upstream, UpstreamMetrics()).as_dict()
+            for upstream in self.settings
+        }
+
+    def _create_client(self, upstream: str) -> httpx.AsyncClient:
+        settings = self.settings[upstream]
+        http2 = settings.http2
+        if http2 and importlib.util.find_spec('h2') is None:
+            logger.warning(
+                'HTTP/2 is enabled for %s but the h2 package is not installed; '
+                'using HTTP/1.1',
+                upstream,
+            )
+            http2 = False
+        transport = httpx.AsyncHTTPTransport(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive_connections,
+                keepalive_expiry=settings.keepalive_expiry,
+            ),
+        )
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.timeout, connect=settings.connect_timeout),
+            transport=MeteredTransport(
+                transport=transport,
+                metrics=self._metrics.setdefault(upstream, UpstreamMetrics()),
+                on_response=settings.on_response,
+            ),
+        )
@@ -0,0 +1,47 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from domain.entities.country import AreaType, CountryEntity
+
+
+@dataclass
+class CountryCatalog:
+    """Process-local catalog of the countries, read without a database round trip.
+
+    It is seeded at startup and filled with every country loaded afterwards; there
+    are only ~250 countries, so all of them fit in memory. ``revision`` is the
+    country refresh revision the catalog reflects.
+    """
+
+    revision: int = 0
+    _countries: dict[str, CountryEntity] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __len__(self) -> int:
+        return len(self._countries)
+
+    def load(self, countries: Iterable[CountryEntity]) -> None:
+        self._countries.update(
+            (country.iso_alpha2_code, country) for country in countries
+        )
+
+    def codes(self) -> list[str]:
+        return list(self._countries)
+
+    def get(self, code: str) -> CountryEntity | None:
+        return self._countries.get(code)
+
+    def get_many(self, codes: Iterable[str]) -> dict[str, CountryEntity]:
+        return {
+            code: self._countries[code] for code in codes if code in self._countries
+        }
+
+    def find_area(self, area_type: AreaType, area: str) -> str | None:
+        """Returns the stored spelling of a region or sub-region, ignoring case."""
+        wanted = area.strip().casefold()
+        for country in self._countries.values():
+            stored = country.area(area_type)
+            if stored and stored.casefold() == wanted:
+                return stored
+        return None
@@ -0,0 +1,147 @@
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from domain.entities.country import CountryEntity
+
+
+@dataclass
+class CountryGraph:
+    """Process-local graph of the land borders between countries.
+
+    Countries are numbered by their ISO alpha-2 code and each one keeps a sorted
+    tuple with the numbers of its neighbours, so traversals are breadth-first
+    searches over integers. Borders are listed by alpha-3 code; those of a country
+    whose alpha-3 code is not known are left out, and a border listed by only one
+    of the two countries is added to both.
+    """
+
+    _codes: list[str] = field(default_factory=list, init=False, repr=False)
+    _index: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _adjacency: list[tuple[int, ...]] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _unknown_borders: frozenset[str] = field(
+        default_factory=frozenset, init=False, repr=False
+    )
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __contains__(self, code: str) -> bool:
+        return code in self._index
+
+    @property
+    def unknown_borders(self) -> frozenset[str]:
+        """Returns the alpha-3 codes of borders leading to no country of a graph
+        built from an incomplete list; a missing land path may be a missing country.
+        """
+        return self._unknown_borders
+
+    def build(self, countries: Iterable[CountryEntity], complete: bool = True) -> None:
+        """Replace the graph with the borders of the given countries.
+
+        Args:
+            countries (Iterable[CountryEntity]): The countries of the graph.
+            complete (bool): Whether these are all countries, each with its
+                alpha-3 code; if not, borders leading to none are kept in
+                unknown_borders.
+        """
+        by_code = {country.iso_alpha2_code: country for country in countries}
+        codes = sorted(by_code)
+        index = {code: number for number, code in enumerate(codes)}
+        alpha3_index = {
+            by_code[code].iso_alpha3_code: number
+            for number, code in enumerate(codes)
+            if by_code[code].iso_alpha3_code
+        }
+
+        neighbours: list[set[int]] = [set() for _ in codes]
+        unknown_borders: set[str] = set()
+        for number, code in enumerate(codes):
+            for border in by_code[code].borders:
+                other = alpha3_index.get(border)
+                if other is None:
+                    unknown_borders.add(border)
+                elif other != number:
+                    neighbours[number].add(other)
+                    neighbours[other].add(number)
+
+        # Swapped in at once, so a concurrent lookup never sees a partial graph
+        self._codes, self._index, self._adjacency, self._unknown_borders = (
+            codes,
+            index,
+            [tuple(sorted(numbers)) for numbers in neighbours],
+            frozenset() if complete else frozenset(unknown_borders),
+        )
+
+    def neighbors(self, code: str, hops: int = 1) -> list[list[str]]:
+        """Returns the countries up to a number of land borders away.
+
+        Args:
+            code (str): ISO alpha-2 code of the country.
+            hops (int): Most borders crossed.
+
+        Returns:
+            list[list[str]]: The codes of the countries first reached after one,
+                two, ... borders; the levels stop at the first empty one. Empty if
+                the country is not in the graph.
+        """
+        start = self._index.get(code)
+        if start is None:
+            return []
+
+        codes, adjacency = self._codes, self._adjacency
+        seen = {start}
+        level = [start]
+        levels: list[list[str]] = []
+        for _ in range(hops):
+            reached = []
+            for number in level:
+                for other in adjacency[number]:
+                    if other not in seen:
+                        seen.add(other)
+                        reached.append(other)
+            if not reached:
+                break
+            levels.append(sorted(codes[number] for number in reached))
+            level = reached
+        return levels
+
+    def path(self, source: str, target: str) -> list[str] | None:
+        """Returns a shortest land path between two countries.
+
+        Args:
+            source (str): ISO alpha-2 code of the first country.
+            target (str): ISO alpha-2 code of the last country.
+
+        Returns:
+            list[str] | None: The codes of the countries crossed, source and target
+                included; None if either is not in the graph or no land path joins
+                them.
+        """
+        index = self._index
+        if source not in index or target not in index:
+            return None
+
+        codes, adjacency = self._codes, self._adjacency
+        start, goal = index[source], index[target]
+        parents = [-1] * len(codes)
+        parents[start] = start
+        queue = deque([start])
+        while queue and parents[goal] == -1:
+            number = queue.popleft()
+            for other in adjacency[number]:
+                if parents[other] == -1:
+                    parents[other] = number
+                    queue.append(other)
+
+        if parents[goal] == -1:
+            return None
+        path = [goal]
+        while path[-1] != start:
+            path.append(parents[path[-1]])
+        return [codes[number] for number in reversed(path)]
@@ -0,0 +1,87 @@
+import heapq
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+
+
+@dataclass
+class HotNameTracker:
+    """Process-local popularity of the looked up names, with their expiry.
+
+    Names are tracked by canonical key; the last display form is kept to refresh
+    the name with.
+
+    Scores decay with the given half-life, so names that stop being requested cool
+    down; only the capacity highest-scored names are kept.
+
+    Attributes:
+        capacity: Names kept in the tracker
+        half_life: Seconds after which a score is halved
+    """
+
+    capacity: int = 1000
+    half_life: float = 3600.0
+    _scores: dict[str, float] = field(default_factory=dict, init=False, repr=False)
+    _entries: dict[str, tuple[str, datetime]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _decayed_at: float = field(default_factory=time.monotonic, init=False, repr=False)
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def record(self, key: str, name: str, expires_at: datetime) -> None:
+        """Count a lookup of a name.
+
+        Args:
+            key (str): Canonical key of the name.
+            name (str): Display form of the name.
+            expires_at (datetime): When the stored origins of the name go stale.
+        """
+        self._scores[key] = self._scores.get(key, 0.0) + 1.0
+        self._entries[key] = (name, expires_at)
+        if len(self._scores) > 2 * self.capacity:
+            self._prune()
+
+    def expires_at(self, key: str) -> datetime | None:
+        """Returns when the stored origins of a tracked name go stale."""
+        entry = self._entries.get(key)
+        return entry[1] if entry else None
+
+    def forget(self, key: str) -> None:
+        self._scores.pop(key, None)
+        self._entries.pop(key, None)
+
+    def due(self, top: int, before: datetime) -> list[tuple[str, str]]:
+        """Returns the hottest names expiring before the given time, soonest first.
+
+        Args:
+            top (int): How many of the hottest names to consider.
+            before (datetime): Names expiring later are not due.
+
+        Returns:
+            list[tuple[str, str]]: The canonical key and display form of the names.
+        """
+        hottest = heapq.nlargest(top, self._scores, key=self._scores.__getitem__)
+        due = sorted(
+            (key for key in hottest if self._entries[key][1] <= before),
+            key=lambda key: self._entries[key][1],
+        )
+        return [(key, self._entries[key][0]) for key in due]
+
+    def decay(self) -> None:
+        """Decay the scores by the time elapsed since the previous decay."""
+        now = time.monotonic()
+        factor = 0.5 ** ((now - self._decayed_at) / self.half_life)
+        self._decayed_at = now
+        self._scores = {
+            key: score * factor
+            for key, score in self._scores.items()
+            if score * factor >= 0.01
+        }
+        self._entries = {key: self._entries[key] for key in self._scores}
+
+    def _prune(self) -> None:
+        kept = heapq.nlargest(self.capacity, self._scores, key=self._scores.__getitem__)
+        self._scores = {key: self._scores[key] for key in kept}
+        self._entries = {key: self._entries[key] for key in kept}
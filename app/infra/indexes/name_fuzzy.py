@@ -0,0 +1,188 @@
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from domain.entities.name import NameSuggestionEntity
+
+
+# Marks the start and the end of a key, so its first and last letters form bigrams
+_START, _END = '\x02', '\x03'
+
+
+def transposition_distance(left: str, right: str, bound: int | None = None) -> int:
+    """Returns the edit distance counting a swap of adjacent characters as one edit
+    (optimal string alignment), so "micheal" is one edit away from "michael".
+
+    Args:
+        left (str): The first string.
+        right (str): The second string.
+        bound (int | None): Largest distance of interest; past it, bound + 1 is
+            returned as soon as it is known.
+    """
+    if bound is None:
+        bound = max(len(left), len(right))
+    elif abs(len(left) - len(right)) > bound:
+        return bound + 1
+
+    # Only cells within bound of the diagonal can stay within bound; the others
+    # are left at bound + 1
+    over = bound + 1
+    before: list[int] = []
+    previous = [j if j <= bound else over for j in range(len(right) + 1)]
+    for i, left_char in enumerate(left, start=1):
+        current = [i if i <= bound else over] + [over] * len(right)
+        lowest = current[0]
+        for j in range(max(1, i - bound), min(len(right), i + bound) + 1):
+            right_char = right[j - 1]
+            distance = previous[j - 1] + (left_char != right_char)
+            if current[j - 1] + 1 < distance:
+                distance = current[j - 1] + 1
+            if previous[j] + 1 < distance:
+                distance = previous[j] + 1
+            if (
+                i > 1
+                and j > 1
+                and left_char == right[j - 2]
+                and left[i - 2] == right_char
+                and before[j - 2] + 1 < distance
+            ):
+                distance = before[j - 2] + 1
+            current[j] = distance
+            if distance < lowest:
+                lowest = distance
+        # No later row can get below the lowest distance of this one
+        if lowest > bound:
+            return over
+        before, previous = previous, current
+    return min(previous[-1], over)
+
+
+def _bigrams(key: str) -> list[str]:
+    """Returns the bigrams of a key, by position."""
+    padded = f'{_START}{key}{_END}'
+    return [padded[i : i + 2] for i in range(len(padded) - 1)]
+
+
+@dataclass
+class NameFuzzyTables:
+    """The entries of a NameFuzzyIndex, built apart from the index and swapped in."""
+
+    # Canonical key -> (display form, count of requests)
+    names: dict[str, tuple[str, int]] = field(default_factory=dict)
+    # (bigram, its position, length of the key) -> keys with the bigram there
+    postings: dict[tuple[str, int, int], list[str]] = field(default_factory=dict)
+
+    def add(self, key: str, name: str, count_of_requests: int) -> None:
+        indexed = key in self.names
+        # Set before the key is posted, so a lookup in a worker thread never finds
+        # a key without its entry
+        self.names[key] = (name, count_of_requests)
+        if not indexed:
+            for position, bigram in enumerate(_bigrams(key)):
+                self.postings.setdefault((bigram, position, len(key)), []).append(key)
+
+
+@dataclass
+class NameFuzzyIndex:
+    """Process-local index of the names with stored origins, for near misses.
+
+    Keys are listed under each of their bigrams, its position and their length.
+    With k typos allowed, a bigram of the name that no typo touched is found in a
+    close name at most k positions away, and a typo touches at most three bigrams
+    (a swap). A lookup so counts, for each bigram of the name, the keys of a
+    length within k having it within k positions, and computes the edit distance
+    only of the keys found for all but 3k of the bigrams.
+    Names of up to short_name_length characters allow one typo, longer ones
+    max_distance; a swapped pair of letters counts as one typo.
+
+    Lookups and rebuilds are CPU-bound, so callers run them in a worker thread:
+    a lookup only reads, and a rebuild prepares new tables that install swaps in.
+
+    Attributes:
+        max_distance: Typos allowed in a name longer than short_name_length
+        short_name_length: Longest name allowed only one typo
+    """
+
+    max_distance: int = 2
+    short_name_length: int = 5
+    _tables: NameFuzzyTables = field(
+        default_factory=NameFuzzyTables, init=False, repr=False
+    )
+
+    def __len__(self) -> int:
+        return len(self._tables.names)
+
+    def put(self, key: str, name: str, count_of_requests: int) -> None:
+        """Index a name, or update the display form and count of an indexed one."""
+        self._tables.add(key, name, count_of_requests)
+
+    @staticmethod
+    def prepare(names: Iterable[NameSuggestionEntity]) -> NameFuzzyTables:
+        """Build the tables of the names of the database, without touching the
+        index; safe to run in a worker thread."""
+        tables = NameFuzzyTables()
+        for name in names:
+            tables.add(name.key, name.name, name.count_of_requests)
+        return tables
+
+    def install(self, tables: NameFuzzyTables) -> None:
+        """Swap in prepared tables.
+
+        Stored names are never deleted, so names put since the tables were
+        prepared are carried over.
+        """
+        current = self._tables
+        for key in current.names.keys() - tables.names.keys():
+            tables.add(key, *current.names[key])
+        self._tables = tables
+
+    def load(self, names: Iterable[NameSuggestionEntity]) -> None:
+        """Index the names of the database; names indexed already are kept."""
+        self.install(self.prepare(names))
+
+    def closest(self, key: str) -> NameSuggestionEntity | None:
+        """Returns the indexed name closest to a name that is not indexed.
+
+        Names sharing no bigram with the name, which only happens for names of
+        one or two letters, are not considered.
+
+        Args:
+            key (str): Canonical form of the name.
+
+        Returns:
+            NameSuggestionEntity | None: The name with the fewest typos, the most
+                requested one on ties; None if none is close enough.
+        """
+        tables = self._tables
+        allowed = 1 if len(key) <= self.short_name_length else self.max_distance
+        bigrams = _bigrams(key)
+
+        lengths = range(max(1, len(key) - allowed), len(key) + allowed + 1)
+        shared: Counter[str] = Counter()
+        for position, bigram in enumerate(bigrams):
+            found: set[str] = set()
+            for shift in range(-allowed, allowed + 1):
+                for length in lengths:
+                    postings = tables.postings.get((bigram, position + shift, length))
+                    if postings:
+                        found.update(postings)
+            shared.update(found)
+
+        required = max(1, len(bigrams) - 3 * allowed)
+        best: tuple[int, int, str] | None = None
+        for candidate, count in shared.items():
+            if count < required or candidate == key:
+                continue
+            distance = transposition_distance(key, candidate, bound=allowed)
+            if distance > allowed:
+                continue
+            rank = (distance, -tables.names[candidate][1], candidate)
+            if best is None or rank < best:
+                best = rank
+
+        if best is None:
+            return None
+        name, count_of_requests = tables.names[best[2]]
+        return NameSuggestionEntity(
+            key=best[2], name=name, count_of_requests=count_of_requests
+        )
@@ -0,0 +1,94 @@
+import bisect
+import heapq
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from domain.entities.name import NameSuggestionEntity
+
+
+@dataclass
+class NamePrefixIndex:
+    """Process-local prefix index of the names with stored origins.
+
+    Canonical keys are kept in a sorted array, so the names starting with a prefix
+    are one contiguous range found by binary search. The top completions of a
+    prefix are cached for up to max_limit names; storing a name only invalidates
+    the cached prefixes of that name.
+
+    Attributes:
+        max_limit: Most completions returned for one prefix
+        cache_size: Prefixes whose top completions are cached
+    """
+
+    max_limit: int = 20
+    cache_size: int = 10000
+    _keys: list[str] = field(default_factory=list, init=False, repr=False)
+    # Canonical key -> (display form, count of requests)
+    _names: dict[str, tuple[str, int]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _top: OrderedDict[str, list[str]] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def load(self, names: Iterable[NameSuggestionEntity]) -> None:
+        """Index the names of the database, in one sort.
+
+        Stored names are never deleted, so names indexed already are kept; they may
+        have been put while the database was being read.
+        """
+        entries = dict(self._names)
+        entries.update(
+            (name.key, (name.name, name.count_of_requests)) for name in names
+        )
+        self._names = entries
+        self._keys = sorted(entries)
+        self._top.clear()
+
+    def put(self, key: str, name: str, count_of_requests: int) -> None:
+        """Index a name, or update the display form and count of an indexed one."""
+        if key not in self._names:
+            bisect.insort(self._keys, key)
+        self._names[key] = (name, count_of_requests)
+        for end in range(1, len(key) + 1):
+            self._top.pop(key[:end], None)
+
+    def complete(self, prefix: str, limit: int = 10) -> list[NameSuggestionEntity]:
+        """Returns the names starting with a prefix, most requested first.
+
+        Args:
+            prefix (str): Canonical form of the prefix.
+            limit (int): Most names returned, up to max_limit.
+
+        Returns:
+            list[NameSuggestionEntity]: The completions, ties ordered by key.
+        """
+        top = self._top.get(prefix)
+        if top is None:
+            top = self._rank(prefix)
+            self._top[prefix] = top
+            if len(self._top) > self.cache_size:
+                self._top.popitem(last=False)
+        else:
+            self._top.move_to_end(prefix)
+
+        return [
+            NameSuggestionEntity(
+                key=key, name=self._names[key][0], count_of_requests=self._names[key][1]
+            )
+            for key in top[: min(limit, self.max_limit)]
+        ]
+
+    def _rank(self, prefix: str) -> list[str]:
+        start = bisect.bisect_left(self._keys, prefix)
+        # Every key starting with prefix sorts before prefix + the last code point
+        end = bisect.bisect_left(self._keys, prefix + '\U0010ffff', lo=start)
+        return heapq.nsmallest(
+            self.max_limit,
+            self._keys[start:end],
+            key=lambda key: (-self._names[key][1], key),
+        )
@@ -1,5 +1,13 @@
+from infra.models.area import NameAreaPopularityModel
 from infra.models.base import Base
 from infra.models.country import CountryModel
+from infra.models.job import JobModel
 from infra.models.name import NameOriginModel
 
-__all__ = ['Base', 'CountryModel', 'NameOriginModel']
+__all__ = [
+    'Base',
+    'CountryModel',
+    'JobModel',
+    'NameAreaPopularityModel',
+    'NameOriginModel',
+]
@@ -0,0 +1,37 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infra.models.base import Base
+
+
+class NameAreaPopularityModel(Base):
+    """SQLAlchemy model of the rollup of name popularity by region and sub-region.
+
+    One row per area and name, derived from names_origin and countries; it is kept
+    up to date by the name repository whenever the origins of a name are written.
+    """
+
+    __tablename__ = 'names_area_popularity'
+    __table_args__ = (
+        # The most popular names of an area in one index range read
+        Index(
+            'ix_names_area_popularity_area_weight',
+            'area_type',
+            'area',
+            'weight',
+            'name_key',
+        ),
+    )
+
+    area_type: Mapped[str] = mapped_column(String(16), primary_key=True)
+    area: Mapped[str] = mapped_column(String(50), primary_key=True)
+    name_key: Mapped[str] = mapped_column(String(100), primary_key=True)
+    name: Mapped[str] = mapped_column(String(100))
+    weight: Mapped[float] = mapped_column(Float)
+    countries: Mapped[int] = mapped_column(Integer)
+    updated_at: Mapped[datetime] = mapped_column(DateTime)
+
+    def __repr__(self) -> str:
+        return f'<NameAreaPopularityModel(area={self.area}, name={self.name}, weight={self.weight})>'
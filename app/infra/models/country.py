@@ -31,6 +31,7 @@ class CountryModel(Base):
     borders: Mapped[str] = mapped_column(
         String(200), nullable=True
     )  # Stored as comma-separated values
+    iso_alpha3_code: Mapped[str] = mapped_column(String(3), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime)
     updated_at: Mapped[datetime] = mapped_column(DateTime)
 
@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infra.models.base import Base
+
+
+class JobModel(Base):
+    """SQLAlchemy model for storing bulk enrichment jobs."""
+
+    __tablename__ = 'jobs'
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    status: Mapped[str] = mapped_column(String(16), index=True)
+    total_names: Mapped[int] = mapped_column(Integer)
+    processed_names: Mapped[int] = mapped_column(Integer)
+    failed_names: Mapped[int] = mapped_column(Integer)
+    results_offset: Mapped[int] = mapped_column(BigInteger)
+    error: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime)
+    updated_at: Mapped[datetime] = mapped_column(DateTime)
+
+    def __repr__(self) -> str:
+        return f'<JobModel(id={self.id}, status={self.status}, processed_names={self.processed_names})>'
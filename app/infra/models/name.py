@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import String, Float, Integer, DateTime, ForeignKey
+from sqlalchemy import String, Float, Integer, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from infra.models.base import Base
@@ -13,9 +13,21 @@ class NameOriginModel(Base):
     """SQLAlchemy model for storing name origin data."""
 
     __tablename__ = 'names_origin'
+    __table_args__ = (
+        # Keyset pagination of popular names by country
+        Index(
+            'ix_names_origin_country_code_probability_id',
+            'country_code',
+            'probability',
+            'id',
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    name: Mapped[str] = mapped_column(String(100), index=True)
+    name: Mapped[str] = mapped_column(String(100))
+    name_key: Mapped[str] = mapped_column(
+        String(100), index=True
+    )  # NFKC + casefold + trim of name, see Name.canonical
     probability: Mapped[float] = mapped_column(Float)
     count_of_requests: Mapped[int] = mapped_column(Integer)
     country_code: Mapped[str] = mapped_column(
@@ -1,3 +1,4 @@
+import asyncio
 from abc import (
     ABC,
     abstractmethod,
@@ -8,6 +9,24 @@ from domain.entities.country import CountryEntity
 from domain.entities.name import NameStrEntity
 
 
+@dataclass(frozen=True)
+class CountriesRevision:
+    """Result of revalidating the list of countries.
+
+    Attributes:
+        countries: All countries, None if they did not change since the revision
+            described by the validators passed in
+        etag: ETag of the list, if the API sent one
+        last_modified: Last-Modified of the list, if the API sent one
+        digest: Digest of the list content
+    """
+
+    countries: list[CountryEntity] | None
+    etag: str | None = None
+    last_modified: str | None = None
+    digest: str | None = None
+
+
 @dataclass
 class BaseCountryAPIRepository(ABC):
     """Abstract base class for country repository implementations.
@@ -37,6 +56,58 @@ class BaseCountryAPIRepository(ABC):
         """
         ...
 
+    async def get_countries(self, names: list[str]) -> list[CountryEntity]:
+        """Retrieve several countries by their names at once.
+
+        The default implementation issues one lookup per country; implementations backed
+        by an API with a multi-country endpoint should override it.
+
+        Args:
+            names (list[str]): The names of the countries to retrieve.
+
+        Returns:
+            list[CountryEntity]: The countries that were found.
+        """
+        countries = await asyncio.gather(*(self.get_country(name) for name in names))
+        return [country for country in countries if country]
+
+    async def revalidate_list_of_countries(
+        self,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        digest: str | None = None,
+    ) -> CountriesRevision:
+        """Retrieve the list of countries unless it did not change.
+
+        The default implementation always retrieves the full list; implementations
+        backed by an API supporting conditional requests should override it.
+
+        Args:
+            etag (str | None): ETag of the revision already known.
+            last_modified (str | None): Last-Modified of the revision already known.
+            digest (str | None): Digest of the revision already known.
+
+        Returns:
+            CountriesRevision: The current revision of the list.
+        """
+        return CountriesRevision(countries=await self.get_list_of_countries())
+
+    async def get_alpha3_codes(self) -> dict[str, str]:
+        """Retrieve the ISO alpha-3 code of every country.
+
+        The default implementation reads them from the full list of countries;
+        implementations backed by an API that can return only the codes should
+        override it.
+
+        Returns:
+            dict[str, str]: Alpha-3 codes keyed by ISO alpha-2 code.
+        """
+        return {
+            country.iso_alpha2_code: country.iso_alpha3_code
+            for country in await self.get_list_of_countries()
+            if country.iso_alpha3_code
+        }
+
 
 @dataclass
 class BaseNameOriginAPIRepository(ABC):
@@ -58,3 +129,20 @@ class BaseNameOriginAPIRepository(ABC):
                              None otherwise.
         """
         ...
+
+    async def get_batch_name_origins(
+        self, names: list[str]
+    ) -> dict[str, list[NameStrEntity] | None]:
+        """Retrieve the probability information for several names at once.
+
+        The default implementation issues one lookup per name; implementations backed by
+        an API with a multi-name endpoint should override it.
+
+        Args:
+            names (list[str]): The distinct names to calculate probability for.
+
+        Returns:
+            dict[str, list[NameStrEntity] | None]: The result of get_name_origins keyed by name.
+        """
+        results = await asyncio.gather(*(self.get_name_origins(name) for name in names))
+        return dict(zip(names, results))
@@ -0,0 +1,90 @@
+import asyncio
+import contextvars
+from dataclasses import dataclass, field
+from typing import override
+
+from domain.entities.name import NameStrEntity
+from infra.repositories.api.base import BaseNameOriginAPIRepository
+
+
+@dataclass
+class BatchingNameOriginAPIRepository(BaseNameOriginAPIRepository):
+    """Micro-batching decorator over a name origin API repository.
+
+    Lookups arriving within ``window`` seconds of each other, across concurrent
+    requests, are collected and sent upstream as one batched call; each waiter gets
+    the result of its own name. Concurrent lookups of the same name share one slot
+    in the batch.
+
+    Attributes:
+        repository: The repository performing the batched upstream calls
+        window: How long the first lookup of a batch waits for others, in seconds
+        max_batch_size: Batch size that triggers an immediate flush
+    """
+
+    repository: BaseNameOriginAPIRepository
+    window: float = 0.005
+    max_batch_size: int = 10
+    _pending: dict[str, asyncio.Future] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _flush_handle: asyncio.TimerHandle | None = field(
+        default=None, init=False, repr=False
+    )
+    _in_flight: set[asyncio.Task] = field(default_factory=set, init=False, repr=False)
+
+    @override
+    async def get_name_origins(self, name: str) -> list[NameStrEntity] | None:
+        future = self._pending.get(name)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[name] = future
+
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.window, self._flush)
+
+        # A cancelled waiter must not cancel the lookup shared with other waiters
+        return await asyncio.shield(future)
+
+    @override
+    async def get_batch_name_origins(
+        self, names: list[str]
+    ) -> dict[str, list[NameStrEntity] | None]:
+        return await self.repository.get_batch_name_origins(names)
+
+    def _flush(self) -> None:
+        """Send the pending lookups upstream as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+
+        # The batch is shared, so it must not inherit the deadline of one waiter
+        task = asyncio.get_running_loop().create_task(
+            self._send(batch), context=contextvars.Context()
+        )
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, batch: dict[str, asyncio.Future]) -> None:
+        try:
+            results = await self.repository.get_batch_name_origins(list(batch))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as exception:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exception)
+            return
+
+        for name, future in batch.items():
+            if not future.done():
+                future.set_result(results.get(name))
@@ -1,8 +1,28 @@
-from dataclasses import dataclass, field
+import hashlib
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from typing import Any, override
 import httpx
+import orjson
 from domain.entities.country import CountryEntity
-from infra.repositories.api.base import BaseCountryAPIRepository
+from infra.http.clients import REST_COUNTRIES, HTTPClientRegistry
+from infra.repositories.api.base import BaseCountryAPIRepository, CountriesRevision
+from utils.json_stream import iter_json_array
+
+
+# The fields read by _map_to_entity; REST Countries accepts at most 10 per request
+COUNTRY_FIELDS = (
+    'cca2',
+    'name',
+    'region',
+    'subregion',
+    'independent',
+    'capital',
+    'capitalInfo',
+    'flags',
+    'coatOfArms',
+    'borders',
+)
 
 
 @dataclass
@@ -13,12 +33,15 @@ class CountriesAPIRepository(BaseCountryAPIRepository):
     """
 
     base_url: str
-    timeout: float = 5.0  # Default timeout of 5 seconds
-    client: httpx.AsyncClient = field(init=False)
+    http_clients: HTTPClientRegistry
 
-    def __post_init__(self):
-        timeout = httpx.Timeout(self.timeout, connect=2.0)
-        self.client = httpx.AsyncClient(timeout=timeout)
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self.http_clients.get_client(REST_COUNTRIES)
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        return self.http_clients.timeout(REST_COUNTRIES)
 
     @override
     async def get_list_of_countries(self) -> list[CountryEntity]:
@@ -28,16 +51,82 @@ class CountriesAPIRepository(BaseCountryAPIRepository):
             list[CountryEntity]: A list of CountryEntity objects representing all countries.
         """
         try:
-            response = await self.client.get(f'{self.base_url}/all')
+            response = await self.client.get(
+                f'{self.base_url}/all', params={'fields': ','.join(COUNTRY_FIELDS)}
+            )
             response.raise_for_status()
 
-            countries_data = response.json()
+            countries_data = orjson.loads(response.content)
             return [
                 self._map_to_entity(country_data) for country_data in countries_data
             ]
         except httpx.HTTPStatusError as e:
             raise e
 
+    @override
+    async def revalidate_list_of_countries(
+        self,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        digest: str | None = None,
+    ) -> CountriesRevision:
+        """Fetch all countries with a conditional request.
+
+        The validators are sent as If-None-Match and If-Modified-Since; a 304, or a
+        body with the known digest when the API ignores them, means no change.
+
+        Returns:
+            CountriesRevision: The current revision; countries is None if unchanged.
+        """
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+        response = await self.client.get(
+            f'{self.base_url}/all',
+            params={'fields': ','.join(COUNTRY_FIELDS)},
+            headers=headers,
+            timeout=self.timeout,
+        )
+        if response.status_code == 304:
+            return CountriesRevision(
+                countries=None, etag=etag, last_modified=last_modified, digest=digest
+            )
+        response.raise_for_status()
+
+        new_digest = hashlib.sha256(response.content).hexdigest()
+        return CountriesRevision(
+            countries=(
+                None
+                if new_digest == digest
+                else [
+                    self._map_to_entity(country_data)
+                    for country_data in orjson.loads(response.content)
+                ]
+            ),
+            etag=response.headers.get('etag'),
+            last_modified=response.headers.get('last-modified'),
+            digest=new_digest,
+        )
+
+    async def stream_list_of_countries(self) -> AsyncIterator[CountryEntity]:
+        """Fetch all countries, mapping each one as soon as its bytes arrive.
+
+        Only the fields in COUNTRY_FIELDS are requested, and the response is parsed
+        incrementally instead of being loaded as a whole.
+
+        Yields:
+            CountryEntity: The countries, in the order of the API.
+        """
+        async with self.client.stream(
+            'GET', f'{self.base_url}/all', params={'fields': ','.join(COUNTRY_FIELDS)}
+        ) as response:
+            response.raise_for_status()
+            async for country_data in iter_json_array(response.aiter_bytes()):
+                yield self._map_to_entity(country_data)
+
     @override
     async def get_country(self, name: str) -> CountryEntity | None:
         """Fetch a specific country by name from the REST Countries API.
@@ -49,10 +138,12 @@ class CountriesAPIRepository(BaseCountryAPIRepository):
             CountryEntity | None: The CountryEntity object if found, None otherwise.
         """
         try:
-            response = await self.client.get(f'{self.base_url}/alpha/{name}')
+            response = await self.client.get(
+                f'{self.base_url}/alpha/{name}', timeout=self.timeout
+            )
             response.raise_for_status()
 
-            countries_data = response.json()
+            countries_data = orjson.loads(response.content)
             if not countries_data:
                 return None
 
@@ -62,6 +153,58 @@ class CountriesAPIRepository(BaseCountryAPIRepository):
                 return None
             raise
 
+    @override
+    async def get_countries(self, names: list[str]) -> list[CountryEntity]:
+        """Fetch several countries with one `alpha?codes=` request.
+
+        Args:
+            names (list[str]): The codes of the countries to retrieve (e.g., ['US', 'GB']).
+
+        Returns:
+            list[CountryEntity]: The countries that were found.
+        """
+        if not names:
+            return []
+
+        try:
+            response = await self.client.get(
+                f'{self.base_url}/alpha',
+                params={'codes': ','.join(names)},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+
+            countries_data = orjson.loads(response.content)
+            return [
+                self._map_to_entity(country_data) for country_data in countries_data
+            ]
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in (400, 404):
+                return []
+            raise
+
+    @override
+    async def get_alpha3_codes(self) -> dict[str, str]:
+        """Fetch the alpha-3 code of every country, which borders are listed in.
+
+        COUNTRY_FIELDS already has the 10 fields allowed, so the codes are a
+        separate, small request.
+
+        Returns:
+            dict[str, str]: Alpha-3 codes keyed by ISO alpha-2 code.
+        """
+        response = await self.client.get(
+            f'{self.base_url}/all',
+            params={'fields': 'cca2,cca3'},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return {
+            country_data['cca2']: country_data['cca3']
+            for country_data in orjson.loads(response.content)
+            if country_data.get('cca3')
+        }
+
     @staticmethod
     def _map_to_entity(data: dict[str, Any]) -> CountryEntity:
         """Map REST Countries API response to CountryEntity.
@@ -88,4 +231,6 @@ class CountriesAPIRepository(BaseCountryAPIRepository):
             coat_of_arms_png=data.get('coatOfArms', {}).get('png'),
             coat_of_arms_svg=data.get('coatOfArms', {}).get('svg'),
             borders=set(data.get('borders', [])),
+            # Not in COUNTRY_FIELDS; only the `alpha` endpoints return it
+            iso_alpha3_code=data.get('cca3'),
         )
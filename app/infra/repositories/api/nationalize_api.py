@@ -1,8 +1,10 @@
-from dataclasses import dataclass, field
-from typing import override
+from dataclasses import dataclass
+from typing import Any, override
 import httpx
+import orjson
 from domain.entities.name import NameStrEntity
 from domain.values.name import Name, Probability, CountOfRequests
+from infra.http.clients import NATIONALIZE, HTTPClientRegistry
 from infra.repositories.api.base import BaseNameOriginAPIRepository
 
 
@@ -14,12 +16,16 @@ class NationalizeRepository(BaseNameOriginAPIRepository):
     """
 
     base_url: str
-    timeout: float = 5.0  # Default timeout of 5 seconds
-    client: httpx.AsyncClient = field(init=False)
+    http_clients: HTTPClientRegistry
+    max_batch_size: int = 10  # Nationalize accepts up to 10 names per request
 
-    def __post_init__(self):
-        timeout = httpx.Timeout(self.timeout, connect=2.0)
-        self.client = httpx.AsyncClient(timeout=timeout)
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self.http_clients.get_client(NATIONALIZE)
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        return self.http_clients.timeout(NATIONALIZE)
 
     @override
     async def get_name_origins(self, name: str) -> list[NameStrEntity] | None:
@@ -33,27 +39,82 @@ class NationalizeRepository(BaseNameOriginAPIRepository):
                                       for each country if found, None otherwise.
         """
         try:
-            response = await self.client.get(f'{self.base_url}/?name={name}')
+            response = await self.client.get(
+                f'{self.base_url}/', params={'name': name}, timeout=self.timeout
+            )
             response.raise_for_status()
 
-            data = response.json()
-
-            if not data.get('country'):
-                return None
-
-            results: list[NameStrEntity] = []
-            for country_data in data['country']:
-                results.append(
-                    NameStrEntity(
-                        name=Name(value=name),
-                        probability=Probability(value=country_data['probability']),
-                        count_of_requests=CountOfRequests(value=data['count']),
-                        country_name=country_data['country_id'],
-                    )
-                )
-
-            return results if results else None
+            return self._map_to_entities(name, orjson.loads(response.content))
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 400:
                 return None
             raise
+
+    @override
+    async def get_batch_name_origins(
+        self, names: list[str]
+    ) -> dict[str, list[NameStrEntity] | None]:
+        """Fetch nationality probability for several names with `name[]` requests.
+
+        Names are sent in chunks of max_batch_size, so N names cost ceil(N / 10)
+        upstream requests instead of N.
+
+        Args:
+            names (list[str]): The distinct names to get nationality probability for.
+
+        Returns:
+            dict[str, list[NameStrEntity] | None]: The origins of each name, None if not found.
+        """
+        results: dict[str, list[NameStrEntity] | None] = {}
+        for start in range(0, len(names), self.max_batch_size):
+            chunk = names[start : start + self.max_batch_size]
+            if len(chunk) == 1:
+                results[chunk[0]] = await self.get_name_origins(chunk[0])
+                continue
+
+            try:
+                response = await self.client.get(
+                    f'{self.base_url}/',
+                    params=[('name[]', name) for name in chunk],
+                    timeout=self.timeout,
+                )
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 400:
+                    raise
+                # One invalid name rejects the whole batch, so fall back to single lookups
+                results.update(await super().get_batch_name_origins(chunk))
+                continue
+
+            # The response lists the names in request order
+            for name, data in zip(chunk, orjson.loads(response.content)):
+                results[name] = self._map_to_entities(name, data)
+
+        return results
+
+    @staticmethod
+    def _map_to_entities(name: str, data: dict[str, Any]) -> list[NameStrEntity] | None:
+        """Map a Nationalize API result to NameStrEntity objects.
+
+        Args:
+            name (str): The requested name.
+            data (dict[str, Any]): The result of the name from the API.
+
+        Returns:
+            list[NameStrEntity] | None: One entity per country, None if there are no countries.
+        """
+        if not data.get('country'):
+            return None
+
+        results: list[NameStrEntity] = []
+        for country_data in data['country']:
+            results.append(
+                NameStrEntity(
+                    name=Name(value=name),
+                    probability=Probability(value=country_data['probability']),
+                    count_of_requests=CountOfRequests(value=data['count']),
+                    country_name=country_data['country_id'],
+                )
+            )
+
+        return results if results else None
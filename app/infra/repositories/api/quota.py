@@ -0,0 +1,208 @@
+import enum
+import math
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, override
+
+import httpx
+
+from domain.entities.name import NameStrEntity
+from infra.exceptions.upstream import UpstreamQuotaExhaustedException
+from infra.repositories.api.base import BaseNameOriginAPIRepository
+from utils.shared_state import SharedStateFile
+
+
+class RequestPriority(enum.IntEnum):
+    BACKGROUND = 0
+    INTERACTIVE = 1
+
+
+request_priority: ContextVar[RequestPriority] = ContextVar(
+    'request_priority', default=RequestPriority.INTERACTIVE
+)
+
+
+def _parse_seconds(value: str | None) -> float | None:
+    """Returns the non-negative seconds of a header, None if missing or malformed."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        return None
+    return seconds if math.isfinite(seconds) and seconds >= 0 else None
+
+
+def _parse_count(value: str | None) -> int | None:
+    """Returns the non-negative count of a header, None if missing or malformed."""
+    number = _parse_seconds(value)
+    return int(number) if number is not None else None
+
+
+@contextmanager
+def background_priority() -> Iterator[None]:
+    """Mark the upstream calls made inside the block as background work."""
+    token = request_priority.set(RequestPriority.BACKGROUND)
+    try:
+        yield
+    finally:
+        request_priority.reset(token)
+
+
+@dataclass
+class QuotaManager:
+    """Upstream quota budget shared by all worker processes of a host.
+
+    A token bucket smooths the request rate, while the quota the upstream reports in
+    its rate-limit headers caps the bucket. Background work is only admitted while
+    more than background_reserve calls remain, interactive lookups while more than
+    interactive_reserve remain, so the last calls are kept for users.
+
+    Attributes:
+        upstream: Name of the upstream, used in errors
+        state: Host-wide state of the bucket
+        rate: Tokens added to the bucket per second
+        burst: Capacity of the bucket
+        interactive_reserve: Reported calls interactive lookups must leave unused
+        background_reserve: Reported calls background work must leave unused
+    """
+
+    upstream: str
+    state: SharedStateFile
+    rate: float = 10.0
+    burst: float = 50.0
+    interactive_reserve: int = 0
+    background_reserve: int = 100
+
+    async def acquire(self, cost: int = 1) -> None:
+        """Take tokens for an upstream call at the priority of the current context.
+
+        Args:
+            cost (int): Upstream calls that will be billed (one per name).
+
+        Raises:
+            UpstreamQuotaExhaustedException: If the budget of the priority is used up.
+        """
+        reserve = (
+            self.interactive_reserve
+            if request_priority.get() == RequestPriority.INTERACTIVE
+            else self.background_reserve
+        )
+        retry_after = await self.state.apply(
+            lambda state: self._take(state, cost, reserve, time.time())
+        )
+        if retry_after is not None:
+            raise UpstreamQuotaExhaustedException(
+                upstream=self.upstream, retry_after=retry_after
+            )
+
+    async def observe(self, response: httpx.Response) -> None:
+        """Update the reported quota from the rate-limit headers of a response.
+
+        Malformed headers are ignored.
+
+        Args:
+            response (httpx.Response): A response of the upstream.
+        """
+        if response.status_code == 429:
+            remaining: int | None = 0
+        else:
+            remaining = _parse_count(response.headers.get('x-rate-limit-remaining'))
+            if remaining is None:
+                return
+        reset = _parse_seconds(
+            response.headers.get('x-rate-limit-reset')
+            or response.headers.get('retry-after')
+        )
+        if reset is None and response.status_code == 429:
+            # Without a usable reset the exhausted quota would never be renewed
+            reset = 1.0
+        now = time.time()
+
+        def update(state: dict[str, Any]) -> None:
+            state['remaining'] = remaining
+            if reset is not None:
+                state['reset_at'] = now + reset
+
+        await self.state.apply(update)
+
+    async def snapshot(self) -> dict[str, Any]:
+        """Returns the tokens in the bucket and the reported remaining quota."""
+        tokens, remaining, reset_at = self._current(
+            await self.state.aread(), time.time()
+        )
+        return {
+            'tokens': tokens,
+            'burst': self.burst,
+            'remaining': remaining,
+            'reset_at': reset_at,
+        }
+
+    def _take(
+        self, state: dict[str, Any], cost: int, reserve: int, now: float
+    ) -> float | None:
+        """Take the tokens from the locked state; returns the seconds to wait
+        instead if the budget is used up."""
+        tokens, remaining, reset_at = self._current(state, now)
+        if remaining is not None and remaining - cost < reserve:
+            return max(reset_at - now, 1.0)
+        if tokens < cost:
+            return (cost - tokens) / self.rate
+
+        state['tokens'] = tokens - cost
+        state['updated_at'] = now
+        if remaining is not None:
+            state['remaining'] = remaining - cost
+        return None
+
+    def _current(
+        self, state: dict[str, Any], now: float
+    ) -> tuple[float, int | None, float]:
+        elapsed = max(0.0, now - state.get('updated_at', now))
+        tokens = min(self.burst, state.get('tokens', self.burst) + elapsed * self.rate)
+        remaining = state.get('remaining')
+        reset_at = state.get('reset_at', 0.0)
+        if remaining is not None and reset_at and now >= reset_at:
+            # The reported quota was renewed; it is unknown until the next response
+            remaining = None
+        return tokens, remaining, reset_at
+
+
+@dataclass
+class QuotaAwareNameOriginAPIRepository(BaseNameOriginAPIRepository):
+    """Name origin API repository that spends the shared upstream quota."""
+
+    repository: BaseNameOriginAPIRepository
+    quota: QuotaManager
+
+    @override
+    async def get_name_origins(self, name: str) -> list[NameStrEntity] | None:
+        await self.quota.acquire()
+        try:
+            return await self.repository.get_name_origins(name)
+        except httpx.HTTPStatusError as exception:
+            raise self._quota_exhausted(exception) from exception
+
+    @override
+    async def get_batch_name_origins(
+        self, names: list[str]
+    ) -> dict[str, list[NameStrEntity] | None]:
+        await self.quota.acquire(len(names))
+        try:
+            return await self.repository.get_batch_name_origins(names)
+        except httpx.HTTPStatusError as exception:
+            raise self._quota_exhausted(exception) from exception
+
+    def _quota_exhausted(self, exception: httpx.HTTPStatusError) -> Exception:
+        if exception.response.status_code != 429:
+            return exception
+        return UpstreamQuotaExhaustedException(
+            upstream=self.quota.upstream,
+            retry_after=_parse_seconds(
+                exception.response.headers.get('x-rate-limit-reset')
+                or exception.response.headers.get('retry-after')
+            ),
+        )
@@ -0,0 +1,279 @@
+import asyncio
+import enum
+import random
+import statistics
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import override, TypeVar
+
+import httpx
+
+from domain.entities.country import CountryEntity
+from domain.entities.name import NameStrEntity
+from infra.exceptions.upstream import UpstreamUnavailableException
+from infra.repositories.api.base import (
+    BaseCountryAPIRepository,
+    BaseNameOriginAPIRepository,
+    CountriesRevision,
+)
+from utils.deadline import remaining
+
+
+T = TypeVar('T')
+
+
+class CircuitState(enum.StrEnum):
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+@dataclass
+class CircuitBreaker:
+    """Circuit breaker failing fast while an upstream keeps failing.
+
+    After failure_threshold consecutive failures the circuit opens and calls are
+    rejected for reset_timeout seconds; then one probe call is let through and its
+    outcome closes or re-opens the circuit.
+    """
+
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    state: CircuitState = CircuitState.CLOSED
+    _failures: int = field(default=0, init=False, repr=False)
+    _opened_at: float = field(default=0.0, init=False, repr=False)
+
+    @property
+    def retry_after(self) -> float:
+        """Returns the seconds left until the circuit lets a probe call through."""
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def allow_request(self) -> bool:
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN and not self.retry_after:
+            self.state = CircuitState.HALF_OPEN
+            return True
+        # Only one probe call at a time while half-open
+        return False
+
+    def record_success(self) -> None:
+        self.state = CircuitState.CLOSED
+        self._failures = 0
+
+    def release_probe(self) -> None:
+        """Hand back a probe call that ended without an outcome, e.g. cancelled.
+
+        The circuit re-opens with its reset timeout already elapsed, so the next
+        call is let through as a new probe.
+        """
+        if self.state == CircuitState.HALF_OPEN:
+            self.state = CircuitState.OPEN
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if (
+            self.state == CircuitState.HALF_OPEN
+            or self._failures >= self.failure_threshold
+        ):
+            self.state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+
+
+@dataclass
+class LatencyTracker:
+    """Sliding window of call latencies used to decide when to hedge."""
+
+    window: int = 200
+    min_samples: int = 20
+    _samples: deque[float] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._samples = deque(maxlen=self.window)
+
+    def record(self, latency: float) -> None:
+        self._samples.append(latency)
+
+    def percentile(self, percentile: float) -> float | None:
+        """Returns the latency percentile, None until there are enough samples."""
+        if len(self._samples) < self.min_samples:
+            return None
+        cut_points = statistics.quantiles(self._samples, n=100, method='inclusive')
+        return cut_points[min(max(int(percentile), 1), 99) - 1]
+
+
+@dataclass
+class ResilientCaller:
+    """Runs upstream calls through a circuit breaker, retries and optional hedging.
+
+    Attributes:
+        upstream: Name of the upstream, used in errors
+        breaker: Circuit breaker of the upstream
+        retry_attempts: Retries after the first failed attempt
+        retry_base_delay: Base of the exponential backoff in seconds
+        retry_max_delay: Cap of the backoff in seconds; full jitter is applied
+        hedge_percentile: Latency percentile after which a second, hedged request is
+            sent; 0 disables hedging
+    """
+
+    upstream: str
+    breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+    retry_attempts: int = 2
+    retry_base_delay: float = 0.1
+    retry_max_delay: float = 1.0
+    hedge_percentile: float = 0.0
+    latencies: LatencyTracker = field(default_factory=LatencyTracker)
+
+    async def call(self, operation: Callable[[], Awaitable[T]]) -> T:
+        """Call the upstream operation.
+
+        Args:
+            operation (Callable[[], Awaitable[T]]): Creates the upstream call; invoked
+                once per attempt.
+
+        Returns:
+            T: The result of the operation.
+
+        Raises:
+            UpstreamUnavailableException: If the circuit is open or every attempt failed.
+        """
+        for attempt in range(self.retry_attempts + 1):
+            if not self.breaker.allow_request():
+                raise UpstreamUnavailableException(
+                    upstream=self.upstream, retry_after=self.breaker.retry_after
+                )
+
+            try:
+                result = await self._call_hedged(operation)
+            except Exception as exception:
+                if not self._is_upstream_failure(exception):
+                    # The upstream answered; the request itself was rejected
+                    self.breaker.record_success()
+                    raise
+                self.breaker.record_failure()
+                delay = self._backoff(attempt)
+                budget = remaining()
+                if attempt == self.retry_attempts or (
+                    budget is not None and budget <= delay
+                ):
+                    # Out of attempts, or the request deadline leaves no time to retry
+                    raise UpstreamUnavailableException(
+                        upstream=self.upstream, retry_after=self.breaker.retry_after
+                    ) from exception
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                # Cancelled before the upstream answered; a half-open circuit would
+                # otherwise wait forever for the outcome of its probe
+                self.breaker.release_probe()
+                raise
+
+            self.breaker.record_success()
+            return result
+
+        raise AssertionError('unreachable')
+
+    async def _call_hedged(self, operation: Callable[[], Awaitable[T]]) -> T:
+        hedge_after = (
+            self.latencies.percentile(self.hedge_percentile)
+            if self.hedge_percentile
+            else None
+        )
+        started_at = time.monotonic()
+        if hedge_after is None:
+            result = await operation()
+            self.latencies.record(time.monotonic() - started_at)
+            return result
+
+        attempts = {asyncio.ensure_future(operation())}
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=hedge_after)
+            if not done:
+                attempts.add(asyncio.ensure_future(operation()))
+
+            while attempts:
+                done, attempts = await asyncio.wait(
+                    attempts, return_when=asyncio.FIRST_COMPLETED
+                )
+                failed = [task for task in done if task.exception()]
+                succeeded = [task for task in done if not task.exception()]
+                if succeeded:
+                    self.latencies.record(time.monotonic() - started_at)
+                    return succeeded[0].result()
+                if not attempts:
+                    raise failed[0].exception()
+        finally:
+            for task in attempts:
+                task.cancel()
+
+        raise AssertionError('unreachable')
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(
+            0, min(self.retry_max_delay, self.retry_base_delay * 2**attempt)
+        )
+
+    @staticmethod
+    def _is_upstream_failure(exception: Exception) -> bool:
+        if isinstance(exception, httpx.HTTPStatusError):
+            return exception.response.status_code >= 500
+        return isinstance(exception, httpx.TransportError | TimeoutError)
+
+
+@dataclass
+class ResilientNameOriginAPIRepository(BaseNameOriginAPIRepository):
+    """Name origin API repository guarded by a ResilientCaller."""
+
+    repository: BaseNameOriginAPIRepository
+    caller: ResilientCaller
+
+    @override
+    async def get_name_origins(self, name: str) -> list[NameStrEntity] | None:
+        return await self.caller.call(lambda: self.repository.get_name_origins(name))
+
+    @override
+    async def get_batch_name_origins(
+        self, names: list[str]
+    ) -> dict[str, list[NameStrEntity] | None]:
+        return await self.caller.call(
+            lambda: self.repository.get_batch_name_origins(names)
+        )
+
+
+@dataclass
+class ResilientCountryAPIRepository(BaseCountryAPIRepository):
+    """Country API repository guarded by a ResilientCaller."""
+
+    repository: BaseCountryAPIRepository
+    caller: ResilientCaller
+
+    @override
+    async def get_list_of_countries(self) -> list[CountryEntity]:
+        return await self.caller.call(self.repository.get_list_of_countries)
+
+    @override
+    async def get_country(self, name: str) -> CountryEntity | None:
+        return await self.caller.call(lambda: self.repository.get_country(name))
+
+    @override
+    async def get_countries(self, names: list[str]) -> list[CountryEntity]:
+        return await self.caller.call(lambda: self.repository.get_countries(names))
+
+    @override
+    async def revalidate_list_of_countries(
+        self,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        digest: str | None = None,
+    ) -> CountriesRevision:
+        return await self.caller.call(
+            lambda: self.repository.revalidate_list_of_countries(
+                etag=etag, last_modified=last_modified, digest=digest
+            )
+        )
+
+    @override
+    async def get_alpha3_codes(self) -> dict[str, str]:
+        return await self.caller.call(self.repository.get_alpha3_codes)
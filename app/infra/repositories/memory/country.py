@@ -0,0 +1,47 @@
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+
+from domain.entities.country import CountryEntity
+from infra.repositories.memory.storage import InMemoryStorage
+from infra.repositories.sql.base import BaseCountryRepository
+
+
+@dataclass
+class CountryInMemoryRepository(BaseCountryRepository):
+    """Country repository over InMemoryStorage.
+
+    Writes are staged in ``pending`` and applied to the storage when the unit of
+    work commits.
+    """
+
+    storage: InMemoryStorage
+    pending: list[Callable[[], None]]
+
+    async def get_country(self, name: str) -> CountryEntity | None:
+        return self.storage.countries.get(name)
+
+    async def get_countries(self, names: list[str]) -> list[CountryEntity]:
+        return [
+            self.storage.countries[name]
+            for name in names
+            if name in self.storage.countries
+        ]
+
+    async def get_all_countries(self) -> list[CountryEntity]:
+        return [self.storage.countries[name] for name in sorted(self.storage.countries)]
+
+    async def add_country(self, country: CountryEntity) -> CountryEntity:
+        self.pending.append(lambda: self.storage.put_country(country))
+        return country
+
+    async def delete_country(self, name: str) -> None:
+        self.pending.append(lambda: self.storage.delete_country(name))
+
+    async def update_country(
+        self, name: str, country: CountryEntity
+    ) -> CountryEntity | None:
+        if name not in self.storage.countries:
+            return None
+        updated = replace(country, iso_alpha2_code=name)
+        self.pending.append(lambda: self.storage.put_country(updated))
+        return updated
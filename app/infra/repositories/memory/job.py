@@ -0,0 +1,36 @@
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+
+from domain.entities.job import JobEntity
+from infra.repositories.memory.storage import InMemoryStorage
+from infra.repositories.sql.base import BaseJobRepository
+
+
+@dataclass
+class JobInMemoryRepository(BaseJobRepository):
+    """Job repository over InMemoryStorage.
+
+    Writes are staged in ``pending`` and applied to the storage when the unit of
+    work commits.
+    """
+
+    storage: InMemoryStorage
+    pending: list[Callable[[], None]]
+
+    async def get_job(self, job_id: str) -> JobEntity | None:
+        job = self.storage.jobs.get(job_id)
+        return replace(job) if job else None
+
+    async def get_unfinished_jobs(self) -> list[JobEntity]:
+        return sorted(
+            (replace(job) for job in self.storage.jobs.values() if not job.finished),
+            key=lambda job: job.created_at,
+        )
+
+    async def add_job(self, job: JobEntity) -> None:
+        stored = replace(job)
+        self.pending.append(lambda: self.storage.jobs.setdefault(stored.id, stored))
+
+    async def update_job(self, job: JobEntity) -> None:
+        stored = replace(job)
+        self.pending.append(lambda: self.storage.put_job(stored))
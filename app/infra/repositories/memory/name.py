@@ -0,0 +1,110 @@
+import heapq
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+
+from domain.entities.country import AreaType
+from domain.entities.name import (
+    AreaNameEntity,
+    NameEntity,
+    NamesPageEntity,
+    NameSuggestionEntity,
+)
+from domain.values.cursor import PageCursor
+from domain.values.name import Name
+from infra.repositories.memory.storage import InMemoryStorage
+from infra.repositories.sql.base import BaseNameRepository
+
+
+@dataclass
+class NameInMemoryRepository(BaseNameRepository):
+    """Name origin repository over InMemoryStorage.
+
+    Writes are staged in ``pending`` and applied to the storage when the unit of
+    work commits.
+    """
+
+    storage: InMemoryStorage
+    pending: list[Callable[[], None]]
+
+    async def get_name_origins(self, name: str) -> list[NameEntity] | None:
+        rows = self.storage.name_ids_by_key.get(Name(value=name).canonical)
+        if not rows:
+            return None
+        return [self.storage.get_name(row_id) for row_id in rows.values()]
+
+    async def get_names_origins(self, names: list[str]) -> dict[str, list[NameEntity]]:
+        return {
+            name: [self.storage.get_name(row_id) for row_id in rows.values()]
+            for name in names
+            if (rows := self.storage.name_ids_by_key.get(name))
+        }
+
+    async def get_frequent_names_by_country(
+        self,
+        country_name: str,
+        limit: int = 5,
+        cursor: PageCursor | None = None,
+    ) -> NamesPageEntity:
+        positions = (
+            (self.storage.names[row_id].probability.as_generic_type(), row_id)
+            for row_id in self.storage.name_ids_by_country.get(country_name, ())
+        )
+        if cursor:
+            after = (cursor.probability, cursor.row_id)
+            positions = (position for position in positions if position < after)
+        page = heapq.nlargest(limit + 1, positions)
+
+        next_cursor = (
+            PageCursor.from_position(*page[limit - 1]) if len(page) > limit else None
+        )
+        return NamesPageEntity(
+            names=[self.storage.get_name(row_id) for _, row_id in page[:limit]],
+            next_cursor=next_cursor,
+        )
+
+    async def get_name_suggestions(
+        self, after: str | None = None, limit: int = 10000
+    ) -> list[NameSuggestionEntity]:
+        keys = heapq.nsmallest(
+            limit,
+            (
+                key
+                for key in self.storage.name_ids_by_key
+                if after is None or key > after
+            ),
+        )
+        suggestions = []
+        for key in keys:
+            rows = [
+                self.storage.names[row_id]
+                for row_id in self.storage.name_ids_by_key[key].values()
+            ]
+            suggestions.append(
+                NameSuggestionEntity(
+                    key=key,
+                    name=max(row.name.as_generic_type() for row in rows),
+                    count_of_requests=max(
+                        row.count_of_requests.as_generic_type() for row in rows
+                    ),
+                )
+            )
+        return suggestions
+
+    async def get_popular_names_by_area(
+        self, area_type: AreaType, area: str, limit: int = 5
+    ) -> list[AreaNameEntity]:
+        area_names = self.storage.area_names.get((area_type, area), {})
+        top = heapq.nlargest(
+            limit, area_names.items(), key=lambda item: (item[1].weight, item[0])
+        )
+        return [replace(area_name) for _, area_name in top]
+
+    async def refresh_area_popularity(self, name_keys: list[str] | None) -> None:
+        keys = None if name_keys is None else list(name_keys)
+        self.pending.append(lambda: self.storage.refresh_area_popularity(keys))
+
+    async def add_name_origin(self, name_origin: NameEntity) -> None:
+        self.pending.append(lambda: self.storage.put_name(name_origin))
+
+    async def update_name_origin(self, name_origin: NameEntity) -> None:
+        self.pending.append(lambda: self.storage.put_name(name_origin))
@@ -0,0 +1,117 @@
+import itertools
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field, replace
+
+from domain.entities.country import AreaType, CountryEntity
+from domain.entities.job import JobEntity
+from domain.entities.name import AreaNameEntity, NameEntity
+
+
+@dataclass
+class InMemoryStorage:
+    """Indexed in-process tables backing the in-memory repositories.
+
+    Attributes:
+        countries: Countries keyed by ISO alpha-2 code
+        names: Name origin rows keyed by their row id
+        name_ids_by_key: Row ids keyed by canonical name and then by country code
+        name_ids_by_country: Row ids of the name origins of each country
+        jobs: Bulk enrichment jobs keyed by id
+        area_names: Popularity rollup keyed by area type and area, then by
+            canonical name
+    """
+
+    countries: dict[str, CountryEntity] = field(default_factory=dict)
+    names: dict[int, NameEntity] = field(default_factory=dict)
+    name_ids_by_key: dict[str, dict[str, int]] = field(default_factory=dict)
+    name_ids_by_country: dict[str, set[int]] = field(default_factory=dict)
+    jobs: dict[str, JobEntity] = field(default_factory=dict)
+    area_names: dict[tuple[AreaType, str], dict[str, AreaNameEntity]] = field(
+        default_factory=dict
+    )
+    _ids: Iterator[int] = field(
+        default_factory=lambda: itertools.count(start=1), repr=False
+    )
+
+    def get_name(self, row_id: int) -> NameEntity:
+        """Get a name origin row bound to the current version of its country.
+
+        Args:
+            row_id (int): The row id of the name origin.
+
+        Returns:
+            NameEntity: The stored name origin.
+        """
+        name_origin = self.names[row_id]
+        country = self.countries.get(name_origin.country.iso_alpha2_code)
+        if country is None or country is name_origin.country:
+            return name_origin
+        return replace(name_origin, country=country)
+
+    def put_country(self, country: CountryEntity) -> None:
+        self.countries[country.iso_alpha2_code] = country
+
+    def delete_country(self, iso_alpha2_code: str) -> None:
+        self.countries.pop(iso_alpha2_code, None)
+
+    def put_name(self, name_origin: NameEntity) -> int:
+        """Insert a name origin, or replace the row stored for its name and country.
+
+        Args:
+            name_origin (NameEntity): The name origin to store.
+
+        Returns:
+            int: The row id of the stored name origin.
+        """
+        country_code = name_origin.country.iso_alpha2_code
+        rows = self.name_ids_by_key.setdefault(name_origin.name.canonical, {})
+        row_id = rows.get(country_code)
+        if row_id is None:
+            row_id = next(self._ids)
+            rows[country_code] = row_id
+            self.name_ids_by_country.setdefault(country_code, set()).add(row_id)
+        self.names[row_id] = name_origin
+        return row_id
+
+    def refresh_area_popularity(self, name_keys: Iterable[str] | None) -> None:
+        """Recompute the area popularity of some names, or of all of them."""
+        if name_keys is None:
+            self.area_names.clear()
+            name_keys = list(self.name_ids_by_key)
+        else:
+            name_keys = list(name_keys)
+            for area_names in self.area_names.values():
+                for key in name_keys:
+                    area_names.pop(key, None)
+
+        for key in name_keys:
+            for row_id in self.name_ids_by_key.get(key, {}).values():
+                name_origin = self.get_name(row_id)
+                name = name_origin.name.as_generic_type()
+                weight = (
+                    name_origin.probability.as_generic_type()
+                    * name_origin.count_of_requests.as_generic_type()
+                )
+                for area_type in AreaType:
+                    area = name_origin.country.area(area_type)
+                    if area is None:
+                        continue
+                    area_names = self.area_names.setdefault((area_type, area), {})
+                    current = area_names.get(key)
+                    if current is None:
+                        area_names[key] = AreaNameEntity(
+                            area_type=area_type,
+                            area=area,
+                            name=name,
+                            weight=weight,
+                            countries=1,
+                        )
+                        continue
+                    current.name = max(current.name, name)
+                    current.weight += weight
+                    current.countries += 1
+
+    def put_job(self, job: JobEntity) -> None:
+        """Replace the status and progress of a stored job."""
+        if job.id in self.jobs:
+            self.jobs[job.id] = job
@@ -0,0 +1,80 @@
+from collections.abc import Callable
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+
+from infra.repositories.memory.country import CountryInMemoryRepository
+from infra.repositories.memory.job import JobInMemoryRepository
+from infra.repositories.memory.name import NameInMemoryRepository
+from infra.repositories.memory.storage import InMemoryStorage
+from infra.repositories.sql.base import (
+    BaseCountryRepository,
+    BaseJobRepository,
+    BaseNameRepository,
+)
+from infra.repositories.sql.unit_of_work import IUnitOfWork
+
+
+@dataclass(kw_only=True)
+class _InMemoryState:
+    pending: list[Callable[[], None]]
+    country: BaseCountryRepository
+    name: BaseNameRepository
+    job: BaseJobRepository
+    token: Token | None = None
+
+
+@dataclass(kw_only=True)
+class InMemoryUnitOfWork(IUnitOfWork):
+    """Unit of work over process-local storage, for embedded/edge deployments.
+
+    Reads see committed data only; writes become visible on commit.
+    """
+
+    storage: InMemoryStorage = field(default_factory=InMemoryStorage)
+    _state: ContextVar[_InMemoryState | None] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._state = ContextVar(f'in_memory_unit_of_work_{id(self)}', default=None)
+
+    @property
+    def country(self) -> BaseCountryRepository:
+        return self._current.country
+
+    @property
+    def name(self) -> BaseNameRepository:
+        return self._current.name
+
+    @property
+    def job(self) -> BaseJobRepository:
+        return self._current.job
+
+    @property
+    def _current(self) -> _InMemoryState:
+        state = self._state.get()
+        if state is None:
+            raise RuntimeError('Unit of work is used outside of "async with" block')
+        return state
+
+    async def __aenter__(self) -> None:
+        pending: list[Callable[[], None]] = []
+        state = _InMemoryState(
+            pending=pending,
+            country=CountryInMemoryRepository(storage=self.storage, pending=pending),
+            name=NameInMemoryRepository(storage=self.storage, pending=pending),
+            job=JobInMemoryRepository(storage=self.storage, pending=pending),
+        )
+        state.token = self._state.set(state)
+
+    async def __aexit__(self, *args) -> None:
+        state = self._current
+        await self.rollback()
+        self._state.reset(state.token)
+
+    async def commit(self) -> None:
+        pending = self._current.pending
+        for apply_change in pending:
+            apply_change()
+        pending.clear()
+
+    async def rollback(self) -> None:
+        self._current.pending.clear()
@@ -1,8 +1,15 @@
 from abc import abstractmethod, ABC
 from dataclasses import dataclass
 
-from domain.entities.country import CountryEntity
-from domain.entities.name import NameEntity
+from domain.entities.country import AreaType, CountryEntity
+from domain.entities.job import JobEntity
+from domain.entities.name import (
+    AreaNameEntity,
+    NameEntity,
+    NamesPageEntity,
+    NameSuggestionEntity,
+)
+from domain.values.cursor import PageCursor
 
 
 @dataclass
@@ -26,6 +33,27 @@ class BaseCountryRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def get_countries(self, names: list[str]) -> list[CountryEntity]:
+        """Retrieve several countries by their names at once.
+
+        Args:
+            names (list[str]): The names of the countries to retrieve.
+
+        Returns:
+            list[CountryEntity]: The countries that were found.
+        """
+        ...
+
+    @abstractmethod
+    async def get_all_countries(self) -> list[CountryEntity]:
+        """Retrieve every stored country.
+
+        Returns:
+            list[CountryEntity]: All countries, ordered by ISO alpha-2 code.
+        """
+        ...
+
     @abstractmethod
     async def add_country(self, country: CountryEntity) -> CountryEntity:
         """Add a new country to the repository.
@@ -76,6 +104,9 @@ class BaseNameRepository(ABC):
     async def get_name_origins(self, name: str) -> list[NameEntity] | None:
         """Retrieve name origins for a specific name.
 
+        Names are matched on their canonical form (see ``Name.canonical``), so any
+        spelling variant of the same name resolves to the same origins.
+
         Args:
             name (str): The name to retrieve origins for.
 
@@ -84,17 +115,86 @@ class BaseNameRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def get_names_origins(self, names: list[str]) -> dict[str, list[NameEntity]]:
+        """Retrieve the origins of several names with one query.
+
+        Args:
+            names (list[str]): The canonical forms of the names.
+
+        Returns:
+            dict[str, list[NameEntity]]: The origins keyed by canonical name; names
+                without origins are absent.
+        """
+        ...
+
     @abstractmethod
     async def get_frequent_names_by_country(
-        self, country_name: str
-    ) -> list[NameEntity] | None:
-        """Retrieve frequent names for a specific country.
+        self,
+        country_name: str,
+        limit: int = 5,
+        cursor: PageCursor | None = None,
+    ) -> NamesPageEntity:
+        """Retrieve a page of frequent names for a specific country.
+
+        Names are ordered by (probability, row id) in descending order and paged by
+        keyset, so a deep page costs the same as the first one.
 
         Args:
             country_name (str): The country name to retrieve frequent names for.
+            limit (int): Maximum number of names in the page.
+            cursor (PageCursor | None): Cursor of the previous page, None for the first page.
 
         Returns:
-            list[NameEntity] | None: List of NameEntity objects if found, None otherwise.
+            NamesPageEntity: The page of names, empty if nothing was found.
+        """
+        ...
+
+    @abstractmethod
+    async def get_name_suggestions(
+        self, after: str | None = None, limit: int = 10000
+    ) -> list[NameSuggestionEntity]:
+        """Retrieve a page of the distinct stored names, ordered by canonical form.
+
+        Args:
+            after (str | None): Canonical form of the last name of the previous
+                page, None for the first page.
+            limit (int): Maximum number of names in the page.
+
+        Returns:
+            list[NameSuggestionEntity]: The names, empty after the last page.
+        """
+        ...
+
+    @abstractmethod
+    async def get_popular_names_by_area(
+        self, area_type: AreaType, area: str, limit: int = 5
+    ) -> list[AreaNameEntity]:
+        """Retrieve the most popular names of a region or sub-region.
+
+        Names are read from the area popularity rollup, ordered by weight in
+        descending order, so the query costs one index range read.
+
+        Args:
+            area_type (AreaType): Whether area is a region or a sub-region.
+            area (str): The region or sub-region, as stored for its countries.
+            limit (int): Maximum number of names.
+
+        Returns:
+            list[AreaNameEntity]: The names, empty if nothing was found.
+        """
+        ...
+
+    @abstractmethod
+    async def refresh_area_popularity(self, name_keys: list[str] | None) -> None:
+        """Recompute the area popularity rollup rows of some names.
+
+        Must be called in the transaction that wrote the origins of the names.
+
+        Args:
+            name_keys (list[str] | None): Canonical forms of the names whose origins
+                changed; None rebuilds the rollup of every name, e.g. after the
+                region of a country changed, in a transaction of its own.
         """
         ...
 
@@ -115,3 +215,47 @@ class BaseNameRepository(ABC):
             name_origin (NameEntity): The name origin entity to update.
         """
         ...
+
+
+@dataclass
+class BaseJobRepository(ABC):
+    """Abstract base class for bulk enrichment job repository implementations."""
+
+    @abstractmethod
+    async def get_job(self, job_id: str) -> JobEntity | None:
+        """Retrieve a job by its id.
+
+        Args:
+            job_id (str): The id of the job.
+
+        Returns:
+            JobEntity | None: The job if found, None otherwise.
+        """
+        ...
+
+    @abstractmethod
+    async def get_unfinished_jobs(self) -> list[JobEntity]:
+        """Retrieve the pending and running jobs, oldest first.
+
+        Returns:
+            list[JobEntity]: The jobs that still have names to process.
+        """
+        ...
+
+    @abstractmethod
+    async def add_job(self, job: JobEntity) -> None:
+        """Add a new job to the repository.
+
+        Args:
+            job (JobEntity): The job entity to add.
+        """
+        ...
+
+    @abstractmethod
+    async def update_job(self, job: JobEntity) -> None:
+        """Update the status and progress of an existing job.
+
+        Args:
+            job (JobEntity): The job entity to update.
+        """
+        ...
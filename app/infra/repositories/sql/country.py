@@ -17,6 +17,18 @@ class CountrySQLAlchemyRepository(BaseCountryRepository):
         result_scalar = result.scalar_one_or_none()
         return CountryConverter().to_entity(result_scalar) if result_scalar else None
 
+    async def get_countries(self, names: list[str]) -> list[CountryEntity]:
+        if not names:
+            return []
+        query = select(CountryModel).where(CountryModel.iso_alpha2_code.in_(names))
+        result = await self.session.execute(query)
+        return [CountryConverter().to_entity(model) for model in result.scalars()]
+
+    async def get_all_countries(self) -> list[CountryEntity]:
+        query = select(CountryModel).order_by(CountryModel.iso_alpha2_code)
+        result = await self.session.execute(query)
+        return [CountryConverter().to_entity(model) for model in result.scalars()]
+
     async def add_country(self, country: CountryEntity) -> CountryEntity:
         country_model = CountryConverter().to_model(country)
         self.session.add(country_model)
@@ -30,10 +42,16 @@ class CountrySQLAlchemyRepository(BaseCountryRepository):
     async def update_country(
         self, name: str, country: CountryEntity
     ) -> CountryEntity | None:
+        model = CountryConverter().to_model(country)
+        values = {
+            column.key: getattr(model, column.key)
+            for column in CountryModel.__table__.columns
+            if column.key not in ('iso_alpha2_code', 'created_at')
+        }
         query = (
             update(CountryModel)
             .where(CountryModel.iso_alpha2_code == name)
-            .values(**country.__dict__)
+            .values(**values)
             .returning(CountryModel)
         )
         result = await self.session.execute(query)
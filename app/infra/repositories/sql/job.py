@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities.job import JobEntity, JobStatus
+from infra.converters.job import JobConverter
+from infra.models.job import JobModel
+from infra.repositories.sql.base import BaseJobRepository
+
+
+@dataclass
+class JobSQLAlchemyRepository(BaseJobRepository):
+    session: AsyncSession
+
+    async def get_job(self, job_id: str) -> JobEntity | None:
+        model = await self.session.get(JobModel, job_id)
+        return JobConverter.to_entity(model) if model else None
+
+    async def get_unfinished_jobs(self) -> list[JobEntity]:
+        query = (
+            select(JobModel)
+            .where(JobModel.status.in_([JobStatus.PENDING, JobStatus.RUNNING]))
+            .order_by(JobModel.created_at)
+        )
+        result = await self.session.execute(query)
+        return [JobConverter.to_entity(model) for model in result.scalars()]
+
+    async def add_job(self, job: JobEntity) -> None:
+        self.session.add(JobConverter.to_model(job))
+        await self.session.flush()
+
+    async def update_job(self, job: JobEntity) -> None:
+        query = (
+            update(JobModel)
+            .where(JobModel.id == job.id)
+            .values(
+                status=job.status.value,
+                processed_names=job.processed_names,
+                failed_names=job.failed_names,
+                results_offset=job.results_offset,
+                error=job.error,
+                updated_at=job.updated_at,
+            )
+        )
+        await self.session.execute(query)
@@ -1,9 +1,35 @@
 from dataclasses import dataclass
+from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
+from sqlalchemy import (
+    DateTime,
+    String,
+    delete,
+    desc,
+    func,
+    literal,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects import (
+    postgresql,
+    sqlite,
+)
 from sqlalchemy.orm import joinedload
-from domain.entities.name import NameEntity
+from domain.entities.country import AreaType
+from domain.entities.name import (
+    AreaNameEntity,
+    NameEntity,
+    NamesPageEntity,
+    NameSuggestionEntity,
+)
+from domain.values.cursor import PageCursor
+from domain.values.name import Name
+from infra.converters.area import AreaNameConverter
 from infra.converters.name import NameConverter
+from infra.models.area import NameAreaPopularityModel
+from infra.models.country import CountryModel
 from infra.models.name import NameOriginModel
 from infra.repositories.sql.base import BaseNameRepository
 
@@ -16,7 +42,7 @@ class NameSQLAlchemyRepository(BaseNameRepository):
         query = (
             select(NameOriginModel)
             .options(joinedload(NameOriginModel.country))
-            .where(NameOriginModel.name == name)
+            .where(NameOriginModel.name_key == Name(value=name).canonical)
         )
         result = await self.session.execute(query)
         results = result.unique().scalars().all()
@@ -24,29 +50,184 @@ class NameSQLAlchemyRepository(BaseNameRepository):
             [NameConverter().to_entity(model) for model in results] if results else None
         )
 
+    async def get_names_origins(self, names: list[str]) -> dict[str, list[NameEntity]]:
+        if not names:
+            return {}
+        query = (
+            select(NameOriginModel)
+            .options(joinedload(NameOriginModel.country))
+            .where(NameOriginModel.name_key.in_(names))
+        )
+        result = await self.session.execute(query)
+        origins: dict[str, list[NameEntity]] = {}
+        for model in result.unique().scalars():
+            origins.setdefault(model.name_key, []).append(
+                NameConverter().to_entity(model)
+            )
+        return origins
+
     async def get_frequent_names_by_country(
-        self, country_name: str
-    ) -> list[NameEntity] | None:
-        """Get top 5 most frequent names for a specific country.
+        self,
+        country_name: str,
+        limit: int = 5,
+        cursor: PageCursor | None = None,
+    ) -> NamesPageEntity:
+        """Get a page of the most frequent names for a specific country.
 
         Args:
             country_name (str): The country name to fetch frequent names for.
+            limit (int): Maximum number of names in the page.
+            cursor (PageCursor | None): Cursor of the previous page, None for the first page.
 
         Returns:
-            list[NameEntity] | None: List of top 5 name entities if found, None otherwise.
+            NamesPageEntity: The page of name entities, empty if nothing was found.
         """
         query = (
             select(NameOriginModel)
             .options(joinedload(NameOriginModel.country))
             .where(NameOriginModel.country_code == country_name)
-            .order_by(desc(NameOriginModel.probability))
-            .limit(5)
+            .order_by(desc(NameOriginModel.probability), desc(NameOriginModel.id))
+            .limit(limit + 1)
         )
+        if cursor:
+            query = query.where(
+                tuple_(NameOriginModel.probability, NameOriginModel.id)
+                < tuple_(cursor.probability, cursor.row_id)
+            )
         result = await self.session.execute(query)
-        results = result.unique().scalars().all()
-        return (
-            [NameConverter().to_entity(model) for model in results] if results else None
+        models = result.unique().scalars().all()
+
+        page_models = models[:limit]
+        next_cursor = (
+            PageCursor.from_position(page_models[-1].probability, page_models[-1].id)
+            if len(models) > limit
+            else None
+        )
+        return NamesPageEntity(
+            names=[NameConverter().to_entity(model) for model in page_models],
+            next_cursor=next_cursor,
+        )
+
+    async def get_name_suggestions(
+        self, after: str | None = None, limit: int = 10000
+    ) -> list[NameSuggestionEntity]:
+        query = (
+            select(
+                NameOriginModel.name_key,
+                func.max(NameOriginModel.name),
+                func.max(NameOriginModel.count_of_requests),
+            )
+            .group_by(NameOriginModel.name_key)
+            .order_by(NameOriginModel.name_key)
+            .limit(limit)
+        )
+        if after is not None:
+            query = query.where(NameOriginModel.name_key > after)
+        result = await self.session.execute(query)
+        return [
+            NameSuggestionEntity(key=key, name=name, count_of_requests=count)
+            for key, name, count in result
+        ]
+
+    async def get_popular_names_by_area(
+        self, area_type: AreaType, area: str, limit: int = 5
+    ) -> list[AreaNameEntity]:
+        query = (
+            select(NameAreaPopularityModel)
+            .where(
+                NameAreaPopularityModel.area_type == area_type.value,
+                NameAreaPopularityModel.area == area,
+            )
+            .order_by(
+                desc(NameAreaPopularityModel.weight),
+                desc(NameAreaPopularityModel.name_key),
+            )
+            .limit(limit)
         )
+        result = await self.session.execute(query)
+        return [AreaNameConverter.to_entity(model) for model in result.scalars()]
+
+    async def refresh_area_popularity(self, name_keys: list[str] | None) -> None:
+        """Upsert the rollup rows of the names from a fresh aggregation.
+
+        The aggregation runs in the database: the origins of the names are joined
+        with their countries and summed per region and per sub-region. Rows are
+        upserted on their primary key, so concurrent refreshes of the same name
+        never collide, and the rows of the names the aggregation did not touch,
+        i.e. of areas the names left, are deleted afterwards.
+
+        Args:
+            name_keys (list[str] | None): Canonical forms of the names, None for all.
+        """
+        if name_keys is not None and not name_keys:
+            return None
+
+        rollup = NameAreaPopularityModel
+        now = datetime.now()
+        for area_type, area in (
+            (AreaType.REGION, CountryModel.region),
+            (AreaType.SUB_REGION, CountryModel.sub_region),
+        ):
+            aggregation = (
+                select(
+                    literal(area_type.value, String),
+                    area,
+                    NameOriginModel.name_key,
+                    func.max(NameOriginModel.name),
+                    func.sum(
+                        NameOriginModel.probability * NameOriginModel.count_of_requests
+                    ),
+                    func.count(),
+                    literal(now, DateTime),
+                )
+                .select_from(NameOriginModel)
+                .join(
+                    CountryModel,
+                    CountryModel.iso_alpha2_code == NameOriginModel.country_code,
+                )
+                # The WHERE clause also lets SQLite parse ON CONFLICT after the join
+                .where(area.is_not(None), area != '')
+                .group_by(area, NameOriginModel.name_key)
+            )
+            if name_keys is not None:
+                aggregation = aggregation.where(NameOriginModel.name_key.in_(name_keys))
+            upsert = self._insert(rollup).from_select(
+                [
+                    rollup.area_type,
+                    rollup.area,
+                    rollup.name_key,
+                    rollup.name,
+                    rollup.weight,
+                    rollup.countries,
+                    rollup.updated_at,
+                ],
+                aggregation,
+            )
+            await self.session.execute(
+                upsert.on_conflict_do_update(
+                    index_elements=[rollup.area_type, rollup.area, rollup.name_key],
+                    set_={
+                        'name': upsert.excluded.name,
+                        'weight': upsert.excluded.weight,
+                        'countries': upsert.excluded.countries,
+                        'updated_at': upsert.excluded.updated_at,
+                    },
+                )
+            )
+
+        stale = delete(rollup).where(rollup.updated_at < now)
+        if name_keys is not None:
+            stale = stale.where(rollup.name_key.in_(name_keys))
+        await self.session.execute(stale)
+        return None
+
+    def _insert(
+        self, table: type[NameAreaPopularityModel]
+    ) -> postgresql.Insert | sqlite.Insert:
+        """Returns an INSERT supporting ON CONFLICT in the dialect of the session."""
+        if self.session.get_bind().dialect.name == 'sqlite':
+            return sqlite.insert(table)
+        return postgresql.insert(table)
 
     async def add_name_origin(self, name_origin: NameEntity) -> None:
         name_model = NameConverter().to_model(name_origin)
@@ -54,11 +235,28 @@ class NameSQLAlchemyRepository(BaseNameRepository):
         await self.session.flush()
 
     async def update_name_origin(self, name_origin: NameEntity) -> None:
-        """Update the last accessed timestamp for a name origin.
+        """Update the row stored for the name origin's canonical name and country.
+
+        Falls back to inserting a new row when the name has no row for that country yet.
 
         Args:
             name_origin (NameEntity): The name origin entity to update.
         """
-        name_model = NameConverter().to_model(name_origin)
-        await self.session.merge(name_model)
+        query = (
+            update(NameOriginModel)
+            .where(
+                NameOriginModel.name_key == name_origin.name.canonical,
+                NameOriginModel.country_code == name_origin.country.iso_alpha2_code,
+            )
+            .values(
+                probability=name_origin.probability.as_generic_type(),
+                count_of_requests=name_origin.count_of_requests.as_generic_type(),
+                updated_at=name_origin.updated_at,
+                last_accessed_at=name_origin.last_accessed_at,
+            )
+        )
+        result = await self.session.execute(query)
+        if not result.rowcount:
+            await self.add_name_origin(name_origin)
+            return
         await self.session.flush()
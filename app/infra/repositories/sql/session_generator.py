@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
 
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -14,10 +15,13 @@ class AsyncSessionFactory:
     _async_session_maker = None
     url: str
     debug: bool
+    engine_options: dict[str, Any] = field(
+        default_factory=lambda: {'pool_size': 20, 'max_overflow': 0}
+    )
 
     def _create_instance(self) -> async_sessionmaker[AsyncSession]:
         self._async_engine: AsyncEngine = create_async_engine(
-            url=self.url, echo=self.debug, pool_size=20, max_overflow=0
+            url=self.url, echo=self.debug, **self.engine_options
         )
         self._async_session_maker = async_sessionmaker(
             self._async_engine, expire_on_commit=False
@@ -1,17 +1,42 @@
+import asyncio
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from infra.repositories.sql.base import BaseCountryRepository, BaseNameRepository
+from infra.models.base import Base
+from infra.repositories.sql.base import (
+    BaseCountryRepository,
+    BaseJobRepository,
+    BaseNameRepository,
+)
 from infra.repositories.sql.country import CountrySQLAlchemyRepository
+from infra.repositories.sql.job import JobSQLAlchemyRepository
 from infra.repositories.sql.name import NameSQLAlchemyRepository
+from utils.deadline import remaining
 
 
 @dataclass
 class IUnitOfWork(ABC):
-    country: BaseCountryRepository
-    name: BaseNameRepository
+    """Unit of work giving access to the repositories of one transaction.
+
+    Implementations are registered as singletons and shared by concurrent requests,
+    so the state of an entered unit must be local to the current task.
+    """
+
+    @property
+    @abstractmethod
+    def country(self) -> BaseCountryRepository: ...
+
+    @property
+    @abstractmethod
+    def name(self) -> BaseNameRepository: ...
+
+    @property
+    @abstractmethod
+    def job(self) -> BaseJobRepository: ...
 
     @abstractmethod
     async def __aenter__(self): ...
@@ -26,25 +51,110 @@ class IUnitOfWork(ABC):
     async def rollback(self): ...
 
 
+@dataclass(kw_only=True)
+class _SessionState:
+    session: AsyncSession
+    country: BaseCountryRepository
+    name: BaseNameRepository
+    job: BaseJobRepository
+    token: Token | None = None
+
+
 @dataclass(kw_only=True)
 class UnitOfWork(IUnitOfWork):
     session_factory: async_sessionmaker[AsyncSession]
-    _session: AsyncSession | None = None
-    country: BaseCountryRepository | None = None
-    name: BaseNameRepository | None = None
+    _state: ContextVar[_SessionState | None] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._state = ContextVar(f'unit_of_work_{id(self)}', default=None)
+
+    @property
+    def country(self) -> BaseCountryRepository:
+        return self._current.country
+
+    @property
+    def name(self) -> BaseNameRepository:
+        return self._current.name
+
+    @property
+    def job(self) -> BaseJobRepository:
+        return self._current.job
+
+    @property
+    def _current(self) -> _SessionState:
+        state = self._state.get()
+        if state is None:
+            raise RuntimeError('Unit of work is used outside of "async with" block')
+        return state
 
     async def __aenter__(self) -> None:
-        self._session = self.session_factory()
+        session = self.session_factory()
+        try:
+            await self._apply_deadline(session)
+        except BaseException:
+            await session.close()
+            raise
 
-        self.country = CountrySQLAlchemyRepository(session=self._session)
-        self.name = NameSQLAlchemyRepository(session=self._session)
+        state = _SessionState(
+            session=session,
+            country=CountrySQLAlchemyRepository(session=session),
+            name=NameSQLAlchemyRepository(session=session),
+            job=JobSQLAlchemyRepository(session=session),
+        )
+        state.token = self._state.set(state)
 
     async def __aexit__(self, *args) -> None:
-        await self.rollback()
-        await self._session.close()
+        state = self._current
+        try:
+            await self.rollback()
+            await state.session.close()
+        finally:
+            self._state.reset(state.token)
 
     async def commit(self) -> None:
-        await self._session.commit()
+        await self._current.session.commit()
+
+    async def _apply_deadline(self, session: AsyncSession) -> None:
+        """Limit the queries of the transaction to the remaining request budget."""
+        budget = remaining()
+        if budget is None:
+            return
+        # Let the server abandon queries the request can no longer wait for
+        await session.execute(
+            text(f'SET LOCAL statement_timeout = {max(1, int(budget * 1000))}')
+        )
 
     async def rollback(self) -> None:
-        await self._session.rollback()
+        await self._current.session.rollback()
+
+
+@dataclass(kw_only=True)
+class SQLiteUnitOfWork(UnitOfWork):
+    """Unit of work backed by an embedded SQLite database through aiosqlite.
+
+    There is no migration step for embedded deployments, so the schema is created
+    from the models the first time a unit is entered.
+    """
+
+    _schema_ready: bool = field(default=False, init=False, repr=False)
+    _schema_lock: asyncio.Lock = field(
+        default_factory=asyncio.Lock, init=False, repr=False
+    )
+
+    async def __aenter__(self) -> None:
+        if not self._schema_ready:
+            await self._create_schema()
+        await super().__aenter__()
+
+    async def _apply_deadline(self, session: AsyncSession) -> None:
+        # SQLite has no statement timeout; the request deadline cancels the await
+        return None
+
+    async def _create_schema(self) -> None:
+        async with self._schema_lock:
+            if self._schema_ready:
+                return
+            engine = self.session_factory.kw['bind']
+            async with engine.begin() as connection:
+                await connection.run_sync(Base.metadata.create_all)
+            self._schema_ready = True
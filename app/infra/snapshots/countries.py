@@ -0,0 +1,109 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import orjson
+
+from domain.entities.country import CountryEntity
+from infra.exceptions.snapshot import SnapshotVersionException
+
+
+SNAPSHOT_VERSION = 1
+DEFAULT_SNAPSHOT_PATH = Path(__file__).parent / 'countries.snapshot.json'
+
+# Rows of the snapshot are arrays with one value per column, in this order
+COLUMNS = (
+    'iso_alpha2_code',
+    'common_name',
+    'official_name',
+    'region',
+    'sub_region',
+    'independent',
+    'capital',
+    'capital_lat',
+    'capital_long',
+    'flag_png',
+    'flag_svg',
+    'flag_alt',
+    'coat_of_arms_png',
+    'coat_of_arms_svg',
+    'borders',
+)
+_SET_COLUMNS = frozenset(('capital', 'borders'))
+
+
+@dataclass
+class CountrySnapshot:
+    """Versioned, compact file with every country, shipped with the image.
+
+    Seeding from the snapshot replaces downloading the countries at startup.
+    """
+
+    path: Path = DEFAULT_SNAPSHOT_PATH
+
+    def exists(self) -> bool:
+        return self.path.is_file()
+
+    def load(self) -> list[CountryEntity]:
+        """Read the countries of the snapshot.
+
+        Returns:
+            list[CountryEntity]: All countries of the snapshot.
+
+        Raises:
+            SnapshotVersionException: If the file was written by another version.
+        """
+        data = orjson.loads(self.path.read_bytes())
+        if data.get('version') != SNAPSHOT_VERSION or data.get('columns') != list(
+            COLUMNS
+        ):
+            raise SnapshotVersionException(
+                path=str(self.path), version=data.get('version')
+            )
+
+        return [
+            CountryEntity(
+                **{
+                    column: set(value) if column in _SET_COLUMNS else value
+                    for column, value in zip(COLUMNS, row)
+                }
+            )
+            for row in data['countries']
+        ]
+
+    def write(self, countries: Iterable[CountryEntity], source: str) -> int:
+        """Replace the snapshot with the given countries.
+
+        Args:
+            countries (Iterable[CountryEntity]): The countries to store.
+            source (str): Where the countries were fetched from.
+
+        Returns:
+            int: The number of countries written.
+        """
+        rows = sorted(
+            (self._to_row(country) for country in countries), key=lambda row: row[0]
+        )
+        temporary_path = self.path.with_suffix('.tmp')
+        temporary_path.write_bytes(
+            orjson.dumps(
+                {
+                    'version': SNAPSHOT_VERSION,
+                    'source': source,
+                    'generated_at': datetime.now().isoformat(timespec='seconds'),
+                    'columns': COLUMNS,
+                    'countries': rows,
+                }
+            )
+        )
+        temporary_path.replace(self.path)
+        return len(rows)
+
+    @staticmethod
+    def _to_row(country: CountryEntity) -> list:
+        row = []
+        for column in COLUMNS:
+            value = getattr(country, column)
+            row.append(sorted(value) if column in _SET_COLUMNS else value)
+        return row
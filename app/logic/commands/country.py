@@ -1,14 +1,32 @@
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, fields, replace
+from datetime import datetime
+from typing import Any
+from domain.entities.country import AreaType, CountryEntity
+from infra.indexes.country_catalog import CountryCatalog
+from infra.indexes.country_graph import CountryGraph
 from infra.repositories.api.base import BaseCountryAPIRepository
 from infra.repositories.sql.unit_of_work import IUnitOfWork
+from infra.snapshots.countries import CountrySnapshot
 from logic.commands.base import BaseCommand, CommandHandler
+from logic.exceptions.country import (
+    CountryGraphIncompleteException,
+    CountryNotFoundException,
+    NoLandPathException,
+)
+from utils.shared_state import HostLock, SharedStateFile
 
 
 @dataclass(frozen=True)
 class FetchAndSaveCountriesCommand(BaseCommand):
-    """Command to fetch all countries from API and save them to database."""
+    """Command to fetch all countries and save them to database.
 
-    pass
+    Attributes:
+        from_snapshot: Read the countries from the shipped snapshot file instead of
+            the API, so no network is needed
+    """
+
+    from_snapshot: bool = False
 
 
 @dataclass(frozen=True)
@@ -18,22 +36,399 @@ class FetchAndSaveCountriesCommandHandler(
     """Handler for FetchAndSaveCountriesCommand.
 
     This handler:
-    1. Fetches all countries from the API
-    2. Saves them to the database
-    3. Returns the list of saved countries
+    1. Fetches all countries from the API or reads them from the snapshot
+    2. Loads them into the in-memory country catalog
+    3. Saves the ones missing from the database
     """
 
     country_api_repository: BaseCountryAPIRepository
     uow: IUnitOfWork
+    country_catalog: CountryCatalog
+    country_snapshot: CountrySnapshot
 
     async def handle(self, command: FetchAndSaveCountriesCommand) -> None:
-        # Fetch all countries from API
-        countries = await self.country_api_repository.get_list_of_countries()
+        countries: list[CountryEntity] = (
+            self.country_snapshot.load()
+            if command.from_snapshot
+            else await self.country_api_repository.get_list_of_countries()
+        )
+        self.country_catalog.load(countries)
 
-        # Save all countries to database
+        # Save the countries the database does not have yet
         async with self.uow:
+            existing = {
+                country.iso_alpha2_code
+                for country in await self.uow.country.get_countries(
+                    [country.iso_alpha2_code for country in countries]
+                )
+            }
             for country in countries:
-                await self.uow.country.add_country(country)
-            else:
-                await self.uow.commit()
+                if country.iso_alpha2_code not in existing:
+                    await self.uow.country.add_country(country)
+            await self.uow.commit()
         return None
+
+
+@dataclass(frozen=True)
+class RefreshCountriesCommand(BaseCommand):
+    """Command to revalidate the countries and apply the ones that changed."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class RefreshCountriesCommandHandler(CommandHandler[RefreshCountriesCommand, int]):
+    """Handler for RefreshCountriesCommand.
+
+    One worker per host, the one holding refresh_lock, revalidates the list of
+    countries with a conditional request and writes the added and changed
+    countries. The validators and a revision counter are kept in refresh_state;
+    every worker, the lock holder included, reloads its country catalog from the
+    database when the revision moves past the one it has loaded.
+
+    Every worker schedules the refresh, so the list is only revalidated when no
+    worker of the host did so in the last revalidate_after seconds.
+    """
+
+    country_api_repository: BaseCountryAPIRepository
+    uow: IUnitOfWork
+    country_catalog: CountryCatalog
+    refresh_lock: HostLock
+    refresh_state: SharedStateFile
+    revalidate_after: float = 0.0
+
+    async def handle(self, command: RefreshCountriesCommand) -> int:
+        """Returns the number of countries added or changed by this worker."""
+        with self.refresh_lock.acquire_nowait() as acquired:
+            if not acquired:
+                # Another worker is refreshing; catch up with what it applied before
+                await self._sync_catalog()
+                return 0
+
+            # Changes applied by the previous lock holders are not in the catalog
+            # yet, and a "not modified" answer would not bring them
+            await self._sync_catalog()
+            state = self.refresh_state.read()
+            if time.time() - state.get('checked_at', 0) < self.revalidate_after:
+                return 0
+
+            revision = await self.country_api_repository.revalidate_list_of_countries(
+                etag=state.get('etag'),
+                last_modified=state.get('last_modified'),
+                digest=state.get('digest'),
+            )
+            changed = (
+                await self._apply_changes(revision.countries)
+                if revision.countries is not None
+                else []
+            )
+
+            with self.refresh_state.locked() as state:
+                state.update(
+                    etag=revision.etag,
+                    last_modified=revision.last_modified,
+                    digest=revision.digest,
+                    checked_at=time.time(),
+                )
+                if changed:
+                    state['revision'] = state.get('revision', 0) + 1
+                self.country_catalog.revision = state.get('revision', 0)
+
+        self.country_catalog.load(changed)
+        return len(changed)
+
+    async def _apply_changes(
+        self, countries: list[CountryEntity]
+    ) -> list[CountryEntity]:
+        """Write the countries that are new or differ from the stored ones.
+
+        Args:
+            countries (list[CountryEntity]): All countries of the current revision.
+
+        Returns:
+            list[CountryEntity]: The countries that were added or updated.
+        """
+        changed: list[CountryEntity] = []
+        regrouped = False
+        async with self.uow:
+            stored = {
+                country.iso_alpha2_code: country
+                for country in await self.uow.country.get_countries(
+                    [country.iso_alpha2_code for country in countries]
+                )
+            }
+            for country in countries:
+                current = stored.get(country.iso_alpha2_code)
+                if current is not None and country.iso_alpha3_code is None:
+                    # The list has no alpha-3 codes; keep the ones resolved already
+                    country = replace(country, iso_alpha3_code=current.iso_alpha3_code)
+                if current is None:
+                    await self.uow.country.add_country(country)
+                elif _country_data(current) != _country_data(country):
+                    regrouped = regrouped or any(
+                        current.area(area_type) != country.area(area_type)
+                        for area_type in AreaType
+                    )
+                    country = replace(
+                        country,
+                        created_at=current.created_at,
+                        updated_at=datetime.now(),
+                    )
+                    await self.uow.country.update_country(
+                        country.iso_alpha2_code, country
+                    )
+                else:
+                    continue
+                changed.append(country)
+            await self.uow.commit()
+
+        if regrouped:
+            # Names of the country moved to another region or sub-region; the
+            # full rebuild is left to RebuildAreaPopularityCommand
+            with self.refresh_state.locked() as state:
+                state['area_popularity_stale'] = True
+        return changed
+
+    async def _sync_catalog(self) -> None:
+        revision = self.refresh_state.read().get('revision', 0)
+        if revision <= self.country_catalog.revision:
+            return
+
+        async with self.uow:
+            countries = await self.uow.country.get_countries(
+                self.country_catalog.codes()
+            )
+        self.country_catalog.load(countries)
+        self.country_catalog.revision = revision
+
+
+@dataclass(frozen=True)
+class RebuildAreaPopularityCommand(BaseCommand):
+    """Command to rebuild the area popularity of all names after a country moved
+    to another region or sub-region."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class RebuildAreaPopularityCommandHandler(
+    CommandHandler[RebuildAreaPopularityCommand, bool]
+):
+    """Handler for RebuildAreaPopularityCommand.
+
+    RefreshCountriesCommandHandler marks the rollup stale in refresh_state rather
+    than rebuilding it in its own transaction; the first worker to run this
+    command afterwards claims the mark and rebuilds it, and puts the mark back if
+    the rebuild fails.
+    """
+
+    uow: IUnitOfWork
+    refresh_state: SharedStateFile
+
+    async def handle(self, command: RebuildAreaPopularityCommand) -> bool:
+        """Returns whether the rollup was rebuilt."""
+        with self.refresh_state.locked() as state:
+            if not state.pop('area_popularity_stale', False):
+                return False
+
+        try:
+            async with self.uow:
+                await self.uow.name.refresh_area_popularity(None)
+                await self.uow.commit()
+        except BaseException:
+            with self.refresh_state.locked() as state:
+                state['area_popularity_stale'] = True
+            raise
+        return True
+
+
+def _country_data(country: CountryEntity) -> dict[str, Any]:
+    """Returns the country fields that come from the API, without timestamps."""
+    return {
+        field.name: getattr(country, field.name)
+        for field in fields(CountryEntity)
+        if field.name not in ('created_at', 'updated_at')
+    }
+
+
+@dataclass(frozen=True)
+class RebuildCountryGraphCommand(BaseCommand):
+    """Command to rebuild the land border graph from the stored countries."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class RebuildCountryGraphCommandHandler(
+    CommandHandler[RebuildCountryGraphCommand, int]
+):
+    """Handler for RebuildCountryGraphCommand.
+
+    Borders are listed by alpha-3 code, which the list of countries does not
+    carry; the codes missing from the database are fetched in one request and
+    stored, so this happens once per deployment rather than once per start.
+
+    Countries are only stored once a name or the seed needed them, so when a
+    border leads to no stored country the full list of countries is fetched and
+    the missing ones are stored too. Both fetches are best effort: a failure
+    leaves the graph incomplete until the next rebuild.
+    """
+
+    country_api_repository: BaseCountryAPIRepository
+    uow: IUnitOfWork
+    country_catalog: CountryCatalog
+    country_graph: CountryGraph
+
+    async def handle(self, command: RebuildCountryGraphCommand) -> int:
+        """Returns the number of countries in the graph."""
+        async with self.uow:
+            countries = await self.uow.country.get_all_countries()
+
+        if any(country.iso_alpha3_code is None for country in countries):
+            countries = await self._resolve_alpha3_codes(countries)
+        listed = True
+        if not countries or self._unknown_borders(countries):
+            countries, listed = await self._add_missing_countries(countries)
+
+        self.country_catalog.load(countries)
+        self.country_graph.build(
+            countries,
+            complete=listed and all(country.iso_alpha3_code for country in countries),
+        )
+        return len(countries)
+
+    @staticmethod
+    def _unknown_borders(countries: list[CountryEntity]) -> set[str]:
+        known = {country.iso_alpha3_code for country in countries}
+        return {
+            border
+            for country in countries
+            for border in country.borders
+            if border not in known
+        }
+
+    async def _add_missing_countries(
+        self, countries: list[CountryEntity]
+    ) -> tuple[list[CountryEntity], bool]:
+        """Returns the countries with the missing ones added, and whether the full
+        list of countries could be fetched."""
+        try:
+            listed = await self.country_api_repository.get_list_of_countries()
+        except Exception:
+            # Built from the stored countries for now; the next rebuild retries
+            return countries, False
+
+        stored = {country.iso_alpha2_code for country in countries}
+        missing = [
+            country for country in listed if country.iso_alpha2_code not in stored
+        ]
+        if not missing:
+            return countries, True
+        async with self.uow:
+            # Another worker may have stored some of them meanwhile
+            existing = {
+                country.iso_alpha2_code
+                for country in await self.uow.country.get_countries(
+                    [country.iso_alpha2_code for country in missing]
+                )
+            }
+            for country in missing:
+                if country.iso_alpha2_code not in existing:
+                    await self.uow.country.add_country(country)
+            await self.uow.commit()
+        return await self._resolve_alpha3_codes(countries + missing), True
+
+    async def _resolve_alpha3_codes(
+        self, countries: list[CountryEntity]
+    ) -> list[CountryEntity]:
+        try:
+            alpha3_codes = await self.country_api_repository.get_alpha3_codes()
+        except Exception:
+            # Built without their borders for now; the next rebuild retries
+            return countries
+
+        resolved: list[CountryEntity] = []
+        async with self.uow:
+            for country in countries:
+                code = alpha3_codes.get(country.iso_alpha2_code)
+                if country.iso_alpha3_code is None and code:
+                    country = replace(country, iso_alpha3_code=code)
+                    await self.uow.country.update_country(
+                        country.iso_alpha2_code, country
+                    )
+                resolved.append(country)
+            await self.uow.commit()
+        return resolved
+
+
+@dataclass(frozen=True)
+class GetCountryNeighborsCommand(BaseCommand):
+    iso_alpha2_code: str
+    hops: int = 1
+
+
+@dataclass(frozen=True)
+class GetCountryNeighborsCommandHandler(
+    CommandHandler[GetCountryNeighborsCommand, list[list[CountryEntity]]]
+):
+    """Handler for GetCountryNeighborsCommand; answered from memory."""
+
+    country_catalog: CountryCatalog
+    country_graph: CountryGraph
+
+    async def handle(
+        self, command: GetCountryNeighborsCommand
+    ) -> list[list[CountryEntity]]:
+        """Returns the countries first reached after one, two, ... borders.
+
+        Raises:
+            CountryNotFoundException: If the country is not in the graph.
+        """
+        code = command.iso_alpha2_code.strip().upper()
+        if code not in self.country_graph:
+            raise CountryNotFoundException(iso_alpha2_code=code)
+
+        return [
+            list(self.country_catalog.get_many(level).values())
+            for level in self.country_graph.neighbors(code, hops=command.hops)
+        ]
+
+
+@dataclass(frozen=True)
+class GetCountryPathCommand(BaseCommand):
+    source: str
+    target: str
+
+
+@dataclass(frozen=True)
+class GetCountryPathCommandHandler(
+    CommandHandler[GetCountryPathCommand, list[CountryEntity]]
+):
+    """Handler for GetCountryPathCommand; answered from memory."""
+
+    country_catalog: CountryCatalog
+    country_graph: CountryGraph
+
+    async def handle(self, command: GetCountryPathCommand) -> list[CountryEntity]:
+        """Returns the countries of a shortest land path, source and target included.
+
+        Raises:
+            CountryNotFoundException: If either country is not in the graph.
+            NoLandPathException: If no land path joins the countries.
+            CountryGraphIncompleteException: If no land path was found but some
+                borders lead to countries missing from the graph.
+        """
+        source = command.source.strip().upper()
+        target = command.target.strip().upper()
+        for code in (source, target):
+            if code not in self.country_graph:
+                raise CountryNotFoundException(iso_alpha2_code=code)
+
+        path = self.country_graph.path(source, target)
+        if path is None and self.country_graph.unknown_borders:
+            raise CountryGraphIncompleteException(
+                unknown_borders=sorted(self.country_graph.unknown_borders)
+            )
+        if path is None:
+            raise NoLandPathException(source=source, target=target)
+        return list(self.country_catalog.get_many(path).values())
@@ -0,0 +1,269 @@
+import asyncio
+import itertools
+from collections.abc import AsyncIterable, Iterable
+from dataclasses import dataclass, replace
+from datetime import datetime
+from pathlib import Path
+
+import orjson
+
+from domain.entities.job import JobEntity, JobStatus
+from domain.entities.name import NameEntity
+from domain.exceptions.base import ApplicationException
+from infra.exceptions.upstream import UpstreamUnavailableException
+from infra.files.jobs import JobFileStore
+from infra.repositories.api.quota import background_priority
+from infra.repositories.sql.unit_of_work import IUnitOfWork
+from logic.commands.base import BaseCommand, CommandHandler
+from logic.commands.name import GetNameOriginsCommand, GetNameOriginsCommandHandler
+from logic.exceptions.job import (
+    EmptyJobException,
+    JobNotCompletedException,
+    JobNotFoundException,
+)
+from utils.workers import WorkerPool
+
+
+@dataclass(frozen=True)
+class CreateNamesJobCommand(BaseCommand):
+    """Command to create a bulk enrichment job.
+
+    Attributes:
+        names: The names to resolve, read while they are written to the job input
+    """
+
+    names: AsyncIterable[str]
+
+
+@dataclass(frozen=True)
+class CreateNamesJobCommandHandler(CommandHandler[CreateNamesJobCommand, JobEntity]):
+    """Handler for CreateNamesJobCommand.
+
+    The names are written to the input file of the job as they arrive, then the job
+    is stored as pending and submitted to the worker pool.
+    """
+
+    uow: IUnitOfWork
+    files: JobFileStore
+    worker_pool: WorkerPool
+    max_upload_bytes: int = 64 * 1024 * 1024
+
+    async def handle(self, command: CreateNamesJobCommand) -> JobEntity:
+        job = JobEntity(total_names=0)
+        total_names = await self.files.write_input(
+            job.id, command.names, self.max_upload_bytes
+        )
+        if not total_names:
+            self.files.delete(job.id)
+            raise EmptyJobException()
+
+        job.total_names = total_names
+        try:
+            async with self.uow:
+                await self.uow.job.add_job(job)
+                await self.uow.commit()
+        except BaseException:
+            self.files.delete(job.id)
+            raise
+
+        self.worker_pool.submit(job.id)
+        return job
+
+
+@dataclass(frozen=True)
+class GetNamesJobCommand(BaseCommand):
+    job_id: str
+
+
+@dataclass(frozen=True)
+class GetNamesJobCommandHandler(CommandHandler[GetNamesJobCommand, JobEntity]):
+    uow: IUnitOfWork
+
+    async def handle(self, command: GetNamesJobCommand) -> JobEntity:
+        async with self.uow:
+            job = await self.uow.job.get_job(command.job_id)
+        if job is None:
+            raise JobNotFoundException(job_id=command.job_id)
+        return job
+
+
+@dataclass(frozen=True)
+class GetNamesJobResultsCommand(BaseCommand):
+    job_id: str
+
+
+@dataclass(frozen=True)
+class GetNamesJobResultsCommandHandler(CommandHandler[GetNamesJobResultsCommand, Path]):
+    """Handler for GetNamesJobResultsCommand; returns the results file of a job."""
+
+    uow: IUnitOfWork
+    files: JobFileStore
+
+    async def handle(self, command: GetNamesJobResultsCommand) -> Path:
+        async with self.uow:
+            job = await self.uow.job.get_job(command.job_id)
+        if job is None:
+            raise JobNotFoundException(job_id=command.job_id)
+        if job.status != JobStatus.COMPLETED:
+            raise JobNotCompletedException(job_id=job.id, status=job.status.value)
+        return self.files.results_path(job.id)
+
+
+@dataclass(frozen=True)
+class RunNamesJobCommand(BaseCommand):
+    job_id: str
+
+
+@dataclass(frozen=True)
+class RunNamesJobCommandHandler(CommandHandler[RunNamesJobCommand, JobEntity | None]):
+    """Handler for RunNamesJobCommand.
+
+    The names of the job are resolved through GetNameOriginsCommandHandler at
+    background priority, chunk_size at a time with at most concurrency lookups in
+    flight, so the quota reserve of interactive lookups is left alone. After each
+    chunk, its result lines are synced to the results file and the progress is
+    checkpointed in the database; a job that was interrupted resumes after its
+    last checkpoint. Names the upstream could not serve because it is unavailable
+    or out of quota are retried after the delay it asked for, other failures are
+    written as error lines.
+
+    The worker holding the lock of the job runs it; others return None at once.
+    """
+
+    get_name_origins_handler: GetNameOriginsCommandHandler
+    uow: IUnitOfWork
+    files: JobFileStore
+    chunk_size: int = 100
+    concurrency: int = 8
+    retry_delay: float = 1.0  # When the upstream gives no Retry-After
+    max_retry_delay: float = 60.0
+
+    async def handle(self, command: RunNamesJobCommand) -> JobEntity | None:
+        """Returns the job as it was left, None if another worker is running it."""
+        with self.files.lock(command.job_id).acquire_nowait() as acquired:
+            if not acquired:
+                return None
+
+            async with self.uow:
+                job = await self.uow.job.get_job(command.job_id)
+            if job is None or job.finished:
+                return job
+
+            try:
+                with background_priority():
+                    await self._run(job)
+            except Exception as exception:
+                job.status = JobStatus.FAILED
+                job.error = (
+                    exception.message
+                    if isinstance(exception, ApplicationException)
+                    else 'Internal error'
+                )
+                await self._checkpoint(job)
+                if not isinstance(exception, ApplicationException):
+                    raise
+            return job
+
+    async def _run(self, job: JobEntity) -> None:
+        job.status = JobStatus.RUNNING
+        await self._checkpoint(job)
+
+        names = self.files.iter_input(job.id, start=job.processed_names)
+        with self.files.open_results(job.id, job.results_offset) as results:
+            while chunk := await asyncio.to_thread(
+                lambda: list(itertools.islice(names, self.chunk_size))
+            ):
+                lines, failed = await self._resolve_chunk(chunk)
+                job.results_offset = await self.files.append(results, b''.join(lines))
+                job.processed_names += len(chunk)
+                job.failed_names += failed
+                await self._checkpoint(job)
+
+        job.status = JobStatus.COMPLETED
+        await self._checkpoint(job)
+
+    async def _resolve_chunk(self, names: list[str]) -> tuple[list[bytes], int]:
+        """Resolve a chunk of names, waiting out upstream outages.
+
+        Returns:
+            tuple[list[bytes], int]: One result line per name, in the order of the
+                names, and the number of names that failed.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        lines: dict[int, bytes] = {}
+        failed: set[int] = set()
+        retry_after: list[float] = []
+
+        async def resolve(index: int, name: str) -> None:
+            async with semaphore:
+                try:
+                    name_origins = await self.get_name_origins_handler.handle(
+                        GetNameOriginsCommand(name=name)
+                    )
+                except UpstreamUnavailableException as exception:
+                    retry_after.append(exception.retry_after or self.retry_delay)
+                    return
+                except ApplicationException as exception:
+                    failed.add(index)
+                    lines[index] = _result_line(
+                        {'name': name, 'error': exception.message}
+                    )
+                    return
+            lines[index] = _result_line(
+                {'name': name, 'origins': _dump_origins(name_origins)}
+            )
+
+        while len(lines) < len(names):
+            retry_after.clear()
+            await asyncio.gather(
+                *(
+                    resolve(index, name)
+                    for index, name in enumerate(names)
+                    if index not in lines
+                )
+            )
+            if retry_after:
+                await asyncio.sleep(min(max(retry_after), self.max_retry_delay))
+
+        return [lines[index] for index in range(len(names))], len(failed)
+
+    async def _checkpoint(self, job: JobEntity) -> None:
+        job.updated_at = datetime.now()
+        async with self.uow:
+            await self.uow.job.update_job(replace(job))
+            await self.uow.commit()
+
+
+@dataclass(frozen=True)
+class ResumeNamesJobsCommand(BaseCommand):
+    """Command to submit the unfinished jobs, e.g. after a restart."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class ResumeNamesJobsCommandHandler(CommandHandler[ResumeNamesJobsCommand, int]):
+    uow: IUnitOfWork
+    worker_pool: WorkerPool
+
+    async def handle(self, command: ResumeNamesJobsCommand) -> int:
+        """Returns the number of jobs submitted to the worker pool."""
+        async with self.uow:
+            jobs = await self.uow.job.get_unfinished_jobs()
+        return sum(1 for job in jobs if self.worker_pool.submit(job.id))
+
+
+def _dump_origins(name_origins: Iterable[NameEntity]) -> list[dict]:
+    return [
+        {
+            'country_code': name_origin.country.iso_alpha2_code,
+            'country': name_origin.country.country_name,
+            'probability': name_origin.probability.as_generic_type(),
+            'count_of_requests': name_origin.count_of_requests.as_generic_type(),
+        }
+        for name_origin in name_origins
+    ]
+
+
+def _result_line(result: dict) -> bytes:
+    return orjson.dumps(result) + b'\n'
@@ -1,139 +1,313 @@
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+import asyncio
+from collections.abc import Iterable
+from dataclasses import (
+    dataclass,
+    field,
+)
+from datetime import (
+    datetime,
+    timedelta,
+)
 
-from domain.entities.country import CountryEntity
-from domain.entities.name import NameEntity, NameStrEntity
+from domain.entities.country import (
+    AreaType,
+    CountryEntity,
+)
+from domain.entities.name import (
+    AreaNameEntity,
+    NameEntity,
+    NamesPageEntity,
+    NameStrEntity,
+    NameSuggestionEntity,
+)
+from domain.exceptions.base import ApplicationException
+from domain.values.cursor import PageCursor
+from domain.values.name import Name
+from infra.exceptions.upstream import UpstreamUnavailableException
+from infra.indexes.country_catalog import CountryCatalog
+from infra.indexes.hot_names import HotNameTracker
+from infra.indexes.name_fuzzy import NameFuzzyIndex
+from infra.indexes.name_prefix import NamePrefixIndex
 from infra.repositories.api.base import (
     BaseCountryAPIRepository,
     BaseNameOriginAPIRepository,
 )
+from infra.repositories.api.quota import (
+    background_priority,
+    QuotaManager,
+)
 from infra.repositories.sql.unit_of_work import IUnitOfWork
-from logic.commands.base import BaseCommand, CommandHandler
-from logic.exceptions.country import CountryNotFoundException
+from logic.commands.base import (
+    BaseCommand,
+    CommandHandler,
+)
+from logic.exceptions.country import (
+    AreaNotFoundException,
+    CountriesFetchTimeoutException,
+    CountryNotFoundException,
+)
 from logic.exceptions.name import NameNotFoundException
+from utils.deadline import remaining
+from utils.rate_limit import record_upstream_lookups
 
 
 @dataclass(frozen=True)
 class GetNameOriginsCommand(BaseCommand):
     name: str
+    # Stored origins are refetched unless they stay fresh for at least this long
+    min_freshness: timedelta = timedelta(0)
+    # Serve the stored origins of the closest known name instead of the upstream's
+    fuzzy: bool = False
+    # Name the closest known name in the NameNotFoundException
+    suggest: bool = False
 
 
 @dataclass(frozen=True)
-class GetNameOriginsCommandHandler(
-    CommandHandler[GetNameOriginsCommand, list[NameEntity]]
-):
+class BaseNameOriginsCommandHandler:
+    """Dependencies and steps shared by the name origin lookup handlers."""
+
     name_origin_api_repository: BaseNameOriginAPIRepository
     country_api_repository: BaseCountryAPIRepository
     uow: IUnitOfWork
-
-    async def handle(self, command: GetNameOriginsCommand) -> list[NameEntity]:
-        name_origins_sql: list[NameEntity] | None = await self._get_names_origins_db(
-            command.name
+    country_batch_size: int = 10  # Codes per REST Countries `alpha?codes=` call
+    country_fetch_concurrency: int = 4  # Country API calls in flight at once
+    country_fetch_timeout: float = 5.0  # Budget for fetching all missing countries
+    country_catalog: CountryCatalog = field(default_factory=CountryCatalog)
+    freshness: timedelta = timedelta(days=1)  # How long stored origins are served
+    hot_names: HotNameTracker = field(default_factory=HotNameTracker)
+    name_prefix_index: NamePrefixIndex = field(default_factory=NamePrefixIndex)
+    name_fuzzy_index: NameFuzzyIndex = field(default_factory=NameFuzzyIndex)
+
+    def _is_fresh(
+        self, name_origins: list[NameEntity] | None, min_freshness: timedelta
+    ) -> bool:
+        """Whether stored origins stay fresh for at least min_freshness."""
+        return bool(
+            name_origins
+            and name_origins[0].last_accessed_at
+            and (datetime.now() + min_freshness - name_origins[0].last_accessed_at)
+            < self.freshness
         )
-        if (
-            name_origins_sql
-            and name_origins_sql[0].last_accessed_at
-            and (datetime.now() - name_origins_sql[0].last_accessed_at)
-            < timedelta(days=1)
-        ):
-            return name_origins_sql
-
-        name_origins_from_api: (
-            list[NameStrEntity] | None
-        ) = await self.name_origin_api_repository.get_name_origins(name=command.name)
-        if not name_origins_from_api:
-            raise NameNotFoundException(name=command.name)
 
-        name_origins_with_country_entity: list[NameEntity] = []
+    def _to_entities(
+        self,
+        name: Name,
+        name_origins: list[NameStrEntity],
+        countries: dict[str, CountryEntity],
+    ) -> list[NameEntity]:
+        """Join the origins from the API with their countries.
 
-        for name_str_entity in name_origins_from_api:
-            country_info: CountryEntity | None = await self._get_country_info_db(
-                name=name_str_entity.country_name
+        Raises:
+            CountryNotFoundException: If the country of an origin was not found.
+        """
+        name_entities: list[NameEntity] = []
+        for name_str_entity in name_origins:
+            country_info: CountryEntity | None = countries.get(
+                name_str_entity.country_name
             )
-
-            # If not found in SQL, try API and cache the result
             if not country_info:
-                country_info = await self.country_api_repository.get_country(
-                    name_str_entity.country_name
+                raise CountryNotFoundException(
+                    iso_alpha2_code=name_str_entity.country_name
                 )
-                if not country_info:
-                    raise CountryNotFoundException(
-                        iso_alpha2_code=name_str_entity.country_name
-                    )
-                await self._save_country_to_db(country_info)
 
-            name_entity = NameEntity(
-                name=name_str_entity.name,
-                count_of_requests=name_str_entity.count_of_requests,
-                probability=name_str_entity.probability,
-                country=country_info,
+            name_entities.append(
+                NameEntity(
+                    name=name,
+                    count_of_requests=name_str_entity.count_of_requests,
+                    probability=name_str_entity.probability,
+                    country=country_info,
+                )
             )
-            if name_origins_sql:
-                # If the row exists in db, we just updat the record
-                await self._update_name_db(name_entity=name_entity)
-
-            else:
-                # If there is not records with this name, we add a new one
-                await self._save_name_to_db(name_entity=name_entity)
-
-            name_origins_with_country_entity.append(name_entity)
 
         return sorted(
-            name_origins_with_country_entity,
+            name_entities,
             key=lambda x: x.probability.as_generic_type(),
             reverse=True,
         )
 
-    async def _save_country_to_db(self, country_info: CountryEntity) -> None:
-        """Save country information to the database.
+    def _track(self, name: Name, accessed_at: datetime) -> None:
+        """Count the lookup for refresh-ahead of hot names."""
+        self.hot_names.record(
+            name.canonical, name.as_generic_type(), accessed_at + self.freshness
+        )
+
+    async def _get_countries(self, codes: list[str]) -> dict[str, CountryEntity]:
+        """Get countries from the catalog or the database, fetching the missing ones.
 
         Args:
-            country_info (CountryEntity): The country entity to save.
+            codes (list[str]): The ISO alpha-2 codes of the countries.
+
+        Returns:
+            dict[str, CountryEntity]: The countries that were found, keyed by code.
         """
+        countries = self.country_catalog.get_many(codes)
+        missing = [code for code in dict.fromkeys(codes) if code not in countries]
+        if not missing:
+            return countries
+
         async with self.uow:
-            await self.uow.country.add_country(country_info)
-            await self.uow.commit()
+            stored = await self.uow.country.get_countries(missing)
+        self.country_catalog.load(stored)
+        countries.update({country.iso_alpha2_code: country for country in stored})
 
-        return None
+        missing = [code for code in missing if code not in countries]
+        if missing:
+            fetched = await self._fetch_countries_api(missing)
+            if fetched:
+                await self._save_countries_to_db(fetched)
+                self.country_catalog.load(fetched)
+            countries.update({country.iso_alpha2_code: country for country in fetched})
 
-    async def _save_name_to_db(self, name_entity: NameEntity) -> None:
-        """Save name information to the database.
+        return countries
+
+    async def _fetch_countries_api(self, codes: list[str]) -> list[CountryEntity]:
+        """Fetch countries from the API concurrently.
+
+        Codes are fetched in chunks of country_batch_size, with at most
+        country_fetch_concurrency calls in flight and one country_fetch_timeout
+        budget for all of them, capped by the request deadline.
+
+        Args:
+            codes (list[str]): The ISO alpha-2 codes of the countries to fetch.
+
+        Returns:
+            list[CountryEntity]: The countries that were found.
+
+        Raises:
+            CountriesFetchTimeoutException: If the countries were not fetched in time.
+        """
+        semaphore = asyncio.Semaphore(self.country_fetch_concurrency)
+
+        async def fetch(chunk: list[str]) -> list[CountryEntity]:
+            async with semaphore:
+                return await self.country_api_repository.get_countries(chunk)
+
+        try:
+            async with asyncio.timeout(remaining(self.country_fetch_timeout)):
+                async with asyncio.TaskGroup() as task_group:
+                    tasks = [
+                        task_group.create_task(
+                            fetch(codes[start : start + self.country_batch_size])
+                        )
+                        for start in range(0, len(codes), self.country_batch_size)
+                    ]
+        except TimeoutError as exception:
+            raise CountriesFetchTimeoutException(iso_alpha2_codes=codes) from exception
+        except ExceptionGroup as exception_group:
+            raise exception_group.exceptions[0] from exception_group
+
+        return [country for task in tasks for country in task.result()]
+
+    async def _save_countries_to_db(self, countries: list[CountryEntity]) -> None:
+        """Save countries information to the database.
 
         Args:
-            name (NameEntity): The country entity to save.
+            countries (list[CountryEntity]): The country entities to save.
         """
         async with self.uow:
-            await self.uow.name.add_name_origin(name_origin=name_entity)
+            for country_info in countries:
+                await self.uow.country.add_country(country_info)
             await self.uow.commit()
 
         return None
 
-    async def _update_name_db(self, name_entity: NameEntity) -> None:
-        """Update name information in database.
+    async def _save_names_to_db(
+        self, name_entities: dict[str, list[NameEntity]], existing: Iterable[str]
+    ) -> None:
+        """Save the origins of names and their area popularity in one transaction.
 
         Args:
-            name (NameEntity): The name entity to update.
+            name_entities (dict[str, list[NameEntity]]): The origins, by name key.
+            existing (Iterable[str]): Keys of the names already stored, which are
+                updated instead of added.
         """
+        if not name_entities:
+            return None
+
+        existing = set(existing)
         async with self.uow:
-            await self.uow.name.update_name_origin(name_origin=name_entity)
+            for key, entities in name_entities.items():
+                for name_entity in entities:
+                    if key in existing:
+                        await self.uow.name.update_name_origin(name_origin=name_entity)
+                    else:
+                        await self.uow.name.add_name_origin(name_origin=name_entity)
+            # Same transaction, so the area rollup never drifts from the origins
+            await self.uow.name.refresh_area_popularity(list(name_entities))
             await self.uow.commit()
 
+        for key, entities in name_entities.items():
+            if entities:
+                display_name = entities[0].name.as_generic_type()
+                count_of_requests = entities[0].count_of_requests.as_generic_type()
+                self.name_prefix_index.put(key, display_name, count_of_requests)
+                self.name_fuzzy_index.put(key, display_name, count_of_requests)
         return None
 
-    async def _get_country_info_db(self, name: str) -> CountryEntity | None:
-        """Get country information from SQL repository.
 
-        Args:
-            name (str): The country name to fetch.
+@dataclass(frozen=True)
+class GetNameOriginsCommandHandler(
+    BaseNameOriginsCommandHandler,
+    CommandHandler[GetNameOriginsCommand, list[NameEntity]],
+):
+    async def handle(self, command: GetNameOriginsCommand) -> list[NameEntity]:
+        name = Name(value=command.name.strip())
+        name_origins_sql: list[NameEntity] | None = await self._get_names_origins_db(
+            name.canonical
+        )
+        if self._is_fresh(name_origins_sql, command.min_freshness):
+            self._track(name, name_origins_sql[0].last_accessed_at)
+            return name_origins_sql
 
-        Returns:
-            CountryEntity | None: The country entity if found, None otherwise.
-        """
-        async with self.uow:
-            country_info: CountryEntity | None = await self.uow.country.get_country(
-                name
+        match: NameSuggestionEntity | None = None
+        searched = command.fuzzy and not name_origins_sql
+        if searched:
+            match = await self._closest(name)
+            if match:
+                match_origins = await self._get_names_origins_db(match.key)
+                if match_origins:
+                    return match_origins
+
+        record_upstream_lookups(1)
+        try:
+            name_origins_from_api: (
+                list[NameStrEntity] | None
+            ) = await self.name_origin_api_repository.get_name_origins(
+                name=name.canonical
+            )
+        except UpstreamUnavailableException:
+            # Serve stale rows rather than failing while the upstream is down
+            if name_origins_sql:
+                if name_origins_sql[0].last_accessed_at:
+                    self._track(name, name_origins_sql[0].last_accessed_at)
+                return name_origins_sql
+            raise
+
+        if not name_origins_from_api:
+            if command.suggest and not searched:
+                match = await self._closest(name)
+            raise NameNotFoundException(
+                name=command.name,
+                suggestion=match.name if command.suggest and match else None,
             )
-            return country_info
+
+        countries: dict[str, CountryEntity] = await self._get_countries(
+            [name_str_entity.country_name for name_str_entity in name_origins_from_api]
+        )
+        name_entities = self._to_entities(name, name_origins_from_api, countries)
+
+        # Rows of a name that is stored already are updated, others are added
+        await self._save_names_to_db(
+            {name.canonical: name_entities},
+            existing=[name.canonical] if name_origins_sql else [],
+        )
+
+        self._track(name, datetime.now())
+        return name_entities
+
+    async def _closest(self, name: Name) -> NameSuggestionEntity | None:
+        """Find the closest known name in a worker thread, off the event loop."""
+        return await asyncio.to_thread(self.name_fuzzy_index.closest, name.canonical)
 
     async def _get_names_origins_db(self, name: str) -> list[NameEntity] | None:
         """Get name origins from UoW repository.
@@ -148,22 +322,299 @@ class GetNameOriginsCommandHandler(
             return await self.uow.name.get_name_origins(name=name)
 
 
+@dataclass(frozen=True)
+class GetBatchNameOriginsCommand(BaseCommand):
+    names: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class GetBatchNameOriginsCommandHandler(
+    BaseNameOriginsCommandHandler,
+    CommandHandler[
+        GetBatchNameOriginsCommand,
+        dict[str, list[NameEntity] | ApplicationException],
+    ],
+):
+    """Handler for GetBatchNameOriginsCommand.
+
+    The names are looked up together: one query for the stored origins, one
+    batched upstream call for the stale or missing ones, one country lookup for
+    all of their codes and one transaction to save them. A name that fails does
+    not fail the batch; its exception is returned in place of its origins.
+
+    Upstream misses are sent in chunks of upstream_batch_size, so a batch spends
+    the upstream quota a bit at a time and the chunks fetched before the quota
+    runs out are still saved.
+    """
+
+    upstream_batch_size: int = 10
+
+    async def handle(
+        self, command: GetBatchNameOriginsCommand
+    ) -> dict[str, list[NameEntity] | ApplicationException]:
+        """Returns the origins, or the error, of every name keyed by the input name."""
+        results: dict[str, list[NameEntity] | ApplicationException] = {}
+        names: dict[str, Name] = {}
+        inputs_by_key: dict[str, list[str]] = {}
+        for raw_name in dict.fromkeys(command.names):
+            try:
+                name = Name(value=raw_name.strip())
+            except ApplicationException as exception:
+                results[raw_name] = exception
+                continue
+            names.setdefault(name.canonical, name)
+            inputs_by_key.setdefault(name.canonical, []).append(raw_name)
+
+        origins_by_key = await self._resolve(names)
+        for key, raw_names in inputs_by_key.items():
+            for raw_name in raw_names:
+                results[raw_name] = origins_by_key[key]
+
+        return results
+
+    async def _resolve(
+        self, names: dict[str, Name]
+    ) -> dict[str, list[NameEntity] | ApplicationException]:
+        if not names:
+            return {}
+
+        async with self.uow:
+            stored = await self.uow.name.get_names_origins(list(names))
+
+        resolved: dict[str, list[NameEntity] | ApplicationException] = {}
+        stale: list[str] = []
+        for key, name in names.items():
+            if self._is_fresh(stored.get(key), timedelta(0)):
+                self._track(name, stored[key][0].last_accessed_at)
+                resolved[key] = stored[key]
+            else:
+                stale.append(key)
+        if not stale:
+            return resolved
+
+        fetched: dict[str, list[NameStrEntity] | None] = {}
+        for start in range(0, len(stale), self.upstream_batch_size):
+            chunk = stale[start : start + self.upstream_batch_size]
+            record_upstream_lookups(len(chunk))
+            try:
+                fetched.update(
+                    await self.name_origin_api_repository.get_batch_name_origins(chunk)
+                )
+            except UpstreamUnavailableException as exception:
+                # Serve stale rows rather than failing while the upstream is down
+                for key in stale[start:]:
+                    resolved[key] = stored.get(key) or exception
+                stale = stale[:start]
+                break
+
+        try:
+            countries = await self._get_countries(
+                [
+                    name_str_entity.country_name
+                    for key in stale
+                    for name_str_entity in fetched.get(key) or []
+                ]
+            )
+        except ApplicationException as exception:
+            # The countries could not be fetched in time; only the names with
+            # origins needed them, so they get stale rows or the error
+            for key in stale:
+                if fetched.get(key):
+                    resolved[key] = stored.get(key) or exception
+            stale = [key for key in stale if not fetched.get(key)]
+            countries = {}
+
+        to_save: dict[str, list[NameEntity]] = {}
+        for key in stale:
+            name = names[key]
+            if not fetched.get(key):
+                resolved[key] = NameNotFoundException(name=name.as_generic_type())
+                continue
+            try:
+                to_save[key] = self._to_entities(name, fetched[key], countries)
+            except ApplicationException as exception:
+                resolved[key] = exception
+                continue
+            resolved[key] = to_save[key]
+
+        await self._save_names_to_db(to_save, existing=stored.keys())
+        accessed_at = datetime.now()
+        for key in to_save:
+            self._track(names[key], accessed_at)
+        return resolved
+
+
+@dataclass(frozen=True)
+class RefreshHotNamesCommand(BaseCommand):
+    """Command to refetch the hottest names before their stored origins expire."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class RefreshHotNamesCommandHandler(CommandHandler[RefreshHotNamesCommand, int]):
+    """Handler for RefreshHotNamesCommand.
+
+    Of the top hottest names, the ones expiring within refresh_window are looked
+    up again at background priority, soonest first, while the Nationalize bucket
+    is at least min_spare_tokens full. This uses spare quota only, and the
+    background reserve of the quota keeps calls for interactive lookups.
+    """
+
+    get_name_origins_handler: GetNameOriginsCommandHandler
+    quota: QuotaManager | None = None
+    top: int = 100
+    refresh_window: timedelta = timedelta(hours=1)
+    max_refreshes: int = 20  # Lookups per run
+    min_spare_tokens: float = 0.5  # Share of the bucket that must be full
+
+    async def handle(self, command: RefreshHotNamesCommand) -> int:
+        """Returns the number of names refreshed."""
+        hot_names = self.get_name_origins_handler.hot_names
+        due = hot_names.due(top=self.top, before=datetime.now() + self.refresh_window)
+
+        refreshed = 0
+        with background_priority():
+            for key, name in due[: self.max_refreshes]:
+                if not await self._has_spare_quota():
+                    break
+                try:
+                    await self.get_name_origins_handler.handle(
+                        GetNameOriginsCommand(
+                            name=name, min_freshness=self.refresh_window
+                        )
+                    )
+                except UpstreamUnavailableException:
+                    break
+                except ApplicationException:
+                    # The name has no origins any more
+                    hot_names.forget(key)
+                    continue
+                refreshed += 1
+
+        hot_names.decay()
+        return refreshed
+
+    async def _has_spare_quota(self) -> bool:
+        if self.quota is None:
+            return True
+        snapshot = await self.quota.snapshot()
+        return snapshot['tokens'] >= snapshot['burst'] * self.min_spare_tokens
+
+
 @dataclass(frozen=True)
 class GetFrequentNamesCountryCommand(BaseCommand):
     country_name: str
+    limit: int = 5
+    cursor: str | None = None
 
 
 @dataclass(frozen=True)
 class GetFrequentNamesCountryCommandHandler(
-    CommandHandler[GetFrequentNamesCountryCommand, list[NameEntity] | None]
+    CommandHandler[GetFrequentNamesCountryCommand, NamesPageEntity]
+):
+    uow: IUnitOfWork
+
+    async def handle(self, command: GetFrequentNamesCountryCommand) -> NamesPageEntity:
+        cursor = PageCursor(value=command.cursor) if command.cursor else None
+        async with self.uow:
+            return await self.uow.name.get_frequent_names_by_country(
+                command.country_name,
+                limit=command.limit,
+                cursor=cursor,
+            )
+
+
+@dataclass(frozen=True)
+class GetPopularNamesByAreaCommand(BaseCommand):
+    area: str
+    area_type: AreaType = AreaType.REGION
+    limit: int = 5
+
+
+@dataclass(frozen=True)
+class GetPopularNamesByAreaCommandHandler(
+    CommandHandler[GetPopularNamesByAreaCommand, list[AreaNameEntity]]
 ):
+    """Handler for GetPopularNamesByAreaCommand.
+
+    The area is matched to the spelling stored for its countries through the
+    country catalog, then its names are read from the area popularity rollup.
+    """
+
     uow: IUnitOfWork
+    country_catalog: CountryCatalog
+
+    async def handle(
+        self, command: GetPopularNamesByAreaCommand
+    ) -> list[AreaNameEntity]:
+        area = (
+            self.country_catalog.find_area(command.area_type, command.area)
+            or command.area.strip()
+        )
+        async with self.uow:
+            names = await self.uow.name.get_popular_names_by_area(
+                command.area_type, area, limit=command.limit
+            )
+        if not names:
+            raise AreaNotFoundException(area=command.area)
+        return names
+
+
+@dataclass(frozen=True)
+class GetNameSuggestionsCommand(BaseCommand):
+    prefix: str
+    limit: int = 10
+
+
+@dataclass(frozen=True)
+class GetNameSuggestionsCommandHandler(
+    CommandHandler[GetNameSuggestionsCommand, list[NameSuggestionEntity]]
+):
+    """Handler for GetNameSuggestionsCommand; completes a prefix from memory."""
+
+    name_prefix_index: NamePrefixIndex
 
     async def handle(
-        self, command: GetFrequentNamesCountryCommand
-    ) -> list[NameEntity] | None:
+        self, command: GetNameSuggestionsCommand
+    ) -> list[NameSuggestionEntity]:
+        prefix = Name(value=command.prefix).canonical
+        return self.name_prefix_index.complete(prefix, limit=command.limit)
+
+
+@dataclass(frozen=True)
+class RebuildNamePrefixIndexCommand(BaseCommand):
+    """Command to reload the prefix and fuzzy name indexes from the database.
+
+    Names stored by the other worker processes reach the indexes of this one when
+    they are rebuilt.
+    """
+
+    pass
+
+
+@dataclass(frozen=True)
+class RebuildNamePrefixIndexCommandHandler(
+    CommandHandler[RebuildNamePrefixIndexCommand, int]
+):
+    uow: IUnitOfWork
+    name_prefix_index: NamePrefixIndex
+    name_fuzzy_index: NameFuzzyIndex
+    page_size: int = 10000
+
+    async def handle(self, command: RebuildNamePrefixIndexCommand) -> int:
+        """Returns the number of names indexed."""
+        names: list[NameSuggestionEntity] = []
         async with self.uow:
-            names: (
-                list[NameEntity] | None
-            ) = await self.uow.name.get_frequent_names_by_country(command.country_name)
-            return names
+            while True:
+                page = await self.uow.name.get_name_suggestions(
+                    after=names[-1].key if names else None, limit=self.page_size
+                )
+                names.extend(page)
+                if len(page) < self.page_size:
+                    break
+        self.name_prefix_index.load(names)
+        # Building the fuzzy tables is CPU-bound; only the swap runs on the loop
+        tables = await asyncio.to_thread(NameFuzzyIndex.prepare, names)
+        self.name_fuzzy_index.install(tables)
+        return len(names)
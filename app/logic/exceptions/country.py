@@ -10,3 +10,43 @@ class CountryNotFoundException(LogicException):
     @property
     def message(self) -> str:
         return f'Country with code "{self.iso_alpha2_code}" not found'
+
+
+@dataclass(eq=False)
+class CountriesFetchTimeoutException(LogicException):
+    iso_alpha2_codes: list[str]
+
+    @property
+    def message(self) -> str:
+        return f'Timed out fetching countries {", ".join(self.iso_alpha2_codes)}'
+
+
+@dataclass(eq=False)
+class AreaNotFoundException(LogicException):
+    area: str
+
+    @property
+    def message(self) -> str:
+        return f'No names found for area "{self.area}"'
+
+
+@dataclass(eq=False)
+class NoLandPathException(LogicException):
+    source: str
+    target: str
+
+    @property
+    def message(self) -> str:
+        return f'No land path between "{self.source}" and "{self.target}"'
+
+
+@dataclass(eq=False)
+class CountryGraphIncompleteException(LogicException):
+    unknown_borders: list[str]
+
+    @property
+    def message(self) -> str:
+        return (
+            'Land borders lead to countries not loaded yet '
+            f'({", ".join(self.unknown_borders)}); retry later'
+        )
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+from logic.exceptions.base import LogicException
+
+
+@dataclass(eq=False)
+class DeadlineExceededException(LogicException):
+    command_name: str
+
+    @property
+    def message(self) -> str:
+        return f'Deadline exceeded while handling {self.command_name}'
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+
+from logic.exceptions.base import LogicException
+
+
+@dataclass(eq=False)
+class JobNotFoundException(LogicException):
+    job_id: str
+
+    @property
+    def message(self) -> str:
+        return f'Job "{self.job_id}" not found'
+
+
+@dataclass(eq=False)
+class EmptyJobException(LogicException):
+    @property
+    def message(self) -> str:
+        return 'The uploaded file has no names'
+
+
+@dataclass(eq=False)
+class JobNotCompletedException(LogicException):
+    job_id: str
+    status: str
+
+    @property
+    def message(self) -> str:
+        return f'Job "{self.job_id}" is {self.status}, its results are not ready'
@@ -6,7 +6,11 @@ from logic.exceptions.base import LogicException
 @dataclass(eq=False)
 class NameNotFoundException(LogicException):
     name: str
+    suggestion: str | None = None  # Closest name with stored origins
 
     @property
     def message(self) -> str:
-        return f'Any details about name "{self.name}" not found'
+        message = f'Any details about name "{self.name}" not found'
+        if self.suggestion:
+            message += f'. Did you mean "{self.suggestion}"?'
+        return message
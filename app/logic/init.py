@@ -1,5 +1,8 @@
+from datetime import timedelta
 from functools import lru_cache
 from collections.abc import Container
+from pathlib import Path
+from typing import Any
 
 from punq import (
     Container,
@@ -7,28 +10,93 @@ from punq import (
 )
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from infra.http.clients import (
+    NATIONALIZE,
+    REST_COUNTRIES,
+    HTTPClientRegistry,
+    UpstreamClientSettings,
+)
+from infra.files.jobs import JobFileStore
+from infra.indexes.country_catalog import CountryCatalog
+from infra.indexes.country_graph import CountryGraph
+from infra.indexes.hot_names import HotNameTracker
+from infra.indexes.name_fuzzy import NameFuzzyIndex
+from infra.indexes.name_prefix import NamePrefixIndex
 from infra.repositories.api.base import (
     BaseCountryAPIRepository,
     BaseNameOriginAPIRepository,
 )
+from infra.repositories.api.batching import BatchingNameOriginAPIRepository
 from infra.repositories.api.countries_api import CountriesAPIRepository
 from infra.repositories.api.nationalize_api import NationalizeRepository
+from infra.repositories.api.quota import (
+    QuotaAwareNameOriginAPIRepository,
+    QuotaManager,
+)
+from infra.repositories.api.resilience import (
+    CircuitBreaker,
+    ResilientCaller,
+    ResilientCountryAPIRepository,
+    ResilientNameOriginAPIRepository,
+)
 from infra.repositories.sql.session_generator import (
     AsyncSessionFactory,
 )
-from infra.repositories.sql.unit_of_work import UnitOfWork, IUnitOfWork
+from infra.repositories.memory.unit_of_work import InMemoryUnitOfWork
+from infra.repositories.sql.unit_of_work import (
+    IUnitOfWork,
+    SQLiteUnitOfWork,
+    UnitOfWork,
+)
+from infra.snapshots.countries import CountrySnapshot, DEFAULT_SNAPSHOT_PATH
 from logic.commands.country import (
     FetchAndSaveCountriesCommand,
     FetchAndSaveCountriesCommandHandler,
+    GetCountryNeighborsCommand,
+    GetCountryNeighborsCommandHandler,
+    GetCountryPathCommand,
+    GetCountryPathCommandHandler,
+    RebuildAreaPopularityCommand,
+    RebuildAreaPopularityCommandHandler,
+    RebuildCountryGraphCommand,
+    RebuildCountryGraphCommandHandler,
+    RefreshCountriesCommand,
+    RefreshCountriesCommandHandler,
+)
+from logic.commands.job import (
+    CreateNamesJobCommand,
+    CreateNamesJobCommandHandler,
+    GetNamesJobCommand,
+    GetNamesJobCommandHandler,
+    GetNamesJobResultsCommand,
+    GetNamesJobResultsCommandHandler,
+    ResumeNamesJobsCommand,
+    ResumeNamesJobsCommandHandler,
+    RunNamesJobCommand,
+    RunNamesJobCommandHandler,
 )
 from logic.commands.name import (
+    GetBatchNameOriginsCommand,
+    GetBatchNameOriginsCommandHandler,
     GetFrequentNamesCountryCommand,
     GetFrequentNamesCountryCommandHandler,
     GetNameOriginsCommand,
     GetNameOriginsCommandHandler,
+    GetNameSuggestionsCommand,
+    GetNameSuggestionsCommandHandler,
+    GetPopularNamesByAreaCommand,
+    GetPopularNamesByAreaCommandHandler,
+    RebuildNamePrefixIndexCommand,
+    RebuildNamePrefixIndexCommandHandler,
+    RefreshHotNamesCommand,
+    RefreshHotNamesCommandHandler,
 )
 from logic.mediator import Mediator
 from settings.config import Config
+from utils.rate_limit import ClientRateLimiter
+from utils.scheduler import PeriodicJob, Scheduler
+from utils.shared_state import HostLock, SharedStateFile
+from utils.workers import WorkerPool
 
 
 @lru_cache(1)
@@ -43,6 +111,13 @@ def _init_container() -> Container:
     config: Config = container.resolve(Config)
 
     def create_session_maker() -> async_sessionmaker[AsyncSession]:
+        if config.database_backend == 'sqlite':
+            return AsyncSessionFactory(
+                url=config.sqlite_url,
+                debug=config.debug,
+                engine_options={},
+            ).get_async_session_maker()
+
         return AsyncSessionFactory(
             url=config.postgres_url,
             debug=config.debug,
@@ -53,12 +128,19 @@ def _init_container() -> Container:
         factory=create_session_maker,
         scope=Scope.singleton,
     )
-    session_maker = container.resolve(async_sessionmaker[AsyncSession])
 
     def init_unit_of_work() -> IUnitOfWork:
-        return UnitOfWork(
-            session_factory=session_maker,
-        )
+        match config.database_backend:
+            case 'memory':
+                return InMemoryUnitOfWork()
+            case 'sqlite':
+                return SQLiteUnitOfWork(
+                    session_factory=container.resolve(async_sessionmaker[AsyncSession]),
+                )
+            case _:
+                return UnitOfWork(
+                    session_factory=container.resolve(async_sessionmaker[AsyncSession]),
+                )
 
     container.register(
         IUnitOfWork,
@@ -66,11 +148,111 @@ def _init_container() -> Container:
         scope=Scope.singleton,
     )
 
+    def init_nationalize_quota() -> QuotaManager:
+        return QuotaManager(
+            upstream=NATIONALIZE,
+            state=SharedStateFile(
+                path=Path(config.shared_state_dir) / f'{NATIONALIZE}_quota.json'
+            ),
+            rate=config.nationalize_quota_rate,
+            burst=config.nationalize_quota_burst,
+            interactive_reserve=config.nationalize_quota_interactive_reserve,
+            background_reserve=config.nationalize_quota_background_reserve,
+        )
+
+    container.register(
+        QuotaManager,
+        factory=init_nationalize_quota,
+        scope=Scope.singleton,
+    )
+
+    container.register(
+        ClientRateLimiter,
+        instance=ClientRateLimiter(
+            rate=config.rate_limit_rate,
+            burst=config.rate_limit_burst,
+            state=SharedStateFile(
+                path=Path(config.shared_state_dir) / 'client_rate_limits.json'
+            ),
+        ),
+        scope=Scope.singleton,
+    )
+
+    def init_http_clients() -> HTTPClientRegistry:
+        def upstream_settings(base_url: str) -> UpstreamClientSettings:
+            return UpstreamClientSettings(
+                base_url=base_url,
+                timeout=config.http_timeout,
+                connect_timeout=config.http_connect_timeout,
+                max_connections=config.http_max_connections,
+                max_keepalive_connections=config.http_max_keepalive_connections,
+                keepalive_expiry=config.http_keepalive_expiry,
+                http2=config.http2,
+                warmup_connections=config.http_warmup_connections,
+            )
+
+        nationalize_settings = upstream_settings(config.nationalize_api_url)
+        if config.nationalize_quota_enabled:
+            nationalize_settings.on_response = container.resolve(QuotaManager).observe
+
+        return HTTPClientRegistry(
+            settings={
+                NATIONALIZE: nationalize_settings,
+                REST_COUNTRIES: upstream_settings(config.rest_countries_api_url),
+            }
+        )
+
+    container.register(
+        HTTPClientRegistry,
+        factory=init_http_clients,
+        scope=Scope.singleton,
+    )
+
+    def init_resilient_caller(upstream: str) -> ResilientCaller:
+        return ResilientCaller(
+            upstream=upstream,
+            breaker=CircuitBreaker(
+                failure_threshold=config.circuit_breaker_failure_threshold,
+                reset_timeout=config.circuit_breaker_reset_timeout,
+            ),
+            retry_attempts=config.upstream_retry_attempts,
+            retry_base_delay=config.upstream_retry_base_delay,
+            retry_max_delay=config.upstream_retry_max_delay,
+            hedge_percentile=config.upstream_hedge_percentile,
+        )
+
     def init_nationalize_name_repository() -> BaseNameOriginAPIRepository:
-        return NationalizeRepository(base_url=config.nationalize_api_url)
+        repository: BaseNameOriginAPIRepository = ResilientNameOriginAPIRepository(
+            repository=NationalizeRepository(
+                base_url=config.nationalize_api_url,
+                http_clients=container.resolve(HTTPClientRegistry),
+                max_batch_size=config.nationalize_batch_size,
+            ),
+            caller=init_resilient_caller(NATIONALIZE),
+        )
+        if config.nationalize_batch_window_ms > 0:
+            repository = BatchingNameOriginAPIRepository(
+                repository=repository,
+                window=config.nationalize_batch_window_ms / 1000,
+                max_batch_size=config.nationalize_batch_size,
+            )
+        if not config.nationalize_quota_enabled:
+            return repository
+
+        # Outermost, so every waiter of a shared batch is charged at its own priority
+        return QuotaAwareNameOriginAPIRepository(
+            repository=repository,
+            quota=container.resolve(QuotaManager),
+        )
 
     def init_countries_api_repository() -> BaseCountryAPIRepository:
-        return CountriesAPIRepository(base_url=config.rest_countries_api_url)
+        return ResilientCountryAPIRepository(
+            repository=CountriesAPIRepository(
+                base_url=config.rest_countries_api_url,
+                http_clients=container.resolve(HTTPClientRegistry),
+            ),
+            caller=init_resilient_caller(REST_COUNTRIES),
+        )
 
     container.register(
         BaseNameOriginAPIRepository,
@@ -82,26 +264,359 @@ def _init_container() -> Container:
         factory=init_countries_api_repository,
         scope=Scope.singleton,
     )
-    container.register(GetNameOriginsCommandHandler)
+
+    container.register(CountryCatalog, instance=CountryCatalog(), scope=Scope.singleton)
+    container.register(CountryGraph, instance=CountryGraph(), scope=Scope.singleton)
+    container.register(
+        CountrySnapshot,
+        instance=CountrySnapshot(
+            path=(
+                Path(config.country_snapshot_path)
+                if config.country_snapshot_path
+                else DEFAULT_SNAPSHOT_PATH
+            )
+        ),
+        scope=Scope.singleton,
+    )
+
+    container.register(
+        HotNameTracker,
+        instance=HotNameTracker(capacity=config.hot_names_capacity),
+        scope=Scope.singleton,
+    )
+
+    container.register(
+        NamePrefixIndex,
+        instance=NamePrefixIndex(
+            max_limit=config.autocomplete_max_limit,
+            cache_size=config.autocomplete_cache_size,
+        ),
+        scope=Scope.singleton,
+    )
+
+    container.register(
+        NameFuzzyIndex,
+        instance=NameFuzzyIndex(max_distance=config.fuzzy_max_distance),
+        scope=Scope.singleton,
+    )
+
+    def name_origins_handler_kwargs() -> dict[str, Any]:
+        return {
+            'name_origin_api_repository': container.resolve(
+                BaseNameOriginAPIRepository
+            ),
+            'country_api_repository': container.resolve(BaseCountryAPIRepository),
+            'uow': container.resolve(IUnitOfWork),
+            'country_batch_size': config.country_fetch_batch_size,
+            'country_fetch_concurrency': config.country_fetch_concurrency,
+            'country_fetch_timeout': config.country_fetch_timeout,
+            'country_catalog': container.resolve(CountryCatalog),
+            'hot_names': container.resolve(HotNameTracker),
+            'name_prefix_index': container.resolve(NamePrefixIndex),
+            'name_fuzzy_index': container.resolve(NameFuzzyIndex),
+        }
+
+    def init_get_name_origins_handler() -> GetNameOriginsCommandHandler:
+        return GetNameOriginsCommandHandler(**name_origins_handler_kwargs())
+
+    container.register(
+        GetNameOriginsCommandHandler,
+        factory=init_get_name_origins_handler,
+    )
+
+    def init_get_batch_name_origins_handler() -> GetBatchNameOriginsCommandHandler:
+        return GetBatchNameOriginsCommandHandler(
+            **name_origins_handler_kwargs(),
+            upstream_batch_size=config.names_batch_upstream_chunk,
+        )
+
+    container.register(
+        GetBatchNameOriginsCommandHandler,
+        factory=init_get_batch_name_origins_handler,
+    )
+
+    def init_refresh_hot_names_handler() -> RefreshHotNamesCommandHandler:
+        return RefreshHotNamesCommandHandler(
+            get_name_origins_handler=container.resolve(GetNameOriginsCommandHandler),
+            quota=(
+                container.resolve(QuotaManager)
+                if config.nationalize_quota_enabled
+                else None
+            ),
+            top=config.refresh_ahead_top,
+            refresh_window=timedelta(seconds=config.refresh_ahead_window),
+            max_refreshes=config.refresh_ahead_per_run,
+            min_spare_tokens=config.refresh_ahead_min_spare_tokens,
+        )
+
+    container.register(
+        RefreshHotNamesCommandHandler,
+        factory=init_refresh_hot_names_handler,
+    )
     container.register(FetchAndSaveCountriesCommandHandler)
+
+    def init_refresh_countries_handler() -> RefreshCountriesCommandHandler:
+        shared_state_dir = Path(config.shared_state_dir)
+        return RefreshCountriesCommandHandler(
+            country_api_repository=container.resolve(BaseCountryAPIRepository),
+            uow=container.resolve(IUnitOfWork),
+            country_catalog=container.resolve(CountryCatalog),
+            refresh_lock=HostLock(path=shared_state_dir / 'countries_refresh.lock'),
+            refresh_state=SharedStateFile(
+                path=shared_state_dir / 'countries_refresh.json'
+            ),
+            # Each worker's scheduler fires once per interval; one of them per
+            # half interval revalidates
+            revalidate_after=config.country_refresh_interval / 2,
+        )
+
+    container.register(
+        RefreshCountriesCommandHandler,
+        factory=init_refresh_countries_handler,
+    )
+
+    def init_rebuild_area_popularity_handler() -> RebuildAreaPopularityCommandHandler:
+        return RebuildAreaPopularityCommandHandler(
+            uow=container.resolve(IUnitOfWork),
+            refresh_state=SharedStateFile(
+                path=Path(config.shared_state_dir) / 'countries_refresh.json'
+            ),
+        )
+
+    container.register(
+        RebuildAreaPopularityCommandHandler,
+        factory=init_rebuild_area_popularity_handler,
+    )
+    container.register(RebuildCountryGraphCommandHandler)
+    container.register(GetCountryNeighborsCommandHandler)
+    container.register(GetCountryPathCommandHandler)
     container.register(GetFrequentNamesCountryCommandHandler)
+    container.register(GetPopularNamesByAreaCommandHandler)
+    container.register(GetNameSuggestionsCommandHandler)
 
-    def init_mediator() -> Mediator:
-        mediator = Mediator()
-        mediator.register_command(
-            GetNameOriginsCommand,
-            [container.resolve(GetNameOriginsCommandHandler)],
+    def init_rebuild_prefix_index_handler() -> RebuildNamePrefixIndexCommandHandler:
+        return RebuildNamePrefixIndexCommandHandler(
+            uow=container.resolve(IUnitOfWork),
+            name_prefix_index=container.resolve(NamePrefixIndex),
+            name_fuzzy_index=container.resolve(NameFuzzyIndex),
         )
-        mediator.register_command(
-            FetchAndSaveCountriesCommand,
-            [container.resolve(FetchAndSaveCountriesCommandHandler)],
+
+    container.register(
+        RebuildNamePrefixIndexCommandHandler,
+        factory=init_rebuild_prefix_index_handler,
+    )
+
+    container.register(
+        JobFileStore,
+        instance=JobFileStore(directory=Path(config.jobs_dir)),
+        scope=Scope.singleton,
+    )
+
+    def init_jobs_worker_pool() -> WorkerPool:
+        async def run_job(job_id: str) -> None:
+            await container.resolve(Mediator).handle_command(
+                RunNamesJobCommand(job_id=job_id)
+            )
+
+        return WorkerPool(run=run_job, workers=config.jobs_workers, name='jobs')
+
+    container.register(
+        WorkerPool,
+        factory=init_jobs_worker_pool,
+        scope=Scope.singleton,
+    )
+
+    def init_create_names_job_handler() -> CreateNamesJobCommandHandler:
+        return CreateNamesJobCommandHandler(
+            uow=container.resolve(IUnitOfWork),
+            files=container.resolve(JobFileStore),
+            worker_pool=container.resolve(WorkerPool),
+            max_upload_bytes=config.jobs_max_upload_bytes,
         )
-        mediator.register_command(
-            GetFrequentNamesCountryCommand,
-            [container.resolve(GetFrequentNamesCountryCommandHandler)],
+
+    def init_run_names_job_handler() -> RunNamesJobCommandHandler:
+        return RunNamesJobCommandHandler(
+            get_name_origins_handler=container.resolve(GetNameOriginsCommandHandler),
+            uow=container.resolve(IUnitOfWork),
+            files=container.resolve(JobFileStore),
+            chunk_size=config.jobs_chunk_size,
+            concurrency=config.jobs_concurrency,
         )
-        return mediator
 
-    container.register(Mediator, factory=init_mediator)
+    container.register(
+        CreateNamesJobCommandHandler,
+        factory=init_create_names_job_handler,
+    )
+    container.register(GetNamesJobCommandHandler)
+    container.register(GetNamesJobResultsCommandHandler)
+    container.register(
+        RunNamesJobCommandHandler,
+        factory=init_run_names_job_handler,
+    )
+    container.register(ResumeNamesJobsCommandHandler)
+
+    # The dispatch graph is built once; request handlers share it
+    container.register(
+        Mediator,
+        factory=lambda: build_mediator(container),
+        scope=Scope.singleton,
+    )
+
+    def init_scheduler() -> Scheduler:
+        scheduler = Scheduler()
+        mediator: Mediator = container.resolve(Mediator)
+        if config.country_refresh_interval > 0:
+            scheduler.add(
+                PeriodicJob(
+                    name='refresh_countries',
+                    interval=config.country_refresh_interval,
+                    run=lambda: mediator.handle_command(RefreshCountriesCommand()),
+                    initial_delay=config.country_refresh_initial_delay,
+                )
+            )
+        if config.area_popularity_rebuild_interval > 0:
+            scheduler.add(
+                PeriodicJob(
+                    name='rebuild_area_popularity',
+                    interval=config.area_popularity_rebuild_interval,
+                    run=lambda: mediator.handle_command(RebuildAreaPopularityCommand()),
+                    initial_delay=config.area_popularity_rebuild_interval,
+                )
+            )
+        if config.country_graph_rebuild_interval > 0:
+            # The first run builds the graph at startup, after the countries seed
+            scheduler.add(
+                PeriodicJob(
+                    name='rebuild_country_graph',
+                    interval=config.country_graph_rebuild_interval,
+                    run=lambda: mediator.handle_command(RebuildCountryGraphCommand()),
+                )
+            )
+        if config.refresh_ahead_interval > 0:
+            scheduler.add(
+                PeriodicJob(
+                    name='refresh_hot_names',
+                    interval=config.refresh_ahead_interval,
+                    run=lambda: mediator.handle_command(RefreshHotNamesCommand()),
+                    initial_delay=config.refresh_ahead_interval,
+                )
+            )
+        if config.autocomplete_rebuild_interval > 0:
+            # The first run loads the index at startup
+            scheduler.add(
+                PeriodicJob(
+                    name='rebuild_name_prefix_index',
+                    interval=config.autocomplete_rebuild_interval,
+                    run=lambda: mediator.handle_command(
+                        RebuildNamePrefixIndexCommand()
+                    ),
+                )
+            )
+        if config.jobs_workers > 0:
+            scheduler.add(
+                PeriodicJob(
+                    name='resume_names_jobs',
+                    interval=config.jobs_rescan_interval,
+                    run=lambda: mediator.handle_command(ResumeNamesJobsCommand()),
+                )
+            )
+        if config.rate_limit_rate > 0:
+            rate_limiter: ClientRateLimiter = container.resolve(ClientRateLimiter)
+            scheduler.add(
+                PeriodicJob(
+                    name='reconcile_rate_limits',
+                    interval=config.rate_limit_reconcile_interval,
+                    run=rate_limiter.reconcile,
+                    initial_delay=config.rate_limit_reconcile_interval,
+                )
+            )
+        return scheduler
+
+    container.register(Scheduler, factory=init_scheduler, scope=Scope.singleton)
 
     return container
+
+
+def build_mediator(container: Container) -> Mediator:
+    """Build a mediator dispatching every command to its handlers.
+
+    Args:
+        container: Container resolving the handlers
+
+    Returns:
+        Mediator: The mediator; the container keeps one as a singleton
+    """
+    mediator = Mediator()
+    mediator.register_command(
+        GetNameOriginsCommand,
+        [container.resolve(GetNameOriginsCommandHandler)],
+    )
+    mediator.register_command(
+        GetBatchNameOriginsCommand,
+        [container.resolve(GetBatchNameOriginsCommandHandler)],
+    )
+    mediator.register_command(
+        FetchAndSaveCountriesCommand,
+        [container.resolve(FetchAndSaveCountriesCommandHandler)],
+    )
+    mediator.register_command(
+        GetFrequentNamesCountryCommand,
+        [container.resolve(GetFrequentNamesCountryCommandHandler)],
+    )
+    mediator.register_command(
+        GetPopularNamesByAreaCommand,
+        [container.resolve(GetPopularNamesByAreaCommandHandler)],
+    )
+    mediator.register_command(
+        GetNameSuggestionsCommand,
+        [container.resolve(GetNameSuggestionsCommandHandler)],
+    )
+    mediator.register_command(
+        RebuildNamePrefixIndexCommand,
+        [container.resolve(RebuildNamePrefixIndexCommandHandler)],
+    )
+    mediator.register_command(
+        RefreshCountriesCommand,
+        [container.resolve(RefreshCountriesCommandHandler)],
+    )
+    mediator.register_command(
+        RebuildAreaPopularityCommand,
+        [container.resolve(RebuildAreaPopularityCommandHandler)],
+    )
+    mediator.register_command(
+        RebuildCountryGraphCommand,
+        [container.resolve(RebuildCountryGraphCommandHandler)],
+    )
+    mediator.register_command(
+        GetCountryNeighborsCommand,
+        [container.resolve(GetCountryNeighborsCommandHandler)],
+    )
+    mediator.register_command(
+        GetCountryPathCommand,
+        [container.resolve(GetCountryPathCommandHandler)],
+    )
+    mediator.register_command(
+        RefreshHotNamesCommand,
+        [container.resolve(RefreshHotNamesCommandHandler)],
+    )
+    mediator.register_command(
+        CreateNamesJobCommand,
+        [container.resolve(CreateNamesJobCommandHandler)],
+    )
+    mediator.register_command(
+        GetNamesJobCommand,
+        [container.resolve(GetNamesJobCommandHandler)],
+    )
+    mediator.register_command(
+        GetNamesJobResultsCommand,
+        [container.resolve(GetNamesJobResultsCommandHandler)],
+    )
+    mediator.register_command(
+        RunNamesJobCommand,
+        [container.resolve(RunNamesJobCommandHandler)],
+    )
+    mediator.register_command(
+        ResumeNamesJobsCommand,
+        [container.resolve(ResumeNamesJobsCommandHandler)],
+    )
+    return mediator
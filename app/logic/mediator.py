@@ -1,3 +1,4 @@
+import asyncio
 from collections import defaultdict
 from collections.abc import Iterable
 from dataclasses import (
@@ -10,9 +11,11 @@ from logic.commands.base import (
     CR,
     CT,
 )
+from logic.exceptions.deadline import DeadlineExceededException
 from logic.exceptions.mediator import (
     CommandHandlersNotRegisteredException,
 )
+from utils.deadline import deadline_scope
 
 
 @dataclass(eq=False)
@@ -29,11 +32,35 @@ class Mediator:
     ) -> None:
         self.commands_map[command].extend(command_handlers)
 
-    async def handle_command(self, command: CT) -> Iterable[CR]:
+    async def handle_command(
+        self, command: CT, deadline: float | None = None
+    ) -> Iterable[CR]:
+        """Handle a command with every handler registered for it.
+
+        Args:
+            command: The command to handle
+            deadline: Event loop time by which handling must finish; repositories
+                size their database and HTTP timeouts to the remaining budget
+
+        Raises:
+            DeadlineExceededException: If the deadline passed and work was cancelled
+        """
         command_type = command.__class__
         handlers = self.commands_map.get(command_type)
 
         if not handlers:
             raise CommandHandlersNotRegisteredException(command_type=command_type)
 
-        return [await handler.handle(command) for handler in handlers]
+        if deadline is None:
+            return [await handler.handle(command) for handler in handlers]
+
+        with deadline_scope(deadline):
+            try:
+                async with asyncio.timeout_at(deadline) as scope:
+                    return [await handler.handle(command) for handler in handlers]
+            except TimeoutError as exception:
+                if not scope.expired():
+                    raise
+                raise DeadlineExceededException(
+                    command_name=command_type.__name__
+                ) from exception
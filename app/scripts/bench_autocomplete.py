@@ -0,0 +1,62 @@
+"""Benchmark prefix completions of the in-memory name index.
+
+Indexes random names with random counts and measures completions of random
+prefixes, cold (ranked from the sorted array) and cached, e.g.:
+
+    python -m scripts.bench_autocomplete --names 1000000 --queries 20000
+"""
+
+import argparse
+import random
+import string
+import time
+
+from domain.entities.name import NameSuggestionEntity
+from infra.indexes.name_prefix import NamePrefixIndex
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--names', type=int, default=1_000_000)
+    parser.add_argument('--queries', type=int, default=20000)
+    parser.add_argument('--limit', type=int, default=10)
+    return parser.parse_args()
+
+
+def random_name(rng: random.Random) -> str:
+    return ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10)))
+
+
+def measure(index: NamePrefixIndex, prefixes: list[str], limit: int) -> float:
+    """Returns the seconds spent per completion."""
+    started_at = time.perf_counter()
+    for prefix in prefixes:
+        index.complete(prefix, limit=limit)
+    return (time.perf_counter() - started_at) / len(prefixes)
+
+
+def main() -> None:
+    args = parse_args()
+    rng = random.Random(0)
+    names = {random_name(rng) for _ in range(args.names)}
+
+    started_at = time.perf_counter()
+    index = NamePrefixIndex()
+    index.load(
+        NameSuggestionEntity(
+            key=name, name=name.title(), count_of_requests=rng.randint(1, 100000)
+        )
+        for name in names
+    )
+    load_time = time.perf_counter() - started_at
+
+    prefixes = [random_name(rng)[: rng.randint(1, 4)] for _ in range(args.queries)]
+    cold = measure(index, prefixes, args.limit)
+    cached = measure(index, prefixes, args.limit)
+    print(f'{len(index)} names indexed in {load_time:.2f}s')
+    print(f'cold:   {cold * 1e6:.1f}us per completion')
+    print(f'cached: {cached * 1e6:.1f}us per completion')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark the dependency overhead of a name request before and after app.state.
+
+Before, every request resolved the container and built a new mediator, resolving
+each command handler through punq; now the mediator and the config are read from
+app.state, e.g.:
+
+    python -m scripts.bench_request_overhead --requests 20000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from types import SimpleNamespace
+
+from starlette.requests import Request
+
+from application.dependencies import get_config, get_mediator
+from logic.init import build_mediator, init_container
+from logic.mediator import Mediator
+from settings.config import Config
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=20000)
+    return parser.parse_args()
+
+
+def measure(resolve: Callable[[], object], requests: int) -> float:
+    """Returns the CPU seconds spent per request."""
+    resolve()
+    started_at = time.process_time()
+    for _ in range(requests):
+        resolve()
+    return (time.process_time() - started_at) / requests
+
+
+def main() -> None:
+    args = parse_args()
+    container = init_container()
+    app = SimpleNamespace(
+        state=SimpleNamespace(
+            config=container.resolve(Config), mediator=container.resolve(Mediator)
+        )
+    )
+
+    def per_request_resolution() -> object:
+        request_container = init_container()
+        return (
+            build_mediator(request_container),
+            request_container.resolve(Config),
+        )
+
+    def app_state() -> object:
+        request = Request({'type': 'http', 'app': app})
+        return get_mediator(request), get_config(request)
+
+    before = measure(per_request_resolution, args.requests)
+    after = measure(app_state, args.requests)
+    print(f'{args.requests} requests')
+    print(f'container resolution: {before * 1e6:.1f}us CPU per request')
+    print(f'app.state:            {after * 1e6:.1f}us CPU per request')
+    print(f'speedup:              {before / after:.0f}x')
+
+
+if __name__ == '__main__':
+    main()
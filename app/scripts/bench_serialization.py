@@ -0,0 +1,108 @@
+"""Benchmark the CPU time spent serializing name origin responses.
+
+Compares the validated path (from_entity, then response_model validation and
+ORJSONResponse rendering) with the dicts of NameOriginsOutSchema.dump_entity
+rendered by ORJSONResponse directly, e.g.:
+
+    python -m scripts.bench_serialization --origins 5 --responses 20000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from datetime import datetime
+
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+
+from application.v1.name.schemas import NameOriginsOutSchema
+from domain.entities.country import CountryEntity
+from domain.entities.name import NameEntity
+from domain.values.name import CountOfRequests, Name, Probability
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--origins', type=int, default=5, help='Origins in each response'
+    )
+    parser.add_argument('--responses', type=int, default=20000)
+    return parser.parse_args()
+
+
+def make_origins(count: int) -> list[NameEntity]:
+    origins = []
+    for index in range(count):
+        country = CountryEntity(
+            iso_alpha2_code=f'C{index % 10}',
+            common_name=f'Country {index}',
+            official_name=f'Republic of Country {index}',
+            region='Europe',
+            sub_region='Western Europe',
+            independent=True,
+            capital={f'Capital {index}'},
+            capital_lat=48.87,
+            capital_long=2.33,
+            flag_png=f'https://flagcdn.com/w320/c{index}.png',
+            flag_svg=f'https://flagcdn.com/c{index}.svg',
+            flag_alt=f'The flag of Country {index}',
+            coat_of_arms_png=None,
+            coat_of_arms_svg=None,
+            borders={'AND', 'BEL', 'DEU'},
+        )
+        origins.append(
+            NameEntity(
+                name=Name(value='anna'),
+                count_of_requests=CountOfRequests(value=1000 + index),
+                probability=Probability(value=1 / (index + 2)),
+                country=country,
+                last_accessed_at=datetime.now(),
+            )
+        )
+    return origins
+
+
+VALIDATED_ADAPTER = TypeAdapter(list[NameOriginsOutSchema])
+
+
+def validated(origins: list[NameEntity]) -> bytes:
+    adapter = VALIDATED_ADAPTER
+    schemas = [NameOriginsOutSchema.from_entity(origin) for origin in origins]
+    # What FastAPI does with a response_model before rendering the response
+    content = adapter.dump_python(adapter.validate_python(schemas), mode='json')
+    return ORJSONResponse(content=content).body
+
+
+def fast(origins: list[NameEntity]) -> bytes:
+    content = [NameOriginsOutSchema.dump_entity(origin) for origin in origins]
+    return ORJSONResponse(content=content).body
+
+
+def measure(
+    serialize: Callable[[list[NameEntity]], bytes],
+    origins: list[NameEntity],
+    responses: int,
+) -> float:
+    """Returns the CPU seconds per response."""
+    serialize(origins)
+    started_at = time.process_time()
+    for _ in range(responses):
+        serialize(origins)
+    return (time.process_time() - started_at) / responses
+
+
+def main() -> None:
+    args = parse_args()
+    origins = make_origins(args.origins)
+    assert validated(origins) == fast(origins), 'the paths must render the same body'
+
+    baseline = measure(validated, origins, args.responses)
+    optimized = measure(fast, origins, args.responses)
+    print(f'{args.responses} responses of {args.origins} origins')
+    print(f'validated: {baseline * 1e6:.1f}us CPU per response')
+    print(f'fast:      {optimized * 1e6:.1f}us CPU per response')
+    print(f'speedup:   {baseline / optimized:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+import asyncio
+
+from infra.http.clients import (
+    REST_COUNTRIES,
+    HTTPClientRegistry,
+    UpstreamClientSettings,
+)
+from infra.repositories.api.countries_api import CountriesAPIRepository
+from infra.snapshots.countries import CountrySnapshot
+from settings.config import Config
+
+
+async def main() -> None:
+    """Download the countries and write them to the shipped snapshot file."""
+    config = Config()
+    http_clients = HTTPClientRegistry(
+        settings={
+            REST_COUNTRIES: UpstreamClientSettings(
+                base_url=config.rest_countries_api_url, timeout=60.0
+            )
+        }
+    )
+    repository = CountriesAPIRepository(
+        base_url=config.rest_countries_api_url, http_clients=http_clients
+    )
+    snapshot = CountrySnapshot()
+
+    try:
+        countries = [country async for country in repository.stream_list_of_countries()]
+        count = snapshot.write(countries, source=config.rest_countries_api_url)
+        print(f'Wrote {count} countries to {snapshot.path}')
+    finally:
+        await http_clients.aclose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
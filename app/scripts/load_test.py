@@ -0,0 +1,89 @@
+"""Load test GetNameOriginsCommandHandler against the configured upstreams.
+
+Run it against the upstream simulator for reproducible numbers, e.g.:
+
+    DATABASE_BACKEND=memory \
+    NATIONALIZE_API_URL=http://localhost:8001/nationalize \
+    REST_COUNTRIES_API_URL=http://localhost:8001/countries \
+    python -m scripts.load_test --requests 2000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from collections import Counter
+
+from infra.http.clients import HTTPClientRegistry
+from logic.commands.name import GetNameOriginsCommand
+from logic.init import init_container
+from logic.mediator import Mediator
+from punq import Container
+
+
+NAMES = (
+    'Adam', 'Ahmad', 'Aiko', 'Alejandro', 'Amara', 'Anna', 'Björn', 'Carlos',
+    'Chen', 'Chloé', 'Daniel', 'Dmitri', 'Elena', 'Emma', 'Fatima', 'François',
+    'Giulia', 'Hannah', 'Hiroshi', 'Ibrahim', 'Ingrid', 'Ivan', 'Jakub', 'João',
+    'Juan', 'Kenji', 'Lars', 'Layla', 'Liam', 'Lucas', 'Maria', 'Mateo',
+    'Mehmet', 'Min-jun', 'Mohammed', 'Nikos', 'Noah', 'Olga', 'Omar', 'Priya',
+    'Rahul', 'Sakura', 'Santiago', 'Sofia', 'Sven', 'Thi', 'Wei', 'Yusuf',
+)  # fmt: skip
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=20)
+    parser.add_argument(
+        '--distinct-names',
+        type=int,
+        default=len(NAMES),
+        help='Distinct names to draw from; fewer names mean more cache hits',
+    )
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args()
+
+
+async def main() -> None:
+    """Send GetNameOriginsCommand with bounded concurrency and report latencies."""
+    args = parse_args()
+    container: Container = init_container()
+    mediator: Mediator = container.resolve(Mediator)
+
+    rng = random.Random(args.seed)
+    names = [rng.choice(NAMES[: args.distinct_names]) for _ in range(args.requests)]
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: list[float] = []
+    outcomes: Counter[str] = Counter()
+
+    async def send(name: str) -> None:
+        async with semaphore:
+            started_at = time.perf_counter()
+            try:
+                await mediator.handle_command(GetNameOriginsCommand(name=name))
+                outcomes['ok'] += 1
+            except Exception as exception:
+                outcomes[type(exception).__name__] += 1
+            latencies.append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(send(name) for name in names))
+    elapsed = time.perf_counter() - started_at
+    await container.resolve(HTTPClientRegistry).aclose()
+
+    cut_points = statistics.quantiles(latencies, n=100, method='inclusive')
+    print(
+        f'{args.requests} requests in {elapsed:.2f}s '
+        f'({args.requests / elapsed:.1f} rps)'
+    )
+    print(
+        f'p50 {cut_points[49] * 1000:.1f}ms, p95 {cut_points[94] * 1000:.1f}ms, '
+        f'p99 {cut_points[98] * 1000:.1f}ms'
+    )
+    print('outcomes:', dict(outcomes))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
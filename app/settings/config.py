@@ -1,4 +1,10 @@
-from pydantic import Field, PostgresDsn
+from typing import Literal
+
+from pydantic import (
+    Field,
+    model_validator,
+    PostgresDsn,
+)
 from pydantic_settings import (
     BaseSettings,
     SettingsConfigDict,
@@ -18,6 +24,179 @@ class Config(BaseSettings):
         alias='REST_COUNTRIES_API_URL', default='https://restcountries.com/v3.1'
     )
 
+    # Overall time budget of a request; clients may ask for less with the
+    # X-Request-Timeout header, up to request_timeout_max seconds
+    request_timeout: float = Field(alias='REQUEST_TIMEOUT', default=10.0)
+    request_timeout_max: float = Field(alias='REQUEST_TIMEOUT_MAX', default=30.0)
+
+    # Shared upstream HTTP clients
+    http_timeout: float = Field(alias='HTTP_TIMEOUT', default=5.0)
+    http_connect_timeout: float = Field(alias='HTTP_CONNECT_TIMEOUT', default=2.0)
+    http_max_connections: int = Field(alias='HTTP_MAX_CONNECTIONS', default=100)
+    http_max_keepalive_connections: int = Field(
+        alias='HTTP_MAX_KEEPALIVE_CONNECTIONS', default=20
+    )
+    http_keepalive_expiry: float = Field(alias='HTTP_KEEPALIVE_EXPIRY', default=30.0)
+    http2: bool = Field(alias='HTTP2', default=True)
+    http_warmup_connections: int = Field(alias='HTTP_WARMUP_CONNECTIONS', default=1)
+
+    # Upstream resilience: retries with jittered backoff, circuit breaker and hedging
+    upstream_retry_attempts: int = Field(alias='UPSTREAM_RETRY_ATTEMPTS', default=2)
+    upstream_retry_base_delay: float = Field(
+        alias='UPSTREAM_RETRY_BASE_DELAY', default=0.1
+    )
+    upstream_retry_max_delay: float = Field(
+        alias='UPSTREAM_RETRY_MAX_DELAY', default=1.0
+    )
+    circuit_breaker_failure_threshold: int = Field(
+        alias='CIRCUIT_BREAKER_FAILURE_THRESHOLD', default=5
+    )
+    circuit_breaker_reset_timeout: float = Field(
+        alias='CIRCUIT_BREAKER_RESET_TIMEOUT', default=30.0
+    )
+    # Latency percentile (e.g. 95) after which a hedged request is sent, 0 disables
+    upstream_hedge_percentile: float = Field(
+        alias='UPSTREAM_HEDGE_PERCENTILE', default=0.0
+    )
+
+    # Nationalize quota: token bucket shared by the workers of a host, capped by the
+    # remaining quota reported in the rate-limit headers of the upstream. Off by
+    # default: every call then locks a state file in SHARED_STATE_DIR
+    nationalize_quota_enabled: bool = Field(
+        alias='NATIONALIZE_QUOTA_ENABLED', default=False
+    )
+    nationalize_quota_rate: float = Field(alias='NATIONALIZE_QUOTA_RATE', default=10.0)
+    nationalize_quota_burst: float = Field(
+        alias='NATIONALIZE_QUOTA_BURST', default=50.0
+    )
+    # Reported calls that interactive lookups and background work leave unused
+    nationalize_quota_interactive_reserve: int = Field(
+        alias='NATIONALIZE_QUOTA_INTERACTIVE_RESERVE', default=0
+    )
+    nationalize_quota_background_reserve: int = Field(
+        alias='NATIONALIZE_QUOTA_BACKGROUND_RESERVE', default=100
+    )
+    # Directory of the state files shared by the worker processes of a host
+    shared_state_dir: str = Field(
+        alias='SHARED_STATE_DIR', default='/tmp/name-origin-api'
+    )
+
+    # Nationalize micro-batching: lookups arriving within the window share one call
+    nationalize_batch_window_ms: float = Field(
+        alias='NATIONALIZE_BATCH_WINDOW_MS', default=5.0
+    )
+    nationalize_batch_size: int = Field(alias='NATIONALIZE_BATCH_SIZE', default=10)
+
+    # Enrichment of name origins with countries missing from the database
+    country_fetch_batch_size: int = Field(alias='COUNTRY_FETCH_BATCH_SIZE', default=10)
+    country_fetch_concurrency: int = Field(alias='COUNTRY_FETCH_CONCURRENCY', default=4)
+    country_fetch_timeout: float = Field(alias='COUNTRY_FETCH_TIMEOUT', default=5.0)
+
+    # Country snapshot shipped with the image, seeded at startup without network
+    country_snapshot_path: str | None = Field(
+        alias='COUNTRY_SNAPSHOT_PATH', default=None
+    )
+    country_snapshot_seed_on_startup: bool = Field(
+        alias='COUNTRY_SNAPSHOT_SEED_ON_STARTUP', default=True
+    )
+
+    # Background revalidation of the countries, 0 disables it
+    country_refresh_interval: float = Field(
+        alias='COUNTRY_REFRESH_INTERVAL', default=6 * 60 * 60
+    )
+    country_refresh_initial_delay: float = Field(
+        alias='COUNTRY_REFRESH_INITIAL_DELAY', default=60.0
+    )
+    # Rebuilds of the land border graph, which also pick up countries stored since
+    # the last one; 0 disables the graph
+    country_graph_rebuild_interval: float = Field(
+        alias='COUNTRY_GRAPH_REBUILD_INTERVAL', default=10 * 60
+    )
+    # Rebuilds of the area popularity of all names once a country changed region;
+    # 0 disables them, leaving the rollup stale until the names are written again
+    area_popularity_rebuild_interval: float = Field(
+        alias='AREA_POPULARITY_REBUILD_INTERVAL', default=60.0
+    )
+
+    # Refresh-ahead of hot names: every interval (0 disables), up to per_run of the
+    # top hottest names expiring within the window are refetched, while the
+    # Nationalize bucket is at least min_spare_tokens full
+    refresh_ahead_interval: float = Field(alias='REFRESH_AHEAD_INTERVAL', default=60.0)
+    refresh_ahead_window: float = Field(alias='REFRESH_AHEAD_WINDOW', default=3600.0)
+    refresh_ahead_top: int = Field(alias='REFRESH_AHEAD_TOP', default=100)
+    refresh_ahead_per_run: int = Field(alias='REFRESH_AHEAD_PER_RUN', default=20)
+    refresh_ahead_min_spare_tokens: float = Field(
+        alias='REFRESH_AHEAD_MIN_SPARE_TOKENS', default=0.5
+    )
+    hot_names_capacity: int = Field(alias='HOT_NAMES_CAPACITY', default=1000)
+
+    # Batch lookups: names accepted per request, and upstream misses per quota
+    # spend; a chunk takes that many tokens at once, so it is kept well below
+    # NATIONALIZE_QUOTA_BURST (and matches the 10 names of one Nationalize call)
+    names_batch_max_size: int = Field(alias='NAMES_BATCH_MAX_SIZE', default=1000)
+    names_batch_upstream_chunk: int = Field(
+        alias='NAMES_BATCH_UPSTREAM_CHUNK', default=10
+    )
+    # Streaming lookups: names of one stream resolved at once
+    names_stream_concurrency: int = Field(alias='NAMES_STREAM_CONCURRENCY', default=16)
+    # Autocomplete: most completions per prefix, prefixes whose top completions are
+    # cached, and how often the index is reloaded with the names of other workers
+    autocomplete_max_limit: int = Field(alias='AUTOCOMPLETE_MAX_LIMIT', default=20)
+    autocomplete_cache_size: int = Field(alias='AUTOCOMPLETE_CACHE_SIZE', default=10000)
+    autocomplete_rebuild_interval: float = Field(
+        alias='AUTOCOMPLETE_REBUILD_INTERVAL', default=300.0
+    )
+    # Fuzzy matching: typos allowed in names longer than five characters (shorter
+    # ones allow one)
+    fuzzy_max_distance: int = Field(alias='FUZZY_MAX_DISTANCE', default=2)
+
+    # Admission control of the name API: requests running at once (0 disables),
+    # requests waiting for a slot and how long they wait before a 503
+    admission_max_concurrency: int = Field(
+        alias='ADMISSION_MAX_CONCURRENCY', default=64
+    )
+    admission_queue_size: int = Field(alias='ADMISSION_QUEUE_SIZE', default=128)
+    admission_queue_timeout: float = Field(alias='ADMISSION_QUEUE_TIMEOUT', default=0.5)
+    admission_retry_after: float = Field(alias='ADMISSION_RETRY_AFTER', default=1.0)
+
+    # Per-client rate limits of the name API: tokens per second (0, the default,
+    # disables them) and bucket size; a request costs 1 token plus upstream_cost
+    # per name looked up upstream. Workers of a host reconcile their buckets every
+    # reconcile_interval. Behind reverse proxies, trusted_proxies of them append to
+    # X-Forwarded-For and the client address is read from there
+    rate_limit_rate: float = Field(alias='RATE_LIMIT_RATE', default=0.0)
+    rate_limit_burst: float = Field(alias='RATE_LIMIT_BURST', default=50.0)
+    rate_limit_upstream_cost: float = Field(
+        alias='RATE_LIMIT_UPSTREAM_COST', default=5.0
+    )
+    rate_limit_api_key_header: str = Field(
+        alias='RATE_LIMIT_API_KEY_HEADER', default='X-API-Key'
+    )
+    rate_limit_trusted_proxies: int = Field(
+        alias='RATE_LIMIT_TRUSTED_PROXIES', default=0
+    )
+    rate_limit_reconcile_interval: float = Field(
+        alias='RATE_LIMIT_RECONCILE_INTERVAL', default=1.0
+    )
+
+    # Bulk enrichment jobs: directory of the uploaded and result files, workers
+    # per process (0 disables), names per checkpointed chunk and lookups in flight
+    # per job, largest upload and how often unfinished jobs are picked up again
+    jobs_dir: str = Field(alias='JOBS_DIR', default='/tmp/name-origin-api/jobs')
+    jobs_workers: int = Field(alias='JOBS_WORKERS', default=2)
+    jobs_chunk_size: int = Field(alias='JOBS_CHUNK_SIZE', default=100)
+    jobs_concurrency: int = Field(alias='JOBS_CONCURRENCY', default=8)
+    jobs_max_upload_bytes: int = Field(
+        alias='JOBS_MAX_UPLOAD_BYTES', default=64 * 1024 * 1024
+    )
+    jobs_rescan_interval: float = Field(alias='JOBS_RESCAN_INTERVAL', default=30.0)
+
+    # Storage backend: 'postgres', embedded 'sqlite' or process-local 'memory'
+    database_backend: Literal['postgres', 'sqlite', 'memory'] = Field(
+        alias='DATABASE_BACKEND', default='postgres'
+    )
+    sqlite_path: str = Field(alias='SQLITE_PATH', default='name_origin.sqlite3')
+
     # Database settings
     postgres_user: str = Field(alias='POSTGRES_USER', default='postgres')
     postgres_password: str = Field(alias='POSTGRES_PASSWORD', default='admin')
@@ -25,6 +204,18 @@ class Config(BaseSettings):
     postgres_port: int = Field(alias='POSTGRES_PORT', default=5432)
     postgres_db: str = Field(alias='POSTGRES_DB', default='postgres')
 
+    @model_validator(mode='after')
+    def check_batch_chunk_fits_quota(self) -> 'Config':
+        """Reject upstream batch chunks the Nationalize bucket can never hold."""
+        if (
+            self.nationalize_quota_enabled
+            and self.names_batch_upstream_chunk > self.nationalize_quota_burst
+        ):
+            raise ValueError(
+                'NAMES_BATCH_UPSTREAM_CHUNK must not exceed NATIONALIZE_QUOTA_BURST'
+            )
+        return self
+
     @property
     def postgres_url(self) -> str:
         """Get PostgreSQL connection URL.
@@ -42,3 +233,12 @@ class Config(BaseSettings):
                 path=self.postgres_db,
             )
         )
+
+    @property
+    def sqlite_url(self) -> str:
+        """Get SQLite (aiosqlite) connection URL.
+
+        Returns:
+            str: SQLite connection URL
+        """
+        return f'sqlite+aiosqlite:///{self.sqlite_path}'
@@ -0,0 +1,81 @@
+import math
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+
+@dataclass
+class LatencyModel:
+    """Log-normal latency distribution, the usual shape of upstream latencies."""
+
+    median_ms: float
+    sigma: float
+    rng: random.Random = field(default_factory=random.Random)
+
+    def sample(self) -> float:
+        """Returns a latency in seconds."""
+        if self.median_ms <= 0:
+            return 0.0
+        return self.rng.lognormvariate(math.log(self.median_ms), self.sigma) / 1000
+
+
+@dataclass
+class FaultInjector:
+    """Fails a share of requests with upstream errors."""
+
+    error_rate: float
+    rng: random.Random = field(default_factory=random.Random)
+
+    def sample(self) -> int | None:
+        """Returns the status code of an injected error, None to answer normally."""
+        if self.rng.random() >= self.error_rate:
+            return None
+        return self.rng.choice((500, 502, 503))
+
+
+@dataclass
+class RateLimiter:
+    """Fixed-window rate limiter mimicking the Nationalize rate-limit headers.
+
+    Attributes:
+        limit: Names accepted per window, 0 disables the limit
+        window: Length of the window in seconds
+    """
+
+    limit: int
+    window: float
+    clock: Callable[[], float] = time.monotonic
+    _window_started_at: float | None = field(default=None, init=False, repr=False)
+    _used: int = field(default=0, init=False, repr=False)
+
+    def hit(self, cost: int = 1) -> tuple[bool, dict[str, str]]:
+        """Count a request against the window.
+
+        Args:
+            cost (int): Names in the request, Nationalize bills one call per name.
+
+        Returns:
+            tuple[bool, dict[str, str]]: Whether the request is allowed and the
+                rate-limit headers of the response.
+        """
+        if not self.limit:
+            return True, {}
+
+        now = self.clock()
+        if (
+            self._window_started_at is None
+            or now - self._window_started_at >= self.window
+        ):
+            self._window_started_at = now
+            self._used = 0
+
+        allowed = self._used + cost <= self.limit
+        if allowed:
+            self._used += cost
+        reset = max(0.0, self._window_started_at + self.window - now)
+        return allowed, {
+            'X-Rate-Limit-Limit': str(self.limit),
+            'X-Rate-Limit-Remaining': str(self.limit - self._used),
+            'X-Rate-Limit-Reset': str(math.ceil(reset)),
+        }
@@ -0,0 +1,38 @@
+from typing import Literal
+
+from pydantic import Field
+from pydantic_settings import (
+    BaseSettings,
+    SettingsConfigDict,
+)
+
+
+class SimulatorConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_file='.env', extra='ignore')
+
+    # 'synthetic' generates deterministic responses, 'record' proxies the real APIs
+    # and saves their responses as fixtures, 'replay' serves the saved fixtures
+    mode: Literal['synthetic', 'record', 'replay'] = Field(
+        alias='SIMULATOR_MODE', default='synthetic'
+    )
+    fixtures_dir: str = Field(
+        alias='SIMULATOR_FIXTURES_DIR', default='simulator/fixtures'
+    )
+    nationalize_upstream_url: str = Field(
+        alias='SIMULATOR_NATIONALIZE_UPSTREAM_URL', default='https://api.nationalize.io'
+    )
+    rest_countries_upstream_url: str = Field(
+        alias='SIMULATOR_REST_COUNTRIES_UPSTREAM_URL',
+        default='https://restcountries.com/v3.1',
+    )
+
+    # Log-normal latency: median in milliseconds and sigma of the underlying normal
+    latency_median_ms: float = Field(alias='SIMULATOR_LATENCY_MEDIAN_MS', default=80.0)
+    latency_sigma: float = Field(alias='SIMULATOR_LATENCY_SIGMA', default=0.5)
+    # Share of requests answered with a 5xx error
+    error_rate: float = Field(alias='SIMULATOR_ERROR_RATE', default=0.0)
+    # Names Nationalize accepts per window, 0 disables rate limiting
+    rate_limit: int = Field(alias='SIMULATOR_RATE_LIMIT', default=0)
+    rate_limit_window: float = Field(alias='SIMULATOR_RATE_LIMIT_WINDOW', default=60.0)
+    # Seed of latency and error sampling, for reproducible runs
+    seed: int | None = Field(alias='SIMULATOR_SEED', default=None)
@@ -0,0 +1,57 @@
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+
+@dataclass(frozen=True)
+class RecordedResponse:
+    status_code: int
+    body: Any
+
+
+@dataclass
+class FixtureStore:
+    """Recorded upstream responses, one JSON file per distinct request.
+
+    Files are keyed by upstream, path and query, so a recording made against the
+    real APIs is replayed for exactly the same requests.
+    """
+
+    directory: Path
+
+    def load(
+        self, upstream: str, path: str, query: list[tuple[str, str]]
+    ) -> RecordedResponse | None:
+        fixture_path = self._path(upstream, path, query)
+        if not fixture_path.exists():
+            return None
+
+        data = orjson.loads(fixture_path.read_bytes())
+        return RecordedResponse(status_code=data['status_code'], body=data['body'])
+
+    def save(
+        self,
+        upstream: str,
+        path: str,
+        query: list[tuple[str, str]],
+        response: RecordedResponse,
+    ) -> None:
+        fixture_path = self._path(upstream, path, query)
+        fixture_path.parent.mkdir(parents=True, exist_ok=True)
+        fixture_path.write_bytes(
+            orjson.dumps(
+                {
+                    'request': {'path': path, 'query': query},
+                    'status_code': response.status_code,
+                    'body': response.body,
+                },
+                option=orjson.OPT_INDENT_2,
+            )
+        )
+
+    def _path(self, upstream: str, path: str, query: list[tuple[str, str]]) -> Path:
+        key = hashlib.sha256(orjson.dumps([path, sorted(query)])).hexdigest()[:16]
+        return self.directory / upstream / f'{key}.json'
@@ -0,0 +1,210 @@
+import asyncio
+import random
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, FastAPI, Request
+from fastapi.responses import ORJSONResponse
+
+import httpx
+import orjson
+
+from infra.http.clients import NATIONALIZE, REST_COUNTRIES
+from simulator import synthetic
+from simulator.behavior import FaultInjector, LatencyModel, RateLimiter
+from simulator.config import SimulatorConfig
+from simulator.fixtures import FixtureStore, RecordedResponse
+
+
+@dataclass
+class UpstreamSimulator:
+    """Stand-in for the Nationalize and REST Countries APIs.
+
+    Every request is delayed by a sampled latency, may be rejected by the rate
+    limiter or an injected error, and is then answered from the synthetic data,
+    the recorded fixtures or the real upstream, depending on the mode.
+    """
+
+    config: SimulatorConfig
+    fixtures: FixtureStore
+    latency: LatencyModel
+    faults: FaultInjector
+    rate_limiter: RateLimiter
+    client: httpx.AsyncClient | None = None
+
+    async def respond(
+        self,
+        request: Request,
+        upstream: str,
+        path: str,
+        synthesize: Callable[[], RecordedResponse],
+        cost: int = 1,
+    ) -> ORJSONResponse:
+        allowed, headers = (
+            self.rate_limiter.hit(cost) if upstream == NATIONALIZE else (True, {})
+        )
+        await asyncio.sleep(self.latency.sample())
+
+        if not allowed:
+            return ORJSONResponse(
+                {'error': 'Request limit reached'}, status_code=429, headers=headers
+            )
+        if (status_code := self.faults.sample()) is not None:
+            return ORJSONResponse(
+                {'error': 'Simulated upstream error'},
+                status_code=status_code,
+                headers=headers,
+            )
+
+        query = list(request.query_params.multi_items())
+        match self.config.mode:
+            case 'replay':
+                recorded = self.fixtures.load(upstream, path, query)
+                if recorded is None:
+                    return ORJSONResponse(
+                        {'error': 'No fixture recorded for this request'},
+                        status_code=404,
+                    )
+            case 'record':
+                recorded = await self._record(upstream, path, query)
+            case _:
+                recorded = synthesize()
+
+        return ORJSONResponse(
+            recorded.body, status_code=recorded.status_code, headers=headers
+        )
+
+    async def _record(
+        self, upstream: str, path: str, query: list[tuple[str, str]]
+    ) -> RecordedResponse:
+        if self.client is None or self.client.is_closed:
+            self.client = httpx.AsyncClient(timeout=30.0)
+
+        base_url = (
+            self.config.nationalize_upstream_url
+            if upstream == NATIONALIZE
+            else self.config.rest_countries_upstream_url
+        )
+        response = await self.client.get(f'{base_url}{path}', params=query)
+        recorded = RecordedResponse(
+            status_code=response.status_code,
+            body=orjson.loads(response.content) if response.content else None,
+        )
+        self.fixtures.save(upstream, path, query, recorded)
+        return recorded
+
+
+def get_simulator(request: Request) -> UpstreamSimulator:
+    return request.app.state.simulator
+
+
+Simulator = Annotated[UpstreamSimulator, Depends(get_simulator)]
+
+nationalize_router = APIRouter(prefix='/nationalize', tags=['Nationalize'])
+countries_router = APIRouter(prefix='/countries', tags=['REST Countries'])
+
+
+@nationalize_router.get('/')
+async def get_name_origins(request: Request, simulator: Simulator) -> ORJSONResponse:
+    names = request.query_params.getlist('name[]')
+    single_name = request.query_params.get('name')
+
+    def synthesize() -> RecordedResponse:
+        if single_name is not None:
+            return RecordedResponse(200, synthetic.name_origin(single_name))
+        if not names:
+            return RecordedResponse(422, {'error': "Missing 'name' parameter"})
+        if len(names) > 10:
+            return RecordedResponse(422, {'error': "Invalid 'name[]' parameter"})
+        return RecordedResponse(200, [synthetic.name_origin(name) for name in names])
+
+    return await simulator.respond(
+        request, NATIONALIZE, '/', synthesize, cost=max(len(names), 1)
+    )
+
+
+@countries_router.get('/all')
+async def get_all_countries(request: Request, simulator: Simulator) -> ORJSONResponse:
+    return await simulator.respond(
+        request,
+        REST_COUNTRIES,
+        '/all',
+        lambda: RecordedResponse(
+            200, [synthetic.country(code) for code in synthetic.COUNTRIES]
+        ),
+    )
+
+
+@countries_router.get('/alpha')
+async def get_countries(request: Request, simulator: Simulator) -> ORJSONResponse:
+    def synthesize() -> RecordedResponse:
+        codes = request.query_params.get('codes', '')
+        if not codes:
+            return RecordedResponse(400, {'status': 400, 'message': 'Bad Request'})
+        countries = [synthetic.country(code) for code in codes.split(',') if code]
+        return RecordedResponse(200, [country for country in countries if country])
+
+    return await simulator.respond(request, REST_COUNTRIES, '/alpha', synthesize)
+
+
+@countries_router.get('/alpha/{code}')
+async def get_country(
+    code: str, request: Request, simulator: Simulator
+) -> ORJSONResponse:
+    def synthesize() -> RecordedResponse:
+        country = synthetic.country(code)
+        if country is None:
+            return RecordedResponse(404, {'status': 404, 'message': 'Not Found'})
+        return RecordedResponse(200, [country])
+
+    return await simulator.respond(
+        request, REST_COUNTRIES, f'/alpha/{code}', synthesize
+    )
+
+
+def create_app(config: SimulatorConfig | None = None) -> FastAPI:
+    """Create the upstream simulator application.
+
+    Point NATIONALIZE_API_URL to `<host>/nationalize` and REST_COUNTRIES_API_URL to
+    `<host>/countries` to use it instead of the real APIs.
+
+    Args:
+        config: Simulator settings, read from the environment when omitted
+
+    Returns:
+        FastAPI: Simulator application instance
+    """
+    config = config or SimulatorConfig()
+    rng = random.Random(config.seed)
+    simulator = UpstreamSimulator(
+        config=config,
+        fixtures=FixtureStore(directory=Path(config.fixtures_dir)),
+        latency=LatencyModel(
+            median_ms=config.latency_median_ms, sigma=config.latency_sigma, rng=rng
+        ),
+        faults=FaultInjector(error_rate=config.error_rate, rng=rng),
+        rate_limiter=RateLimiter(
+            limit=config.rate_limit, window=config.rate_limit_window
+        ),
+    )
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        yield
+        if simulator.client is not None:
+            await simulator.client.aclose()
+
+    app = FastAPI(
+        title='Upstream Simulator',
+        description='Local stand-in for the Nationalize and REST Countries APIs',
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
+    app.state.simulator = simulator
+    app.include_router(nationalize_router)
+    app.include_router(countries_router)
+
+    return app
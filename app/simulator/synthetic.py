@@ -0,0 +1,80 @@
+import hashlib
+import random
+from typing import Any
+
+
+# ISO 3166-1 alpha-2 codes with their common names, enough to exercise enrichment
+COUNTRIES: dict[str, tuple[str, str, str]] = {
+    'AR': ('Argentina', 'Americas', 'South America'),
+    'AU': ('Australia', 'Oceania', 'Australia and New Zealand'),
+    'BR': ('Brazil', 'Americas', 'South America'),
+    'CA': ('Canada', 'Americas', 'North America'),
+    'CN': ('China', 'Asia', 'Eastern Asia'),
+    'DE': ('Germany', 'Europe', 'Western Europe'),
+    'EG': ('Egypt', 'Africa', 'Northern Africa'),
+    'ES': ('Spain', 'Europe', 'Southern Europe'),
+    'FR': ('France', 'Europe', 'Western Europe'),
+    'GB': ('United Kingdom', 'Europe', 'Northern Europe'),
+    'GR': ('Greece', 'Europe', 'Southern Europe'),
+    'IE': ('Ireland', 'Europe', 'Northern Europe'),
+    'IN': ('India', 'Asia', 'Southern Asia'),
+    'IT': ('Italy', 'Europe', 'Southern Europe'),
+    'JP': ('Japan', 'Asia', 'Eastern Asia'),
+    'KR': ('South Korea', 'Asia', 'Eastern Asia'),
+    'MX': ('Mexico', 'Americas', 'North America'),
+    'NG': ('Nigeria', 'Africa', 'Western Africa'),
+    'NL': ('Netherlands', 'Europe', 'Western Europe'),
+    'PL': ('Poland', 'Europe', 'Central Europe'),
+    'PT': ('Portugal', 'Europe', 'Southern Europe'),
+    'RU': ('Russia', 'Europe', 'Eastern Europe'),
+    'SA': ('Saudi Arabia', 'Asia', 'Western Asia'),
+    'SE': ('Sweden', 'Europe', 'Northern Europe'),
+    'SY': ('Syria', 'Asia', 'Western Asia'),
+    'TR': ('Turkey', 'Asia', 'Western Asia'),
+    'UA': ('Ukraine', 'Europe', 'Eastern Europe'),
+    'US': ('United States', 'Americas', 'North America'),
+    'VN': ('Vietnam', 'Asia', 'South-Eastern Asia'),
+    'ZA': ('South Africa', 'Africa', 'Southern Africa'),
+}
+
+
+def name_origin(name: str) -> dict[str, Any]:
+    """Returns a Nationalize-shaped result, always the same for the same name."""
+    seed = int.from_bytes(hashlib.sha256(name.encode()).digest()[:8], 'big')
+    rng = random.Random(seed)
+    if rng.random() < 0.05:
+        return {'count': 0, 'name': name, 'country': []}
+
+    codes = rng.sample(sorted(COUNTRIES), k=rng.randint(1, 5))
+    weights = sorted((rng.random() for _ in codes), reverse=True)
+    total = sum(weights) / rng.uniform(0.5, 1.0)
+    return {
+        'count': rng.randint(1, 500_000),
+        'name': name,
+        'country': [
+            {'country_id': code, 'probability': round(weight / total, 6)}
+            for code, weight in zip(codes, weights)
+        ],
+    }
+
+
+def country(code: str) -> dict[str, Any] | None:
+    """Returns a REST Countries-shaped country, None for unknown codes."""
+    if code.upper() not in COUNTRIES:
+        return None
+
+    code = code.upper()
+    common_name, region, sub_region = COUNTRIES[code]
+    flag = f'https://flagcdn.com/w320/{code.lower()}'
+    return {
+        'cca2': code,
+        'name': {'common': common_name, 'official': common_name},
+        'region': region,
+        'subregion': sub_region,
+        'independent': True,
+        'capital': [f'{common_name} City'],
+        'capitalInfo': {'latlng': [0.0, 0.0]},
+        'flags': {'png': f'{flag}.png', 'svg': f'{flag}.svg', 'alt': None},
+        'coatOfArms': {},
+        'borders': [],
+    }
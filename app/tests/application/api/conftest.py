@@ -2,17 +2,22 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 import pytest
+from punq import Container
 
 from application.main import create_app
-from logic.init import init_container
-from tests.fixtures import init_dummy_container
+from logic.mediator import Mediator
+from settings.config import Config
 
 
 @pytest.fixture
-def app() -> FastAPI:
+def app(container: Container) -> FastAPI:
     app: FastAPI = create_app()
 
-    app.dependency_overrides[init_container] = init_dummy_container
+    # Handlers read what the lifespan stores on app.state; the tests set it from
+    # the test container instead, so no scheduler or worker pool is started
+    app.state.container = container
+    app.state.config = container.resolve(Config)
+    app.state.mediator = container.resolve(Mediator)
     return app
 
 
@@ -1,3 +1,5 @@
+from dataclasses import dataclass, field
+
 from fastapi import (
     FastAPI,
     status,
@@ -9,6 +11,18 @@ from httpx import Response
 from typing import Any
 
 
+@dataclass
+class DeadlineRecordingMediator:
+    """Mediator answering every command with a fixed result."""
+
+    result: Any
+    deadlines: list[float | None] = field(default_factory=list)
+
+    async def handle_command(self, command: Any, deadline: float | None = None):
+        self.deadlines.append(deadline)
+        return [self.result]
+
+
 @pytest.mark.asyncio
 async def test_get_name_origins_missing_parameter(
     app: FastAPI,
@@ -105,3 +119,33 @@ async def test_get_popular_names_success(
     assert isinstance(json_data, list)
     # Verify we get at most 5 results as per the handler's documentation
     assert len(json_data) <= 5
+
+
+@pytest.mark.parametrize('headers', [{}, {'X-Request-Timeout': '2.5'}])
+def test_name_routes_resolve_the_request_deadline(
+    app: FastAPI,
+    client: TestClient,
+    headers: dict[str, str],
+) -> None:
+    """The deadline dependency runs for the lookup and the batch routes."""
+    mediator = DeadlineRecordingMediator(result=[])
+    app.state.mediator = mediator
+
+    response: Response = client.get(
+        url=app.url_path_for('get_name_origins_handler'),
+        params={'name': 'Anna'},
+        headers=headers,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == []
+
+    mediator.result = {}
+    response = client.post(
+        url=app.url_path_for('get_batch_name_origins_handler'),
+        json={'names': ['Anna']},
+        headers=headers,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {'results': {}, 'errors': {}}
+    assert len(mediator.deadlines) == 2
+    assert all(deadline is not None for deadline in mediator.deadlines)
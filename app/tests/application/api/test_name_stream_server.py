@@ -0,0 +1,57 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import httpx
+import orjson
+import pytest
+import uvicorn
+
+from application.main import create_app
+from logic.commands.name import GetNameOriginsCommand
+from logic.exceptions.name import NameNotFoundException
+from settings.config import Config
+
+
+class NotFoundMediator:
+    async def handle_command(
+        self, command: GetNameOriginsCommand, deadline: float | None = None
+    ) -> list:
+        await asyncio.sleep(0.01)
+        raise NameNotFoundException(name=command.name)
+
+
+async def _body(*names: str) -> AsyncIterator[bytes]:
+    for name in names:
+        # Lines keep arriving while the first results are streamed back
+        await asyncio.sleep(0.05)
+        yield name.encode() + b'\n'
+
+
+@pytest.mark.asyncio
+async def test_stream_answers_every_line_through_a_real_server() -> None:
+    app = create_app()
+    app.state.config = Config()
+    app.state.mediator = NotFoundMediator()
+    server = uvicorn.Server(
+        uvicorn.Config(app, host='127.0.0.1', port=0, lifespan='off', log_level='error')
+    )
+    serving = asyncio.create_task(server.serve())
+    try:
+        while not server.started:
+            await asyncio.sleep(0.01)
+        port = server.servers[0].sockets[0].getsockname()[1]
+
+        names = ['anna', 'olga', 'maria', 'ivan']
+        async with (
+            asyncio.timeout(10),
+            httpx.AsyncClient(base_url=f'http://127.0.0.1:{port}') as client,
+        ):
+            response = await client.post('/api/v1/names/stream/', content=_body(*names))
+            lines = [orjson.loads(line) for line in response.text.splitlines()]
+    finally:
+        server.should_exit = True
+        await serving
+
+    assert response.status_code == 200
+    assert sorted(line['name'] for line in lines) == sorted(names)
+    assert all(line['error']['status'] == 404 for line in lines)
@@ -0,0 +1,43 @@
+from fastapi import HTTPException
+
+import pytest
+
+from application.v1.name.projection import get_response_projection
+from tests.factories import (
+    make_country,
+    make_name,
+)
+
+
+def test_fields_keep_only_the_requested_fields() -> None:
+    projection = get_response_projection(
+        fields='name, probability,country_code', compact=False
+    )
+
+    dumped = projection.dump([make_name('anna', 0.4, make_country('US'))])
+
+    assert dumped == [{'name': 'anna', 'probability': 0.4, 'country_code': 'US'}]
+
+
+def test_compact_mode_writes_each_country_once() -> None:
+    projection = get_response_projection(fields='probability,flag_png', compact=True)
+    country = make_country('US')
+
+    content = projection.render(
+        projection.dump(
+            [make_name('anna', 0.4, country), make_name('anne', 0.2, country)]
+        )
+    )
+
+    assert content == {
+        'origins': [
+            {'probability': 0.4, 'country_code': 'US'},
+            {'probability': 0.2, 'country_code': 'US'},
+        ],
+        'countries': {'US': {'flag_png': country.flag_png}},
+    }
+
+
+def test_unknown_fields_are_rejected() -> None:
+    with pytest.raises(HTTPException):
+        get_response_projection(fields='name,flag_gif', compact=False)
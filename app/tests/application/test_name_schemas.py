@@ -0,0 +1,14 @@
+from application.v1.name.schemas import NameOriginsOutSchema
+from tests.factories import (
+    make_country,
+    make_name,
+)
+
+
+def test_dump_entity_matches_the_validated_schema() -> None:
+    name_origin = make_name('anna', 0.4, make_country('US'))
+
+    assert (
+        NameOriginsOutSchema.dump_entity(name_origin)
+        == NameOriginsOutSchema.from_entity(name_origin).model_dump()
+    )
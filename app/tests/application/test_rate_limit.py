@@ -0,0 +1,53 @@
+import httpx
+import pytest
+from starlette.types import (
+    Receive,
+    Scope,
+    Send,
+)
+
+from application.rate_limit import RateLimitMiddleware
+from utils.rate_limit import ClientRateLimiter
+
+
+async def ok_app(scope: Scope, receive: Receive, send: Send) -> None:
+    await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+    await send({'type': 'http.response.body', 'body': b''})
+
+
+async def get_statuses(
+    middleware: RateLimitMiddleware, forwarded_for: list[str]
+) -> list[int]:
+    transport = httpx.ASGITransport(app=middleware, client=('10.0.0.1', 1234))
+    async with httpx.AsyncClient(transport=transport, base_url='http://test') as client:
+        return [
+            (
+                await client.get(
+                    '/api/v1/names/', headers={'X-Forwarded-For': forwarded}
+                )
+            ).status_code
+            for forwarded in forwarded_for
+        ]
+
+
+@pytest.mark.asyncio
+async def test_clients_behind_a_proxy_share_the_address_of_the_proxy() -> None:
+    middleware = RateLimitMiddleware(
+        app=ok_app, limiter=ClientRateLimiter(rate=0.001, burst=1.0)
+    )
+
+    assert await get_statuses(middleware, ['1.1.1.1', '2.2.2.2']) == [200, 429]
+
+
+@pytest.mark.asyncio
+async def test_trusted_proxies_give_each_client_its_own_bucket() -> None:
+    middleware = RateLimitMiddleware(
+        app=ok_app,
+        limiter=ClientRateLimiter(rate=0.001, burst=1.0),
+        trusted_proxies=1,
+    )
+
+    # Only the address appended by the proxy counts, not the forged ones before it
+    assert await get_statuses(
+        middleware, ['1.1.1.1', '9.9.9.9, 2.2.2.2', '8.8.8.8, 1.1.1.1']
+    ) == [200, 200, 429]
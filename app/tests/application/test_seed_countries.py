@@ -0,0 +1,22 @@
+import logging
+from pathlib import Path
+
+import pytest
+from punq import Container
+
+from application.main import seed_countries
+from infra.snapshots.countries import CountrySnapshot
+
+
+@pytest.mark.asyncio
+async def test_missing_snapshot_falls_back_to_fetching_on_demand(
+    container: Container, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    container.register(
+        CountrySnapshot, instance=CountrySnapshot(path=tmp_path / 'missing.json')
+    )
+
+    with caplog.at_level(logging.WARNING, logger='application.main'):
+        await seed_countries(container)
+
+    assert 'missing.json is missing' in caplog.text
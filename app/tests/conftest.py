@@ -2,10 +2,15 @@ from punq import Container
 from pytest import fixture
 
 from infra.repositories.api.base import (
-    BaseNameOriginAPIRepository,
     BaseCountryAPIRepository,
+    BaseNameOriginAPIRepository,
 )
 from logic.mediator import Mediator
+from tests.fakes import (
+    FakeCountryAPIRepository,
+    FakeNameOriginAPIRepository,
+    FlakyNameOriginAPIRepository,
+)
 from tests.fixtures import init_dummy_container
 
 
@@ -27,3 +32,18 @@ def name_origin_repository(container: Container) -> BaseNameOriginAPIRepository:
 @fixture()
 def country_repository(container: Container) -> BaseCountryAPIRepository:
     return container.resolve(service_key=BaseCountryAPIRepository)
+
+
+@fixture()
+def fake_country_api_repository() -> FakeCountryAPIRepository:
+    return FakeCountryAPIRepository(countries=[])
+
+
+@fixture()
+def fake_name_origin_api_repository() -> FakeNameOriginAPIRepository:
+    return FakeNameOriginAPIRepository()
+
+
+@fixture()
+def flaky_name_origin_api_repository() -> FlakyNameOriginAPIRepository:
+    return FlakyNameOriginAPIRepository()
@@ -0,0 +1,18 @@
+import pytest
+
+from domain.exceptions.cursor import InvalidCursorException
+from domain.values.cursor import PageCursor
+
+
+def test_cursor_round_trip() -> None:
+    cursor = PageCursor.from_position(0.123456789, 42)
+
+    decoded = PageCursor(cursor.as_generic_type())
+    assert decoded.probability == 0.123456789
+    assert decoded.row_id == 42
+
+
+@pytest.mark.parametrize('value', ['', 'not-a-cursor', '!!!', 'MC41'])
+def test_invalid_cursor(value: str) -> None:
+    with pytest.raises(InvalidCursorException):
+        PageCursor(value)
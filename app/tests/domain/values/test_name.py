@@ -36,6 +36,21 @@ class TestNameVT:
         assert name1 != name3  # Different value
         assert name1 != 'John'  # Different type
 
+    @pytest.mark.parametrize(
+        'name,canonical',
+        [
+            ('Anna', 'anna'),
+            (' Anna ', 'anna'),
+            ('ANNA', 'anna'),
+            ('Zoe\u0301', 'zo\u00e9'),  # NFD-decomposed "Zoé"
+            ('Straße', 'strasse'),
+            ('Ｊｏｈｎ', 'john'),  # Full-width letters
+        ],
+    )
+    def test_name_canonical(self, name: str, canonical: str) -> None:
+        assert Name(name).canonical == canonical
+        assert Name(canonical).canonical == canonical
+
     def test_create_name(self, faker: Faker) -> None:
         name_length = faker.random_int(min=1, max=85)
         random_name = faker.pystr(min_chars=name_length, max_chars=name_length)
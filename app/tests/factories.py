@@ -0,0 +1,36 @@
+from domain.entities.country import CountryEntity
+from domain.entities.name import NameEntity
+from domain.values.name import (
+    CountOfRequests,
+    Name,
+    Probability,
+)
+
+
+def make_country(iso_alpha2_code: str = 'US') -> CountryEntity:
+    return CountryEntity(
+        iso_alpha2_code=iso_alpha2_code,
+        common_name='United States',
+        official_name='United States of America',
+        region='Americas',
+        sub_region='North America',
+        independent=True,
+        capital={'Washington, D.C.'},
+        capital_lat=38.8951,
+        capital_long=-77.0364,
+        flag_png='https://flagcdn.com/w320/us.png',
+        flag_svg='https://flagcdn.com/us.svg',
+        flag_alt=None,
+        coat_of_arms_png=None,
+        coat_of_arms_svg=None,
+        borders={'CAN', 'MEX'},
+    )
+
+
+def make_name(name: str, probability: float, country: CountryEntity) -> NameEntity:
+    return NameEntity(
+        name=Name(name),
+        count_of_requests=CountOfRequests(10),
+        probability=Probability(probability),
+        country=country,
+    )
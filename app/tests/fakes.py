@@ -0,0 +1,71 @@
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from domain.entities.country import CountryEntity
+from domain.entities.name import NameStrEntity
+from domain.values.name import (
+    CountOfRequests,
+    Name,
+    Probability,
+)
+from infra.exceptions.upstream import UpstreamUnavailableException
+from infra.repositories.api.base import (
+    BaseCountryAPIRepository,
+    BaseNameOriginAPIRepository,
+    CountriesRevision,
+)
+
+
+@dataclass
+class FakeCountryAPIRepository(BaseCountryAPIRepository):
+    countries: list[CountryEntity]
+    etag: str = '"v1"'
+    requests: list[str | None] = field(default_factory=list)
+
+    async def get_list_of_countries(self) -> list[CountryEntity]:
+        return self.countries
+
+    async def get_country(self, name: str) -> CountryEntity | None:
+        return None
+
+    async def revalidate_list_of_countries(
+        self,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        digest: str | None = None,
+    ) -> CountriesRevision:
+        self.requests.append(etag)
+        if etag == self.etag:
+            return CountriesRevision(countries=None, etag=etag)
+        return CountriesRevision(countries=self.countries, etag=self.etag)
+
+
+@dataclass
+class FakeNameOriginAPIRepository(BaseNameOriginAPIRepository):
+    lookups: list[str] = field(default_factory=list)
+
+    async def get_name_origins(self, name: str) -> list[NameStrEntity] | None:
+        self.lookups.append(name)
+        return [
+            NameStrEntity(
+                name=Name(value=name),
+                probability=Probability(value=0.5),
+                count_of_requests=CountOfRequests(value=10),
+                country_name='US',
+            )
+        ]
+
+
+@dataclass
+class FlakyNameOriginAPIRepository(FakeNameOriginAPIRepository):
+    unavailable_once: str = 'bob'
+
+    async def get_name_origins(self, name: str) -> list[NameStrEntity] | None:
+        if name == 'unknown':
+            return None
+        if name == self.unavailable_once:
+            self.unavailable_once = ''
+            raise UpstreamUnavailableException(upstream='nationalize', retry_after=0)
+        return await super().get_name_origins(name)
@@ -0,0 +1,72 @@
+import asyncio
+from dataclasses import dataclass, field
+
+import pytest
+
+from domain.entities.name import NameStrEntity
+from domain.values.name import CountOfRequests, Name, Probability
+from infra.repositories.api.base import BaseNameOriginAPIRepository
+from infra.repositories.api.batching import BatchingNameOriginAPIRepository
+
+
+@dataclass
+class RecordingNameOriginAPIRepository(BaseNameOriginAPIRepository):
+    batches: list[list[str]] = field(default_factory=list)
+
+    async def get_name_origins(self, name: str) -> list[NameStrEntity] | None:
+        return (await self.get_batch_name_origins([name]))[name]
+
+    async def get_batch_name_origins(
+        self, names: list[str]
+    ) -> dict[str, list[NameStrEntity] | None]:
+        self.batches.append(names)
+        await asyncio.sleep(0)
+        return {
+            name: [
+                NameStrEntity(
+                    name=Name(name),
+                    count_of_requests=CountOfRequests(1),
+                    probability=Probability(0.5),
+                    country_name='US',
+                )
+            ]
+            if name != 'unknown'
+            else None
+            for name in names
+        }
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_batch() -> None:
+    upstream = RecordingNameOriginAPIRepository()
+    repository = BatchingNameOriginAPIRepository(repository=upstream, window=0.01)
+
+    results = await asyncio.gather(
+        repository.get_name_origins('anna'),
+        repository.get_name_origins('john'),
+        repository.get_name_origins('anna'),
+        repository.get_name_origins('unknown'),
+    )
+
+    assert upstream.batches == [['anna', 'john', 'unknown']]
+    assert results[0] and results[0][0].name.as_generic_type() == 'anna'
+    assert results[1] and results[1][0].name.as_generic_type() == 'john'
+    assert results[2] == results[0]
+    assert results[3] is None
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_sent_without_waiting() -> None:
+    upstream = RecordingNameOriginAPIRepository()
+    repository = BatchingNameOriginAPIRepository(
+        repository=upstream, window=60, max_batch_size=3
+    )
+
+    await asyncio.wait_for(
+        asyncio.gather(
+            *(repository.get_name_origins(name) for name in ('a', 'b', 'c'))
+        ),
+        timeout=1,
+    )
+
+    assert upstream.batches == [['a', 'b', 'c']]
@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import orjson
+import pytest
+
+from domain.entities.country import CountryEntity
+from infra.exceptions.snapshot import SnapshotVersionException
+from infra.snapshots.countries import CountrySnapshot
+
+
+def make_country(code: str) -> CountryEntity:
+    return CountryEntity(
+        iso_alpha2_code=code,
+        common_name=f'Country {code}',
+        official_name=f'Republic of {code}',
+        region='Asia',
+        sub_region='Western Asia',
+        independent=True,
+        capital={'Capital'},
+        capital_lat=33.5,
+        capital_long=36.3,
+        flag_png=f'https://flagcdn.com/w320/{code.lower()}.png',
+        flag_svg=f'https://flagcdn.com/{code.lower()}.svg',
+        flag_alt=None,
+        coat_of_arms_png=None,
+        coat_of_arms_svg=None,
+        borders={'IRQ', 'JOR'},
+    )
+
+
+def test_snapshot_round_trip(tmp_path: Path) -> None:
+    snapshot = CountrySnapshot(path=tmp_path / 'countries.json')
+
+    assert snapshot.write([make_country('SY'), make_country('LB')], source='test') == 2
+
+    countries = snapshot.load()
+    assert [country.iso_alpha2_code for country in countries] == ['LB', 'SY']
+    assert countries[1].borders == {'IRQ', 'JOR'}
+    assert countries[1].capital_name == 'Capital'
+
+
+def test_snapshot_of_another_version_is_rejected(tmp_path: Path) -> None:
+    snapshot = CountrySnapshot(path=tmp_path / 'countries.json')
+    snapshot.path.write_bytes(orjson.dumps({'version': 0, 'countries': []}))
+
+    with pytest.raises(SnapshotVersionException):
+        snapshot.load()
@@ -0,0 +1,31 @@
+from datetime import datetime, timedelta
+
+from infra.indexes.hot_names import HotNameTracker
+
+
+def test_due_names_are_the_hottest_expiring_soonest_first() -> None:
+    tracker = HotNameTracker()
+    now = datetime.now()
+    for _ in range(3):
+        tracker.record('anna', 'Anna', now + timedelta(minutes=30))
+    for _ in range(2):
+        tracker.record('zoe', 'Zoé', now + timedelta(minutes=10))
+    tracker.record('rare', 'Rare', now + timedelta(minutes=5))
+    tracker.record('fresh', 'Fresh', now + timedelta(hours=20))
+
+    assert tracker.due(top=2, before=now + timedelta(hours=1)) == [
+        ('zoe', 'Zoé'),
+        ('anna', 'Anna'),
+    ]
+
+
+def test_capacity_keeps_the_hottest_names() -> None:
+    tracker = HotNameTracker(capacity=1)
+    expires_at = datetime.now()
+    tracker.record('anna', 'Anna', expires_at)
+    tracker.record('anna', 'Anna', expires_at)
+    tracker.record('zoe', 'Zoe', expires_at)
+    tracker.record('max', 'Max', expires_at)
+
+    assert len(tracker) == 1
+    assert tracker.due(top=10, before=expires_at) == [('anna', 'Anna')]
@@ -0,0 +1,54 @@
+import importlib.util
+import logging
+
+import httpx
+import pytest
+
+from infra.http.clients import (
+    HTTPClientRegistry,
+    MeteredTransport,
+    UpstreamClientSettings,
+    UpstreamMetrics,
+)
+
+
+@pytest.mark.asyncio
+async def test_metered_transport_counts_http2_responses() -> None:
+    versions = iter([b'HTTP/2', b'HTTP/1.1'])
+    metrics = UpstreamMetrics()
+    transport = MeteredTransport(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(
+                200, extensions={'http_version': next(versions)}
+            )
+        ),
+        metrics=metrics,
+    )
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        await client.get('https://upstream.test/')
+        await client.get('https://upstream.test/')
+
+    assert metrics.requests == 2
+    assert metrics.as_dict()['http2_responses'] == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_h2_falls_back_to_http1_with_a_warning(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    find_spec = importlib.util.find_spec
+    monkeypatch.setattr(
+        importlib.util,
+        'find_spec',
+        lambda name, *args: None if name == 'h2' else find_spec(name, *args),
+    )
+    registry = HTTPClientRegistry(
+        settings={'upstream': UpstreamClientSettings(base_url='https://upstream.test')}
+    )
+
+    with caplog.at_level(logging.WARNING, logger='infra.http.clients'):
+        client = registry.get_client('upstream')
+
+    assert 'h2 package is not installed' in caplog.text
+    await client.aclose()
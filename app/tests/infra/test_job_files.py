@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pytest
+
+from infra.exceptions.jobs import JobInputTooLargeException
+from infra.files.jobs import JobFileStore
+
+
+async def _names(*names: str):
+    for name in names:
+        yield name
+
+
+@pytest.mark.asyncio
+async def test_input_is_written_in_blocks(tmp_path: Path) -> None:
+    files = JobFileStore(directory=tmp_path, write_block_size=8)
+    names = [f'name{number}' for number in range(10)]
+
+    assert await files.write_input('job', _names(*names), max_bytes=1000) == 10
+    assert list(files.iter_input('job', start=8)) == ['name8', 'name9']
+
+
+@pytest.mark.asyncio
+async def test_input_too_large_is_not_kept(tmp_path: Path) -> None:
+    files = JobFileStore(directory=tmp_path, write_block_size=8)
+
+    with pytest.raises(JobInputTooLargeException):
+        await files.write_input('job', _names('anna', 'olga', 'maria'), max_bytes=12)
+    assert not files.input_path('job').exists()
+
+
+@pytest.mark.asyncio
+async def test_appended_results_are_checkpointed_by_size(tmp_path: Path) -> None:
+    files = JobFileStore(directory=tmp_path)
+
+    with files.open_results('job', offset=0) as results:
+        assert await files.append(results, b'{"name":"anna"}\n') == 16
+        assert await files.append(results, b'{"name":"olga"}\n') == 32
+    with files.open_results('job', offset=16) as results:
+        assert await files.append(results, b'{"name":"maria"}\n') == 33
+
+    assert files.results_path('job').read_bytes() == (
+        b'{"name":"anna"}\n{"name":"maria"}\n'
+    )
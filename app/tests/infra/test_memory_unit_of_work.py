@@ -0,0 +1,94 @@
+import pytest
+
+from infra.repositories.memory.unit_of_work import InMemoryUnitOfWork
+from tests.factories import (
+    make_country,
+    make_name,
+)
+
+
+@pytest.mark.asyncio
+async def test_writes_are_visible_after_commit() -> None:
+    uow = InMemoryUnitOfWork()
+    country = make_country()
+
+    async with uow:
+        await uow.country.add_country(country)
+        await uow.name.add_name_origin(make_name('Anna', 0.4, country))
+        assert await uow.country.get_country('US') is None
+        await uow.commit()
+
+    async with uow:
+        assert await uow.country.get_country('US') == country
+        name_origins = await uow.name.get_name_origins(' ANNA')
+        assert name_origins
+        assert name_origins[0].name.as_generic_type() == 'Anna'
+
+
+@pytest.mark.asyncio
+async def test_writes_are_discarded_without_commit() -> None:
+    uow = InMemoryUnitOfWork()
+
+    async with uow:
+        await uow.country.add_country(make_country())
+
+    async with uow:
+        assert await uow.country.get_country('US') is None
+
+
+@pytest.mark.asyncio
+async def test_update_replaces_row_of_same_name_and_country() -> None:
+    uow = InMemoryUnitOfWork()
+    country = make_country()
+
+    async with uow:
+        await uow.country.add_country(country)
+        await uow.name.add_name_origin(make_name('Anna', 0.4, country))
+        await uow.commit()
+
+    async with uow:
+        await uow.name.update_name_origin(make_name('anna', 0.6, country))
+        await uow.commit()
+
+    async with uow:
+        name_origins = await uow.name.get_name_origins('Anna')
+        assert name_origins
+        assert len(name_origins) == 1
+        assert name_origins[0].probability.as_generic_type() == 0.6
+
+
+@pytest.mark.asyncio
+async def test_get_frequent_names_by_country_pages() -> None:
+    uow = InMemoryUnitOfWork()
+    country = make_country()
+
+    async with uow:
+        await uow.country.add_country(country)
+        for index in range(7):
+            await uow.name.add_name_origin(
+                make_name(f'Name{index}', index / 10, country)
+            )
+        await uow.commit()
+
+    async with uow:
+        first_page = await uow.name.get_frequent_names_by_country('US', limit=5)
+        assert [name.probability.as_generic_type() for name in first_page.names] == [
+            0.6,
+            0.5,
+            0.4,
+            0.3,
+            0.2,
+        ]
+        assert first_page.next_cursor
+
+        last_page = await uow.name.get_frequent_names_by_country(
+            'US', limit=5, cursor=first_page.next_cursor
+        )
+        assert [name.probability.as_generic_type() for name in last_page.names] == [
+            0.1,
+            0.0,
+        ]
+        assert last_page.next_cursor is None
+
+        empty_page = await uow.name.get_frequent_names_by_country('ZZ')
+        assert not empty_page.names
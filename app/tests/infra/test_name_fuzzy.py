@@ -0,0 +1,79 @@
+import pytest
+
+from domain.entities.name import NameSuggestionEntity
+from infra.indexes.name_fuzzy import NameFuzzyIndex, transposition_distance
+
+
+@pytest.mark.parametrize(
+    'left, right, distance',
+    [
+        ('michael', 'michael', 0),
+        ('micheal', 'michael', 1),
+        ('mihcael', 'michael', 1),
+        ('micael', 'michael', 1),
+        ('mikhail', 'michael', 2),
+    ],
+)
+def test_transposition_distance(left: str, right: str, distance: int) -> None:
+    assert transposition_distance(left, right) == distance
+    assert transposition_distance(left, right, bound=1) == min(distance, 2)
+
+
+def test_closest_name_within_the_allowed_typos() -> None:
+    index = NameFuzzyIndex(max_distance=2)
+    index.load(
+        NameSuggestionEntity(key=name.lower(), name=name, count_of_requests=count)
+        for name, count in [
+            ('Michael', 90),
+            ('Michaela', 10),
+            ('Anna', 50),
+            ('Anne', 80),
+            ('Bob', 30),
+        ]
+    )
+
+    def closest(key: str) -> str | None:
+        match = index.closest(key)
+        return match.name if match else None
+
+    assert closest('micheal') == 'Michael'
+    assert closest('mihcaelaa') == 'Michaela'
+    # Equally close names: the most requested one
+    assert closest('anny') == 'Anne'
+    # Short names allow one typo only
+    assert closest('bbo') == 'Bob'
+    assert closest('bxx') is None
+    assert closest('zzzzzzz') is None
+    assert len(index) == 5
+
+
+def test_names_put_while_tables_are_prepared_are_kept() -> None:
+    index = NameFuzzyIndex()
+    tables = index.prepare(
+        [NameSuggestionEntity(key='michael', name='Michael', count_of_requests=9)]
+    )
+    index.put('olga', 'Olga', 3)
+
+    index.install(tables)
+
+    assert len(index) == 2
+    assert index.closest('olgaa').name == 'Olga'
+    assert index.closest('micheal').name == 'Michael'
+
+
+def test_lookup_during_a_put_never_finds_a_key_without_its_entry() -> None:
+    index = NameFuzzyIndex()
+    index.put('michael', 'Michael', 9)
+    lookups: list[str | None] = []
+
+    class LookingUpPostings(dict):
+        def setdefault(self, key, default=None):
+            # A lookup in a worker thread lands between two posts of the new key
+            found = index.closest('micheal')
+            lookups.append(found.name if found else None)
+            return super().setdefault(key, default)
+
+    index._tables.postings = LookingUpPostings(index._tables.postings)
+    index.put('michaela', 'Michaela', 20)
+
+    assert lookups and set(lookups) <= {'Michael', 'Michaela'}
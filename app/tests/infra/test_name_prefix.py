@@ -0,0 +1,42 @@
+import pytest
+
+from domain.entities.name import NameSuggestionEntity
+from infra.indexes.name_prefix import NamePrefixIndex
+
+
+def completions(index: NamePrefixIndex, prefix: str, limit: int = 10) -> list[str]:
+    return [suggestion.name for suggestion in index.complete(prefix, limit=limit)]
+
+
+def test_completions_are_ranked_by_count_of_requests() -> None:
+    index = NamePrefixIndex(max_limit=3)
+    index.load(
+        NameSuggestionEntity(key=name.lower(), name=name, count_of_requests=count)
+        for name, count in [
+            ('Anna', 50),
+            ('Andrew', 80),
+            ('Anastasia', 20),
+            ('Ann', 50),
+            ('Bob', 999),
+        ]
+    )
+
+    assert completions(index, 'an') == ['Andrew', 'Ann', 'Anna']
+    assert completions(index, 'an', limit=1) == ['Andrew']
+    assert completions(index, 'ann') == ['Ann', 'Anna']
+    assert completions(index, 'b') == ['Bob']
+    assert completions(index, 'c') == []
+
+
+@pytest.mark.parametrize('prefix', ['a', 'an', 'ana'])
+def test_put_invalidates_the_cached_prefixes_of_the_name(prefix: str) -> None:
+    index = NamePrefixIndex(max_limit=2)
+    index.put('anna', 'Anna', 50)
+    index.put('anastasia', 'Anastasia', 20)
+    assert completions(index, prefix)[-1] == 'Anastasia'
+
+    index.put('anatoly', 'Anatoly', 70)
+    index.put('anastasia', 'Anastasia', 90)
+
+    assert completions(index, prefix) == ['Anastasia', 'Anatoly']
+    assert len(index) == 3
@@ -0,0 +1,110 @@
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from infra.exceptions.upstream import UpstreamQuotaExhaustedException
+from infra.repositories.api.quota import (
+    background_priority,
+    QuotaAwareNameOriginAPIRepository,
+    QuotaManager,
+)
+from settings.config import Config
+from tests.fakes import FakeNameOriginAPIRepository
+from utils.shared_state import SharedStateFile
+
+
+def make_quota(path: Path, **kwargs) -> QuotaManager:
+    return QuotaManager(
+        upstream='test', state=SharedStateFile(path=path / 'quota.json'), **kwargs
+    )
+
+
+def make_response(status_code: int, headers: dict[str, str]) -> httpx.Response:
+    return httpx.Response(
+        status_code,
+        headers=headers,
+        request=httpx.Request('GET', 'https://upstream.test/'),
+    )
+
+
+@pytest.mark.asyncio
+async def test_bucket_is_shared_through_the_state_file(tmp_path: Path) -> None:
+    first = make_quota(tmp_path, rate=0.001, burst=2)
+    second = make_quota(tmp_path, rate=0.001, burst=2)
+
+    await first.acquire()
+    await second.acquire()
+
+    with pytest.raises(UpstreamQuotaExhaustedException):
+        await first.acquire()
+
+
+@pytest.mark.asyncio
+async def test_reported_quota_reserve_applies_to_background_work(
+    tmp_path: Path,
+) -> None:
+    quota = make_quota(tmp_path, background_reserve=10)
+    await quota.observe(
+        make_response(200, {'X-Rate-Limit-Remaining': '10', 'X-Rate-Limit-Reset': '60'})
+    )
+
+    with background_priority(), pytest.raises(UpstreamQuotaExhaustedException):
+        await quota.acquire()
+
+    await quota.acquire()
+    assert (await quota.snapshot())['remaining'] == 9
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_response_exhausts_quota(tmp_path: Path) -> None:
+    quota = make_quota(tmp_path)
+    await quota.observe(make_response(429, {'Retry-After': '30'}))
+
+    with pytest.raises(UpstreamQuotaExhaustedException) as exc_info:
+        await quota.acquire()
+
+    assert exc_info.value.retry_after is not None
+    assert exc_info.value.retry_after > 25
+
+
+@pytest.mark.asyncio
+async def test_malformed_rate_limit_headers_are_ignored(tmp_path: Path) -> None:
+    quota = make_quota(tmp_path)
+    await quota.observe(
+        make_response(
+            200, {'X-Rate-Limit-Remaining': 'many', 'X-Rate-Limit-Reset': 'soon'}
+        )
+    )
+    await quota.observe(make_response(429, {'Retry-After': 'Wed, 21 Oct 2026'}))
+
+    # The quota is exhausted, but not beyond a short wait
+    snapshot = await quota.snapshot()
+    assert snapshot['remaining'] == 0
+    assert 0 < snapshot['reset_at'] - time.time() <= 1
+
+
+@pytest.mark.asyncio
+async def test_default_batch_chunk_is_admitted_from_a_partly_drained_bucket(
+    tmp_path: Path,
+) -> None:
+    config = Config()
+    quota = make_quota(tmp_path, rate=0.001, burst=config.nationalize_quota_burst)
+    repository = QuotaAwareNameOriginAPIRepository(
+        repository=FakeNameOriginAPIRepository(), quota=quota
+    )
+    for _ in range(30):
+        await quota.acquire()
+
+    names = [f'name{number}' for number in range(config.names_batch_upstream_chunk)]
+    assert list(await repository.get_batch_name_origins(names)) == names
+
+
+def test_batch_chunk_larger_than_the_quota_burst_is_rejected() -> None:
+    with pytest.raises(ValueError, match='NAMES_BATCH_UPSTREAM_CHUNK'):
+        Config(
+            NATIONALIZE_QUOTA_ENABLED=True,
+            NATIONALIZE_QUOTA_BURST=20,
+            NAMES_BATCH_UPSTREAM_CHUNK=50,
+        )
@@ -0,0 +1,125 @@
+import asyncio
+
+import httpx
+import pytest
+
+from infra.exceptions.upstream import UpstreamUnavailableException
+from infra.repositories.api.resilience import (
+    CircuitBreaker,
+    CircuitState,
+    ResilientCaller,
+)
+
+
+def make_status_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request('GET', 'https://upstream.test/')
+    return httpx.HTTPStatusError(
+        'error',
+        request=request,
+        response=httpx.Response(status_code, request=request),
+    )
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_failures() -> None:
+    caller = ResilientCaller(upstream='test', retry_attempts=2, retry_base_delay=0)
+    calls = 0
+
+    async def operation() -> str:
+        nonlocal calls
+        calls += 1
+        if calls < 3:
+            raise httpx.ConnectError('connection refused')
+        return 'ok'
+
+    assert await caller.call(operation) == 'ok'
+    assert calls == 3
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried() -> None:
+    caller = ResilientCaller(upstream='test', retry_attempts=2, retry_base_delay=0)
+    calls = 0
+
+    async def operation() -> str:
+        nonlocal calls
+        calls += 1
+        raise make_status_error(400)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await caller.call(operation)
+    assert calls == 1
+    assert caller.breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast() -> None:
+    caller = ResilientCaller(
+        upstream='test',
+        breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60),
+        retry_attempts=5,
+        retry_base_delay=0,
+    )
+    calls = 0
+
+    async def operation() -> str:
+        nonlocal calls
+        calls += 1
+        raise make_status_error(503)
+
+    with pytest.raises(UpstreamUnavailableException) as exc_info:
+        await caller.call(operation)
+    assert calls == 2
+    assert caller.breaker.state == CircuitState.OPEN
+    assert exc_info.value.retry_after
+
+    with pytest.raises(UpstreamUnavailableException):
+        await caller.call(operation)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_wins_over_slow_one() -> None:
+    caller = ResilientCaller(upstream='test', hedge_percentile=50)
+    for _ in range(caller.latencies.min_samples):
+        caller.latencies.record(0.01)
+    calls = 0
+
+    async def operation() -> int:
+        nonlocal calls
+        calls += 1
+        attempt = calls
+        await asyncio.sleep(10 if attempt == 1 else 0)
+        return attempt
+
+    assert await asyncio.wait_for(caller.call(operation), timeout=1) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_half_open_probe_is_released() -> None:
+    caller = ResilientCaller(
+        upstream='test',
+        breaker=CircuitBreaker(failure_threshold=1, reset_timeout=0),
+        retry_attempts=0,
+    )
+    caller.breaker.record_failure()
+    probing = asyncio.Event()
+
+    async def hanging_probe() -> str:
+        probing.set()
+        await asyncio.sleep(10)
+        return 'late'
+
+    probe = asyncio.ensure_future(caller.call(hanging_probe))
+    await probing.wait()
+    assert caller.breaker.state == CircuitState.HALF_OPEN
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    async def operation() -> str:
+        return 'ok'
+
+    # The next call is let through as a new probe and closes the circuit
+    assert await caller.call(operation) == 'ok'
+    assert caller.breaker.state == CircuitState.CLOSED
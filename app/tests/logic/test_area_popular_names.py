@@ -0,0 +1,98 @@
+from dataclasses import (
+    dataclass,
+    replace,
+)
+
+import pytest
+
+from domain.entities.country import AreaType
+from domain.entities.name import NameStrEntity
+from domain.values.name import (
+    CountOfRequests,
+    Name,
+    Probability,
+)
+from infra.repositories.api.base import BaseNameOriginAPIRepository
+from infra.repositories.memory.unit_of_work import InMemoryUnitOfWork
+from logic.commands.name import (
+    GetNameOriginsCommand,
+    GetNameOriginsCommandHandler,
+    GetPopularNamesByAreaCommand,
+    GetPopularNamesByAreaCommandHandler,
+)
+from logic.exceptions.country import AreaNotFoundException
+from tests.factories import make_country
+from tests.fakes import FakeCountryAPIRepository
+
+
+@dataclass
+class AreaNameOriginAPIRepository(BaseNameOriginAPIRepository):
+    # Name -> (count of requests, [(country code, probability)])
+    origins: dict[str, tuple[int, list[tuple[str, float]]]]
+
+    async def get_name_origins(self, name: str) -> list[NameStrEntity] | None:
+        count, countries = self.origins[name]
+        return [
+            NameStrEntity(
+                name=Name(value=name),
+                probability=Probability(value=probability),
+                count_of_requests=CountOfRequests(value=count),
+                country_name=code,
+            )
+            for code, probability in countries
+        ]
+
+
+@pytest.mark.asyncio
+async def test_area_popularity_is_weighted_and_follows_stored_origins(
+    fake_country_api_repository: FakeCountryAPIRepository,
+) -> None:
+    api = AreaNameOriginAPIRepository(
+        origins={
+            'anna': (100, [('PL', 0.6), ('UA', 0.3), ('US', 0.1)]),
+            'olga': (50, [('UA', 0.9)]),
+        }
+    )
+    uow = InMemoryUnitOfWork()
+    lookup_handler = GetNameOriginsCommandHandler(
+        name_origin_api_repository=api,
+        country_api_repository=fake_country_api_repository,
+        uow=uow,
+    )
+    area_handler = GetPopularNamesByAreaCommandHandler(
+        uow=uow, country_catalog=lookup_handler.country_catalog
+    )
+    lookup_handler.country_catalog.load(
+        [
+            replace(make_country(code), region='Europe', sub_region='Eastern Europe')
+            for code in ('PL', 'UA')
+        ]
+        + [make_country('US')]
+    )
+
+    for name in ('anna', 'olga'):
+        await lookup_handler.handle(GetNameOriginsCommand(name=name))
+
+    names = await area_handler.handle(
+        GetPopularNamesByAreaCommand(
+            area='eastern europe', area_type=AreaType.SUB_REGION
+        )
+    )
+    assert [(name.name, name.weight, name.countries) for name in names] == [
+        ('anna', pytest.approx(90.0), 2),
+        ('olga', pytest.approx(45.0), 1),
+    ]
+
+    # A refetch replaces the contribution of the name instead of adding to it
+    api.origins['olga'] = (200, [('UA', 0.9)])
+    await lookup_handler.handle(
+        GetNameOriginsCommand(name='olga', min_freshness=lookup_handler.freshness * 2)
+    )
+    names = await area_handler.handle(GetPopularNamesByAreaCommand(area='Europe'))
+    assert [(name.name, name.weight) for name in names] == [
+        ('olga', pytest.approx(180.0)),
+        ('anna', pytest.approx(90.0)),
+    ]
+
+    with pytest.raises(AreaNotFoundException):
+        await area_handler.handle(GetPopularNamesByAreaCommand(area='Oceania'))
@@ -0,0 +1,79 @@
+from dataclasses import dataclass
+
+import pytest
+
+from domain.entities.country import CountryEntity
+from domain.entities.name import NameStrEntity
+from domain.exceptions.name import EmptyNameException
+from infra.exceptions.upstream import UpstreamUnavailableException
+from infra.repositories.memory.unit_of_work import InMemoryUnitOfWork
+from logic.commands.name import (
+    GetBatchNameOriginsCommand,
+    GetBatchNameOriginsCommandHandler,
+)
+from logic.exceptions.name import NameNotFoundException
+from tests.factories import make_country
+from tests.fakes import (
+    FakeCountryAPIRepository,
+    FakeNameOriginAPIRepository,
+)
+
+
+@dataclass
+class PartialNameOriginAPIRepository(FakeNameOriginAPIRepository):
+    async def get_name_origins(self, name: str) -> list[NameStrEntity] | None:
+        if name == 'unknown':
+            self.lookups.append(name)
+            return None
+        return await super().get_name_origins(name)
+
+
+@dataclass
+class UnavailableCountryAPIRepository(FakeCountryAPIRepository):
+    async def get_countries(self, names: list[str]) -> list[CountryEntity]:
+        raise UpstreamUnavailableException(upstream='rest_countries', retry_after=0)
+
+
+@pytest.mark.asyncio
+async def test_batch_dedupes_names_and_reports_errors_per_name(
+    fake_country_api_repository: FakeCountryAPIRepository,
+) -> None:
+    api = PartialNameOriginAPIRepository()
+    handler = GetBatchNameOriginsCommandHandler(
+        name_origin_api_repository=api,
+        country_api_repository=fake_country_api_repository,
+        uow=InMemoryUnitOfWork(),
+    )
+    handler.country_catalog.load([make_country('US')])
+
+    results = await handler.handle(
+        GetBatchNameOriginsCommand(names=('Anna', ' anna', 'Unknown', '', 'Anna'))
+    )
+
+    assert sorted(api.lookups) == ['anna', 'unknown']
+    assert set(results) == {'Anna', ' anna', 'Unknown', ''}
+    assert results['Anna'] == results[' anna']
+    assert results['Anna'][0].country.iso_alpha2_code == 'US'
+    assert isinstance(results['Unknown'], NameNotFoundException)
+    assert isinstance(results[''], EmptyNameException)
+
+    # Stored origins are served from the database
+    results = await handler.handle(GetBatchNameOriginsCommand(names=('ANNA',)))
+    assert sorted(api.lookups) == ['anna', 'unknown']
+    assert results['ANNA'][0].probability.as_generic_type() == 0.5
+
+
+@pytest.mark.asyncio
+async def test_countries_failure_is_reported_per_name() -> None:
+    handler = GetBatchNameOriginsCommandHandler(
+        name_origin_api_repository=PartialNameOriginAPIRepository(),
+        country_api_repository=UnavailableCountryAPIRepository(countries=[]),
+        uow=InMemoryUnitOfWork(),
+    )
+
+    results = await handler.handle(
+        GetBatchNameOriginsCommand(names=('Anna', 'Unknown'))
+    )
+
+    assert isinstance(results['Anna'], UpstreamUnavailableException)
+    assert isinstance(results['Unknown'], NameNotFoundException)
@@ -0,0 +1,11 @@
+from punq import Container
+
+from logic.commands.name import GetNameOriginsCommand
+from logic.mediator import Mediator
+
+
+def test_mediator_is_built_once(container: Container) -> None:
+    mediator: Mediator = container.resolve(Mediator)
+
+    assert container.resolve(Mediator) is mediator
+    assert mediator.commands_map[GetNameOriginsCommand]
@@ -0,0 +1,184 @@
+from dataclasses import (
+    dataclass,
+    replace,
+)
+
+import pytest
+
+from domain.entities.country import CountryEntity
+from infra.indexes.country_catalog import CountryCatalog
+from infra.indexes.country_graph import CountryGraph
+from infra.repositories.memory.unit_of_work import InMemoryUnitOfWork
+from logic.commands.country import (
+    GetCountryNeighborsCommand,
+    GetCountryNeighborsCommandHandler,
+    GetCountryPathCommand,
+    GetCountryPathCommandHandler,
+    RebuildCountryGraphCommand,
+    RebuildCountryGraphCommandHandler,
+)
+from logic.exceptions.country import (
+    CountryGraphIncompleteException,
+    CountryNotFoundException,
+    NoLandPathException,
+)
+from tests.factories import make_country
+from tests.fakes import FakeCountryAPIRepository
+
+
+# Alpha-2 code -> (alpha-3 code, borders)
+BORDERS = {
+    'PL': ('POL', {'DEU', 'CZE', 'UKR'}),
+    'DE': ('DEU', {'POL', 'CZE', 'FRA'}),
+    'CZ': ('CZE', {'POL', 'DEU'}),
+    'FR': ('FRA', {'DEU', 'ESP'}),
+    'ES': ('ESP', {'FRA'}),
+    'UA': ('UKR', set()),  # Its border with Poland is listed by Poland only
+    'IS': ('ISL', set()),
+}
+
+
+@dataclass
+class Alpha3CountryAPIRepository(FakeCountryAPIRepository):
+    calls: int = 0
+
+    async def get_alpha3_codes(self) -> dict[str, str]:
+        self.calls += 1
+        return {code: alpha3 for code, (alpha3, _) in BORDERS.items()}
+
+
+@dataclass
+class UnavailableAlpha3CountryAPIRepository(Alpha3CountryAPIRepository):
+    async def get_list_of_countries(self) -> list[CountryEntity]:
+        raise TimeoutError
+
+    async def get_alpha3_codes(self) -> dict[str, str]:
+        raise TimeoutError
+
+
+def make_countries() -> list[CountryEntity]:
+    return [
+        replace(make_country(code), borders=borders)
+        for code, (_, borders) in BORDERS.items()
+    ]
+
+
+@pytest.mark.asyncio
+async def test_graph_answers_neighbors_and_shortest_land_paths() -> None:
+    uow = InMemoryUnitOfWork()
+    async with uow:
+        for country in make_countries():
+            await uow.country.add_country(country)
+        await uow.commit()
+    api = Alpha3CountryAPIRepository(countries=[])
+    catalog, graph = CountryCatalog(), CountryGraph()
+    rebuild_handler = RebuildCountryGraphCommandHandler(
+        country_api_repository=api,
+        uow=uow,
+        country_catalog=catalog,
+        country_graph=graph,
+    )
+    neighbors_handler = GetCountryNeighborsCommandHandler(
+        country_catalog=catalog, country_graph=graph
+    )
+    path_handler = GetCountryPathCommandHandler(
+        country_catalog=catalog, country_graph=graph
+    )
+
+    assert await rebuild_handler.handle(RebuildCountryGraphCommand()) == 7
+    # The resolved alpha-3 codes are stored, so they are fetched once
+    await rebuild_handler.handle(RebuildCountryGraphCommand())
+    assert api.calls == 1
+
+    levels = await neighbors_handler.handle(
+        GetCountryNeighborsCommand(iso_alpha2_code='pl', hops=3)
+    )
+    assert [[country.iso_alpha2_code for country in level] for level in levels] == [
+        ['CZ', 'DE', 'UA'],
+        ['FR'],
+        ['ES'],
+    ]
+    assert (
+        await neighbors_handler.handle(
+            GetCountryNeighborsCommand(iso_alpha2_code='IS', hops=2)
+        )
+        == []
+    )
+
+    path = await path_handler.handle(GetCountryPathCommand(source='UA', target='ES'))
+    assert [country.iso_alpha2_code for country in path] == [
+        'UA',
+        'PL',
+        'DE',
+        'FR',
+        'ES',
+    ]
+
+    with pytest.raises(NoLandPathException):
+        await path_handler.handle(GetCountryPathCommand(source='PL', target='IS'))
+    with pytest.raises(CountryNotFoundException):
+        await path_handler.handle(GetCountryPathCommand(source='PL', target='XX'))
+
+
+async def store(uow: InMemoryUnitOfWork, countries: list[CountryEntity]) -> None:
+    async with uow:
+        for country in countries:
+            await uow.country.add_country(country)
+        await uow.commit()
+
+
+@pytest.mark.asyncio
+async def test_countries_missing_from_the_database_are_added() -> None:
+    uow = InMemoryUnitOfWork()
+    await store(
+        uow,
+        [country for country in make_countries() if country.iso_alpha2_code != 'DE'],
+    )
+    catalog, graph = CountryCatalog(), CountryGraph()
+    rebuild_handler = RebuildCountryGraphCommandHandler(
+        country_api_repository=Alpha3CountryAPIRepository(countries=make_countries()),
+        uow=uow,
+        country_catalog=catalog,
+        country_graph=graph,
+    )
+    path_handler = GetCountryPathCommandHandler(
+        country_catalog=catalog, country_graph=graph
+    )
+
+    assert await rebuild_handler.handle(RebuildCountryGraphCommand()) == 7
+    assert graph.unknown_borders == frozenset()
+    async with uow:
+        assert await uow.country.get_country('DE') is not None
+
+    path = await path_handler.handle(GetCountryPathCommand(source='PL', target='FR'))
+    assert [country.iso_alpha2_code for country in path] == ['PL', 'DE', 'FR']
+
+
+@pytest.mark.asyncio
+async def test_unreachable_api_leaves_an_incomplete_graph() -> None:
+    uow = InMemoryUnitOfWork()
+    await store(
+        uow,
+        [
+            replace(country, iso_alpha3_code=BORDERS[country.iso_alpha2_code][0])
+            for country in make_countries()
+            if country.iso_alpha2_code != 'DE'
+        ],
+    )
+    catalog, graph = CountryCatalog(), CountryGraph()
+    rebuild_handler = RebuildCountryGraphCommandHandler(
+        country_api_repository=UnavailableAlpha3CountryAPIRepository(countries=[]),
+        uow=uow,
+        country_catalog=catalog,
+        country_graph=graph,
+    )
+    path_handler = GetCountryPathCommandHandler(
+        country_catalog=catalog, country_graph=graph
+    )
+
+    assert await rebuild_handler.handle(RebuildCountryGraphCommand()) == 6
+    assert graph.unknown_borders == frozenset({'DEU'})
+
+    # Without Germany, Poland and France only seem to have no land path
+    with pytest.raises(CountryGraphIncompleteException):
+        await path_handler.handle(GetCountryPathCommand(source='PL', target='FR'))
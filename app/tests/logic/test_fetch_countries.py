@@ -0,0 +1,117 @@
+import asyncio
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+import pytest
+
+from domain.entities.country import CountryEntity
+from domain.entities.name import NameStrEntity
+from domain.values.name import (
+    CountOfRequests,
+    Name,
+    Probability,
+)
+from infra.exceptions.upstream import UpstreamUnavailableException
+from infra.repositories.api.base import BaseNameOriginAPIRepository
+from infra.repositories.memory.unit_of_work import InMemoryUnitOfWork
+from logic.commands.name import (
+    GetNameOriginsCommand,
+    GetNameOriginsCommandHandler,
+)
+from logic.exceptions.country import CountriesFetchTimeoutException
+from tests.factories import make_country
+from tests.fakes import FakeCountryAPIRepository
+
+
+CODES = [f'C{number}' for number in range(8)]
+
+
+@dataclass
+class ManyCountriesNameOriginAPIRepository(BaseNameOriginAPIRepository):
+    async def get_name_origins(self, name: str) -> list[NameStrEntity] | None:
+        return [
+            NameStrEntity(
+                name=Name(value=name),
+                probability=Probability(value=0.1),
+                count_of_requests=CountOfRequests(value=10),
+                country_name=code,
+            )
+            for code in CODES
+        ]
+
+
+@dataclass
+class SlowCountryAPIRepository(FakeCountryAPIRepository):
+    delay: float = 0.01
+    failing_code: str | None = None
+    in_flight: int = 0
+    max_in_flight: int = 0
+    cancelled: list[list[str]] = field(default_factory=list)
+
+    async def get_countries(self, names: list[str]) -> list[CountryEntity]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.failing_code in names:
+                raise UpstreamUnavailableException(
+                    upstream='rest_countries', retry_after=0
+                )
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(names)
+            raise
+        finally:
+            self.in_flight -= 1
+        return [make_country(code) for code in names]
+
+
+def make_handler(
+    country_api: SlowCountryAPIRepository, **kwargs
+) -> GetNameOriginsCommandHandler:
+    return GetNameOriginsCommandHandler(
+        name_origin_api_repository=ManyCountriesNameOriginAPIRepository(),
+        country_api_repository=country_api,
+        uow=InMemoryUnitOfWork(),
+        country_batch_size=2,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_country_chunks_are_fetched_within_the_concurrency_limit() -> None:
+    country_api = SlowCountryAPIRepository(countries=[])
+    handler = make_handler(country_api, country_fetch_concurrency=2)
+
+    origins = await handler.handle(GetNameOriginsCommand(name='anna'))
+
+    assert sorted(origin.country.iso_alpha2_code for origin in origins) == CODES
+    assert country_api.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_country_fetch_past_its_budget_times_out() -> None:
+    country_api = SlowCountryAPIRepository(countries=[], delay=10)
+    handler = make_handler(country_api, country_fetch_timeout=0.05)
+
+    with pytest.raises(CountriesFetchTimeoutException) as exc_info:
+        await handler.handle(GetNameOriginsCommand(name='anna'))
+
+    assert exc_info.value.iso_alpha2_codes == CODES
+    assert len(country_api.cancelled) == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_chunk_cancels_the_others_and_keeps_the_group() -> None:
+    country_api = SlowCountryAPIRepository(countries=[], delay=10, failing_code='C4')
+    handler = make_handler(country_api)
+
+    with pytest.raises(UpstreamUnavailableException) as exc_info:
+        await handler.handle(GetNameOriginsCommand(name='anna'))
+
+    assert isinstance(exc_info.value.__cause__, ExceptionGroup)
+    assert exc_info.value.__cause__.exceptions == (exc_info.value,)
+    assert len(country_api.cancelled) == 3
+    # Nothing was stored, so the next lookup fetches the countries again
+    assert handler.country_catalog.get_many(CODES) == {}
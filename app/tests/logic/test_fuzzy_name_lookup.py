@@ -0,0 +1,46 @@
+import pytest
+
+from infra.repositories.memory.unit_of_work import InMemoryUnitOfWork
+from logic.commands.name import (
+    GetNameOriginsCommand,
+    GetNameOriginsCommandHandler,
+)
+from logic.exceptions.name import NameNotFoundException
+from tests.factories import make_country
+from tests.fakes import (
+    FakeCountryAPIRepository,
+    FlakyNameOriginAPIRepository,
+)
+
+
+@pytest.mark.asyncio
+async def test_near_miss_is_served_from_stored_origins(
+    flaky_name_origin_api_repository: FlakyNameOriginAPIRepository,
+    fake_country_api_repository: FakeCountryAPIRepository,
+) -> None:
+    api = flaky_name_origin_api_repository
+    handler = GetNameOriginsCommandHandler(
+        name_origin_api_repository=api,
+        country_api_repository=fake_country_api_repository,
+        uow=InMemoryUnitOfWork(),
+    )
+    handler.country_catalog.load([make_country('US')])
+    await handler.handle(GetNameOriginsCommand(name='Michael'))
+
+    origins = await handler.handle(GetNameOriginsCommand(name='Micheal', fuzzy=True))
+
+    assert origins[0].name.as_generic_type() == 'Michael'
+    assert api.lookups == ['michael']
+
+    with pytest.raises(NameNotFoundException) as exc_info:
+        await handler.handle(GetNameOriginsCommand(name='Unknown'))
+    assert exc_info.value.suggestion is None
+
+    # Suggestions are only searched for when asked for
+    handler.name_fuzzy_index.put('unknowns', 'Unknowns', 1)
+    with pytest.raises(NameNotFoundException) as exc_info:
+        await handler.handle(GetNameOriginsCommand(name='Unknown'))
+    assert exc_info.value.suggestion is None
+    with pytest.raises(NameNotFoundException) as exc_info:
+        await handler.handle(GetNameOriginsCommand(name='Unknown', suggest=True))
+    assert 'Did you mean "Unknowns"?' in exc_info.value.message
@@ -0,0 +1,118 @@
+from dataclasses import replace
+from pathlib import Path
+
+import orjson
+import pytest
+
+from domain.entities.job import JobStatus
+from infra.files.jobs import JobFileStore
+from infra.repositories.memory.unit_of_work import InMemoryUnitOfWork
+from logic.commands.job import (
+    CreateNamesJobCommand,
+    CreateNamesJobCommandHandler,
+    RunNamesJobCommand,
+    RunNamesJobCommandHandler,
+)
+from logic.commands.name import GetNameOriginsCommandHandler
+from tests.factories import make_country
+from tests.fakes import (
+    FakeCountryAPIRepository,
+    FakeNameOriginAPIRepository,
+    FlakyNameOriginAPIRepository,
+)
+from utils.workers import WorkerPool
+
+
+async def _names(*names: str):
+    for name in names:
+        yield name
+
+
+def make_handlers(
+    tmp_path: Path, api: FakeNameOriginAPIRepository
+) -> tuple[CreateNamesJobCommandHandler, RunNamesJobCommandHandler, WorkerPool]:
+    uow = InMemoryUnitOfWork()
+    files = JobFileStore(directory=tmp_path)
+    lookup_handler = GetNameOriginsCommandHandler(
+        name_origin_api_repository=api,
+        country_api_repository=FakeCountryAPIRepository(countries=[]),
+        uow=uow,
+    )
+    lookup_handler.country_catalog.load([make_country('US')])
+    worker_pool = WorkerPool(run=lambda job_id: None)
+    create_handler = CreateNamesJobCommandHandler(
+        uow=uow, files=files, worker_pool=worker_pool
+    )
+    run_handler = RunNamesJobCommandHandler(
+        get_name_origins_handler=lookup_handler,
+        uow=uow,
+        files=files,
+        chunk_size=2,
+    )
+    return create_handler, run_handler, worker_pool
+
+
+def read_results(files: JobFileStore, job_id: str) -> list[dict]:
+    return [
+        orjson.loads(line)
+        for line in files.results_path(job_id).read_bytes().splitlines()
+    ]
+
+
+@pytest.mark.asyncio
+async def test_job_resolves_names_in_chunks_and_retries_unavailable_upstream(
+    tmp_path: Path,
+) -> None:
+    api = FlakyNameOriginAPIRepository()
+    create_handler, run_handler, worker_pool = make_handlers(tmp_path, api)
+
+    job = await create_handler.handle(
+        CreateNamesJobCommand(names=_names('Anna', 'Unknown', 'Bob'))
+    )
+    assert job.status == JobStatus.PENDING
+    assert job.total_names == 3
+    assert not worker_pool.submit(job.id)  # Already queued by the handler
+
+    job = await run_handler.handle(RunNamesJobCommand(job_id=job.id))
+
+    assert job.status == JobStatus.COMPLETED
+    assert (job.processed_names, job.failed_names) == (3, 1)
+    results = read_results(run_handler.files, job.id)
+    assert [result['name'] for result in results] == ['Anna', 'Unknown', 'Bob']
+    assert results[0]['origins'][0]['country_code'] == 'US'
+    assert 'error' in results[1]
+    assert results[2]['origins'][0]['probability'] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_interrupted_job_resumes_after_its_last_checkpoint(
+    tmp_path: Path,
+) -> None:
+    api = FakeNameOriginAPIRepository()
+    create_handler, run_handler, _ = make_handlers(tmp_path, api)
+    job = await create_handler.handle(
+        CreateNamesJobCommand(names=_names('Anna', 'Bob', 'Cleo'))
+    )
+
+    # The first chunk was checkpointed, and the next one written but not
+    checkpoint = b'{"name":"Anna","origins":[]}\n{"name":"Bob","origins":[]}\n'
+    run_handler.files.results_path(job.id).write_bytes(
+        checkpoint + b'{"name":"Cleo","origins":[]}\n'
+    )
+    interrupted = replace(
+        job,
+        status=JobStatus.RUNNING,
+        processed_names=2,
+        results_offset=len(checkpoint),
+    )
+    async with run_handler.uow:
+        await run_handler.uow.job.update_job(interrupted)
+        await run_handler.uow.commit()
+
+    job = await run_handler.handle(RunNamesJobCommand(job_id=job.id))
+
+    assert job.status == JobStatus.COMPLETED
+    assert api.lookups == ['cleo']
+    results = read_results(run_handler.files, job.id)
+    assert [result['name'] for result in results] == ['Anna', 'Bob', 'Cleo']
+    assert results[2]['origins'][0]['country_code'] == 'US'
@@ -0,0 +1,120 @@
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from infra.indexes.country_catalog import CountryCatalog
+from infra.repositories.api.base import BaseCountryAPIRepository
+from infra.repositories.memory.unit_of_work import InMemoryUnitOfWork
+from logic.commands.country import (
+    RebuildAreaPopularityCommand,
+    RebuildAreaPopularityCommandHandler,
+    RefreshCountriesCommand,
+    RefreshCountriesCommandHandler,
+)
+from tests.factories import make_country
+from tests.fakes import FakeCountryAPIRepository
+from utils.shared_state import (
+    HostLock,
+    SharedStateFile,
+)
+
+
+def make_handler(
+    tmp_path: Path, api: BaseCountryAPIRepository, uow: InMemoryUnitOfWork
+) -> RefreshCountriesCommandHandler:
+    return RefreshCountriesCommandHandler(
+        country_api_repository=api,
+        uow=uow,
+        country_catalog=CountryCatalog(),
+        refresh_lock=HostLock(path=tmp_path / 'refresh.lock'),
+        refresh_state=SharedStateFile(path=tmp_path / 'refresh.json'),
+    )
+
+
+@pytest.mark.asyncio
+async def test_only_changed_countries_are_applied(tmp_path: Path) -> None:
+    uow = InMemoryUnitOfWork()
+    api = FakeCountryAPIRepository(countries=[make_country('US'), make_country('CA')])
+    handler = make_handler(tmp_path, api, uow)
+
+    assert await handler.handle(RefreshCountriesCommand()) == 2
+    # The stored revision is sent back and the API answers "not modified"
+    assert await handler.handle(RefreshCountriesCommand()) == 0
+    assert api.requests == [None, '"v1"']
+
+    api.countries = [make_country('US'), replace(make_country('CA'), region='North')]
+    api.etag = '"v2"'
+    assert await handler.handle(RefreshCountriesCommand()) == 1
+    async with uow:
+        assert (await uow.country.get_country('CA')).region == 'North'
+
+
+@pytest.mark.asyncio
+async def test_refresh_is_skipped_while_another_worker_holds_the_lock(
+    tmp_path: Path,
+) -> None:
+    api = FakeCountryAPIRepository(countries=[make_country('US')])
+    handler = make_handler(tmp_path, api, InMemoryUnitOfWork())
+
+    with handler.refresh_lock.acquire_nowait() as acquired:
+        assert acquired
+        assert await handler.handle(RefreshCountriesCommand()) == 0
+
+    assert api.requests == []
+
+
+@pytest.mark.asyncio
+async def test_lock_holder_catches_up_before_an_unchanged_revalidation(
+    tmp_path: Path,
+) -> None:
+    uow = InMemoryUnitOfWork()
+    api = FakeCountryAPIRepository(countries=[make_country('CA')])
+    first, second = make_handler(tmp_path, api, uow), make_handler(tmp_path, api, uow)
+    assert await first.handle(RefreshCountriesCommand()) == 1
+    second.country_catalog.load([make_country('CA')])
+
+    api.countries = [replace(make_country('CA'), region='North')]
+    api.etag = '"v2"'
+    assert await first.handle(RefreshCountriesCommand()) == 1
+
+    # The list did not change since, but the second worker never loaded it
+    assert await second.handle(RefreshCountriesCommand()) == 0
+    assert api.requests[-1] == '"v2"'
+    assert second.country_catalog.get_many(['CA'])['CA'].region == 'North'
+
+
+@pytest.mark.asyncio
+async def test_recent_revalidation_by_another_worker_is_not_repeated(
+    tmp_path: Path,
+) -> None:
+    uow = InMemoryUnitOfWork()
+    api = FakeCountryAPIRepository(countries=[make_country('US')])
+    assert await make_handler(tmp_path, api, uow).handle(RefreshCountriesCommand()) == 1
+
+    handler = replace(make_handler(tmp_path, api, uow), revalidate_after=60)
+    assert await handler.handle(RefreshCountriesCommand()) == 0
+    assert api.requests == [None]
+
+
+@pytest.mark.asyncio
+async def test_region_change_leaves_the_area_popularity_rebuild_to_a_job(
+    tmp_path: Path,
+) -> None:
+    uow = InMemoryUnitOfWork()
+    api = FakeCountryAPIRepository(countries=[make_country('CA')])
+    handler = make_handler(tmp_path, api, uow)
+    rebuild_handler = RebuildAreaPopularityCommandHandler(
+        uow=uow, refresh_state=handler.refresh_state
+    )
+    assert await handler.handle(RefreshCountriesCommand()) == 1
+    assert not await rebuild_handler.handle(RebuildAreaPopularityCommand())
+
+    api.countries = [replace(make_country('CA'), region='North')]
+    api.etag = '"v2"'
+    assert await handler.handle(RefreshCountriesCommand()) == 1
+    assert handler.refresh_state.read()['area_popularity_stale']
+
+    # The first worker to run the job claims the rebuild
+    assert await rebuild_handler.handle(RebuildAreaPopularityCommand())
+    assert not await rebuild_handler.handle(RebuildAreaPopularityCommand())
@@ -0,0 +1,51 @@
+from datetime import (
+    datetime,
+    timedelta,
+)
+
+import pytest
+
+from infra.repositories.memory.unit_of_work import InMemoryUnitOfWork
+from logic.commands.name import (
+    GetNameOriginsCommand,
+    GetNameOriginsCommandHandler,
+    RefreshHotNamesCommand,
+    RefreshHotNamesCommandHandler,
+)
+from tests.factories import make_country
+from tests.fakes import (
+    FakeCountryAPIRepository,
+    FakeNameOriginAPIRepository,
+)
+
+
+@pytest.mark.asyncio
+async def test_hot_names_are_refetched_before_they_expire(
+    fake_name_origin_api_repository: FakeNameOriginAPIRepository,
+    fake_country_api_repository: FakeCountryAPIRepository,
+) -> None:
+    api = fake_name_origin_api_repository
+    lookup_handler = GetNameOriginsCommandHandler(
+        name_origin_api_repository=api,
+        country_api_repository=fake_country_api_repository,
+        uow=InMemoryUnitOfWork(),
+        freshness=timedelta(minutes=30),
+    )
+    lookup_handler.country_catalog.load([make_country('US')])
+    refresh_handler = RefreshHotNamesCommandHandler(
+        get_name_origins_handler=lookup_handler,
+        refresh_window=timedelta(hours=1),
+    )
+
+    await lookup_handler.handle(GetNameOriginsCommand(name='Anna'))
+    await lookup_handler.handle(GetNameOriginsCommand(name='Anna'))
+    assert api.lookups == ['anna']
+
+    assert await refresh_handler.handle(RefreshHotNamesCommand()) == 1
+    assert api.lookups == ['anna', 'anna']
+    assert (
+        lookup_handler.hot_names.due(
+            top=10, before=datetime.now() + timedelta(minutes=20)
+        )
+        == []
+    )
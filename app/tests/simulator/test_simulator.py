@@ -0,0 +1,59 @@
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from simulator.config import SimulatorConfig
+from simulator.fixtures import FixtureStore, RecordedResponse
+from simulator.main import create_app
+
+
+def make_client(tmp_path: Path, **settings) -> TestClient:
+    config = SimulatorConfig(
+        SIMULATOR_FIXTURES_DIR=str(tmp_path),
+        SIMULATOR_LATENCY_MEDIAN_MS=0,
+        **settings,
+    )
+    return TestClient(app=create_app(config))
+
+
+def test_synthetic_name_origins_are_deterministic(tmp_path: Path) -> None:
+    client = make_client(tmp_path)
+
+    first = client.get('/nationalize/', params={'name': 'anna'})
+    second = client.get('/nationalize/', params={'name': 'anna'})
+
+    assert first.status_code == 200
+    assert first.json() == second.json()
+    assert first.json()['name'] == 'anna'
+
+
+def test_batch_lookup_returns_names_in_request_order(tmp_path: Path) -> None:
+    client = make_client(tmp_path)
+
+    response = client.get('/nationalize/', params=[('name[]', 'b'), ('name[]', 'a')])
+
+    assert [result['name'] for result in response.json()] == ['b', 'a']
+
+
+def test_rate_limit_counts_names(tmp_path: Path) -> None:
+    client = make_client(tmp_path, SIMULATOR_RATE_LIMIT=2)
+
+    allowed = client.get('/nationalize/', params=[('name[]', 'a'), ('name[]', 'b')])
+    limited = client.get('/nationalize/', params={'name': 'c'})
+
+    assert allowed.headers['X-Rate-Limit-Remaining'] == '0'
+    assert limited.status_code == 429
+    assert 'X-Rate-Limit-Reset' in limited.headers
+
+
+def test_replay_serves_recorded_fixtures(tmp_path: Path) -> None:
+    FixtureStore(directory=tmp_path).save(
+        'rest_countries',
+        '/alpha/SY',
+        [],
+        RecordedResponse(status_code=200, body=[{'cca2': 'SY'}]),
+    )
+    client = make_client(tmp_path, SIMULATOR_MODE='replay')
+
+    assert client.get('/countries/alpha/SY').json() == [{'cca2': 'SY'}]
+    assert client.get('/countries/alpha/FR').status_code == 404
@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+
+from utils.admission import AdmissionController, AdmissionPriority
+
+
+@pytest.mark.asyncio
+async def test_released_slot_goes_to_the_highest_priority_waiter() -> None:
+    controller = AdmissionController(max_concurrency=1, queue_size=2, queue_timeout=1)
+    assert await controller.acquire(AdmissionPriority.LOW)
+
+    low = asyncio.ensure_future(controller.acquire(AdmissionPriority.LOW))
+    high = asyncio.ensure_future(controller.acquire(AdmissionPriority.HIGH))
+    await asyncio.sleep(0)
+    controller.release()
+
+    assert await high
+    assert not low.done()
+    controller.release()
+    assert await low
+    controller.release()
+    assert controller.active == 0
+
+
+@pytest.mark.asyncio
+async def test_full_queue_sheds_low_priority_requests_first() -> None:
+    controller = AdmissionController(
+        max_concurrency=1, queue_size=1, queue_timeout=0.05
+    )
+    assert await controller.acquire(AdmissionPriority.LOW)
+
+    low = asyncio.ensure_future(controller.acquire(AdmissionPriority.LOW))
+    await asyncio.sleep(0)
+    high = asyncio.ensure_future(controller.acquire(AdmissionPriority.HIGH))
+    await asyncio.sleep(0)
+
+    assert await low is False
+    assert not await controller.acquire(AdmissionPriority.LOW)
+    # Nobody releases the slot, so the waiter gives up at its queue deadline
+    assert await high is False
+    assert controller.waiting == 0
@@ -0,0 +1,55 @@
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+
+from logic.commands.base import BaseCommand, CommandHandler
+from logic.exceptions.deadline import DeadlineExceededException
+from logic.mediator import Mediator
+from utils.deadline import deadline_after, deadline_scope, remaining
+
+
+@dataclass(frozen=True)
+class SleepCommand(BaseCommand):
+    seconds: float
+
+
+@dataclass(frozen=True)
+class SleepCommandHandler(CommandHandler[SleepCommand, float | None]):
+    async def handle(self, command: SleepCommand) -> float | None:
+        budget = remaining()
+        await asyncio.sleep(command.seconds)
+        return budget
+
+
+def make_mediator() -> Mediator:
+    mediator = Mediator()
+    mediator.register_command(SleepCommand, [SleepCommandHandler()])
+    return mediator
+
+
+@pytest.mark.asyncio
+async def test_inner_deadline_cannot_extend_outer_one() -> None:
+    assert remaining(5.0) == 5.0
+
+    with deadline_scope(deadline_after(1.0)):
+        with deadline_scope(deadline_after(60.0)):
+            assert remaining() <= 1.0
+        assert remaining(0.5) == 0.5
+
+
+@pytest.mark.asyncio
+async def test_handlers_see_the_remaining_budget() -> None:
+    budget, *_ = await make_mediator().handle_command(
+        SleepCommand(seconds=0), deadline=deadline_after(2.0)
+    )
+
+    assert 0 < budget <= 2.0
+
+
+@pytest.mark.asyncio
+async def test_work_is_cancelled_at_the_deadline() -> None:
+    with pytest.raises(DeadlineExceededException):
+        await make_mediator().handle_command(
+            SleepCommand(seconds=10), deadline=deadline_after(0.01)
+        )
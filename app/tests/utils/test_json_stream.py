@@ -0,0 +1,31 @@
+from collections.abc import AsyncIterator
+
+import orjson
+import pytest
+
+from utils.json_stream import iter_json_array
+
+
+DOCUMENT = orjson.dumps([{'name': 'Zoë', 'borders': ['FR']}, 12345, 'text', None])
+
+
+async def split(size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(DOCUMENT), size):
+        yield DOCUMENT[start : start + size]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('size', [1, 3, 7, len(DOCUMENT)])
+async def test_items_are_decoded_across_chunk_boundaries(size: int) -> None:
+    items = [item async for item in iter_json_array(split(size))]
+
+    assert items == orjson.loads(DOCUMENT)
+
+
+@pytest.mark.asyncio
+async def test_rejects_documents_that_are_not_arrays() -> None:
+    async def chunks() -> AsyncIterator[bytes]:
+        yield b'{"a": 1}'
+
+    with pytest.raises(ValueError):
+        [item async for item in iter_json_array(chunks())]
@@ -0,0 +1,65 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from utils.rate_limit import (
+    ClientRateLimiter,
+    count_request_cost,
+    record_upstream_lookups,
+)
+from utils.shared_state import SharedStateFile
+
+
+def test_clients_have_separate_buckets_and_upstream_cost_is_debt() -> None:
+    limiter = ClientRateLimiter(rate=1.0, burst=3.0)
+
+    assert limiter.try_acquire('ip:1') == 0
+    limiter.charge('ip:1', 5.0)
+
+    assert limiter.try_acquire('ip:1') > 2.0
+    assert limiter.try_acquire('ip:2') == 0
+
+
+@pytest.mark.asyncio
+async def test_workers_share_spending_when_they_reconcile(tmp_path: Path) -> None:
+    state = SharedStateFile(path=tmp_path / 'limits.json')
+    first = ClientRateLimiter(rate=0.001, burst=4.0, state=state)
+    second = ClientRateLimiter(rate=0.001, burst=4.0, state=state)
+
+    for _ in range(3):
+        assert first.try_acquire('key:a') == 0
+    await first.reconcile()
+    await second.reconcile()
+
+    assert second.try_acquire('key:a') == 0
+    assert second.try_acquire('key:a') > 0
+
+
+@pytest.mark.asyncio
+async def test_spending_during_a_reconcile_is_kept_for_the_next(
+    tmp_path: Path,
+) -> None:
+    state = SharedStateFile(path=tmp_path / 'limits.json')
+    limiter = ClientRateLimiter(rate=0.001, burst=4.0, state=state)
+    assert limiter.try_acquire('key:a') == 0
+
+    reconcile = asyncio.ensure_future(limiter.reconcile())
+    await asyncio.sleep(0)
+    # The state file is being written in a worker thread meanwhile
+    assert limiter.try_acquire('key:a') == 0
+    await reconcile
+    await limiter.reconcile()
+
+    assert state.read()['key:a'][0] == pytest.approx(2.0, abs=0.01)
+    assert limiter.try_acquire('key:a', cost=2.0) == 0
+    assert limiter.try_acquire('key:a') > 0
+
+
+def test_upstream_lookups_are_counted_inside_a_request_only() -> None:
+    record_upstream_lookups(1)
+    with count_request_cost() as cost:
+        record_upstream_lookups(2)
+        record_upstream_lookups(3)
+
+    assert cost.upstream_lookups == 5
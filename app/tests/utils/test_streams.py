@@ -0,0 +1,45 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+
+from utils.streams import iter_lines, map_concurrently
+
+
+async def chunked(data: bytes, size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('size', [1, 4, 64])
+async def test_lines_are_split_across_chunk_boundaries(size: int) -> None:
+    data = b'Anna\r\n\n  Zo\xc3\xab \nx' + b'y' * 20 + b'\nBob'
+
+    lines = [line async for line in iter_lines(chunked(data, size), max_line_length=8)]
+
+    assert lines == ['Anna', 'Zoë', 'xyyyyyyy', 'Bob']
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded_and_results_stream_as_they_complete() -> None:
+    in_flight = 0
+    peak = 0
+
+    async def items() -> AsyncIterator[int]:
+        for item in range(10):
+            yield item
+
+    async def work(item: int) -> int:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05 if item == 0 else 0.01)
+        in_flight -= 1
+        return item
+
+    results = [result async for result in map_concurrently(items(), work, 3)]
+
+    assert peak == 3
+    assert sorted(results) == list(range(10))
+    assert results[0] != 0
@@ -0,0 +1,111 @@
+import asyncio
+import enum
+import itertools
+from dataclasses import dataclass, field
+
+
+class AdmissionPriority(enum.IntEnum):
+    """Priority of a request waiting for admission; lower values go first."""
+
+    HIGH = 0
+    LOW = 1
+
+
+@dataclass
+class _Waiter:
+    priority: AdmissionPriority
+    order: int
+    future: asyncio.Future[bool]
+
+
+@dataclass
+class AdmissionController:
+    """Concurrency limit with a bounded, prioritized wait queue.
+
+    Up to max_concurrency requests run at once. Others wait in a queue of
+    queue_size, higher priority first, for at most queue_timeout seconds; a full
+    queue evicts its lowest priority waiter to make room for a more urgent request,
+    and otherwise rejects the new one. Rejecting fast keeps the admitted requests
+    within their deadlines instead of letting every request time out together.
+
+    Attributes:
+        max_concurrency: Requests admitted at once
+        queue_size: Requests waiting at once
+        queue_timeout: Seconds a request waits before it is rejected
+    """
+
+    max_concurrency: int = 64
+    queue_size: int = 128
+    queue_timeout: float = 0.5
+    _active: int = field(default=0, init=False, repr=False)
+    _waiters: list[_Waiter] = field(default_factory=list, init=False, repr=False)
+    _order: itertools.count = field(
+        default_factory=itertools.count, init=False, repr=False
+    )
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter.future.done())
+
+    async def acquire(self, priority: AdmissionPriority) -> bool:
+        """Wait for a slot; release() must be called if the request was admitted.
+
+        Args:
+            priority (AdmissionPriority): Priority of the request in the queue.
+
+        Returns:
+            bool: Whether the request was admitted.
+        """
+        self._waiters = [waiter for waiter in self._waiters if not waiter.future.done()]
+        if self._active < self.max_concurrency and not self._waiters:
+            self._active += 1
+            return True
+
+        if len(self._waiters) >= self.queue_size:
+            if not self._waiters:
+                return False
+            # The waiter closest to its timeout among the lowest priority ones
+            lowest = max(self._waiters, key=lambda waiter: waiter.priority)
+            if lowest.priority <= priority:
+                return False
+            lowest.future.set_result(False)
+            self._waiters.remove(lowest)
+
+        waiter = _Waiter(
+            priority=priority,
+            order=next(self._order),
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._waiters.append(waiter)
+        try:
+            async with asyncio.timeout(self.queue_timeout):
+                return await waiter.future
+        except TimeoutError:
+            return self._handed_over(waiter)
+        except asyncio.CancelledError:
+            if self._handed_over(waiter):
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Free the slot of an admitted request, handing it to the next waiter."""
+        pending = [waiter for waiter in self._waiters if not waiter.future.done()]
+        if pending:
+            waiter = min(pending, key=lambda waiter: (waiter.priority, waiter.order))
+            self._waiters.remove(waiter)
+            # The slot is handed over, so the number of active requests is unchanged
+            waiter.future.set_result(True)
+            return
+        self._active -= 1
+
+    @staticmethod
+    def _handed_over(waiter: _Waiter) -> bool:
+        """Stop waiting; returns whether the slot was handed over in the meantime."""
+        if waiter.future.done() and not waiter.future.cancelled():
+            return waiter.future.result()
+        waiter.future.cancel()
+        return False
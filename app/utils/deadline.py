@@ -0,0 +1,46 @@
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+# Absolute deadline of the current request, in event loop time
+_deadline: ContextVar[float | None] = ContextVar('deadline', default=None)
+
+
+def deadline_after(timeout: float) -> float:
+    """Returns the deadline that is timeout seconds from now, in event loop time."""
+    return asyncio.get_running_loop().time() + timeout
+
+
+def current_deadline() -> float | None:
+    return _deadline.get()
+
+
+def remaining(default: float | None = None) -> float | None:
+    """Returns the seconds left until the deadline of the current context.
+
+    Args:
+        default (float | None): Budget to use without a deadline, and the upper
+            bound of the result otherwise.
+
+    Returns:
+        float | None: Seconds left, never negative; default if there is no deadline.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return default
+
+    left = max(0.0, deadline - asyncio.get_running_loop().time())
+    return left if default is None else min(left, default)
+
+
+@contextmanager
+def deadline_scope(deadline: float) -> Iterator[None]:
+    """Apply a deadline to the current context; an earlier outer deadline wins."""
+    outer = _deadline.get()
+    token = _deadline.set(deadline if outer is None else min(outer, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
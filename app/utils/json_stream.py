@@ -0,0 +1,60 @@
+import codecs
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+
+_WHITESPACE = ' \t\n\r'
+
+
+async def iter_json_array(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """Yield the items of a top-level JSON array while its bytes arrive.
+
+    Only the item being parsed is buffered, so a large response is never held in
+    memory as a whole.
+
+    Args:
+        chunks (AsyncIterable[bytes]): UTF-8 encoded chunks of the JSON document.
+
+    Yields:
+        Any: The decoded items of the array, in order.
+
+    Raises:
+        ValueError: If the document is not a JSON array.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    buffer = ''
+    started = False
+
+    async for chunk in chunks:
+        buffer += text_decoder.decode(chunk)
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            if position == len(buffer):
+                break
+
+            if not started:
+                if buffer[position] != '[':
+                    raise ValueError('Expected a JSON array')
+                started = True
+                position += 1
+                continue
+            if buffer[position] in ',]':
+                position += 1
+                continue
+
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # The item continues in the next chunk
+                break
+            if end == len(buffer) and not isinstance(item, dict | list | str):
+                # A number or literal at the end of the buffer may be truncated
+                break
+            yield item
+            position = end
+
+        buffer = buffer[position:]
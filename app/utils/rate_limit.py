@@ -0,0 +1,182 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from utils.shared_state import SharedStateFile
+
+
+@dataclass
+class RequestCost:
+    """Upstream lookups made while handling one request."""
+
+    upstream_lookups: int = 0
+
+
+_request_cost: ContextVar[RequestCost | None] = ContextVar('request_cost', default=None)
+
+
+@contextmanager
+def count_request_cost() -> Iterator[RequestCost]:
+    """Count the upstream lookups of the current request inside the block.
+
+    The counter is shared with the tasks the request spawns, so lookups made
+    concurrently on its behalf are counted as well.
+    """
+    cost = RequestCost()
+    token = _request_cost.set(cost)
+    try:
+        yield cost
+    finally:
+        _request_cost.reset(token)
+
+
+def record_upstream_lookups(count: int) -> None:
+    """Count names looked up upstream on behalf of the current request, if any."""
+    cost = _request_cost.get()
+    if cost is not None:
+        cost.upstream_lookups += count
+
+
+@dataclass
+class ClientRateLimiter:
+    """Per-client token buckets of one worker, reconciled across the host.
+
+    Requests spend from the bucket of their client without locks or I/O; the
+    buckets live in the event loop thread of the worker. Every reconcile(), the
+    tokens each worker spent since the previous one are applied to host-wide
+    buckets in a shared state file, and the local buckets adopt the host-wide
+    levels, so a client cannot multiply its rate by the number of workers for
+    longer than one reconciliation interval.
+
+    Attributes:
+        rate: Tokens added to a bucket per second
+        burst: Capacity of a bucket
+        state: Host-wide buckets; None keeps the limits per worker
+        capacity: Clients tracked at once; full buckets are dropped first
+    """
+
+    rate: float = 5.0
+    burst: float = 50.0
+    state: SharedStateFile | None = None
+    capacity: int = 10000
+    # Client key -> [tokens, updated_at, tokens spent since the last reconcile]
+    _buckets: dict[str, list[float]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def try_acquire(self, client: str, cost: float = 1.0) -> float:
+        """Spend tokens of a client if it has enough of them.
+
+        Args:
+            client (str): API key or address of the client.
+            cost (float): Tokens the request costs.
+
+        Returns:
+            float: 0 if the tokens were spent, otherwise the seconds until the
+                client has enough of them.
+        """
+        now = time.monotonic()
+        bucket = self._bucket(client, now)
+        if bucket[0] < cost:
+            return (cost - bucket[0]) / self.rate
+        bucket[0] -= cost
+        bucket[2] += cost
+        return 0.0
+
+    def charge(self, client: str, cost: float) -> None:
+        """Spend tokens after the fact; the bucket may go into debt."""
+        if cost <= 0:
+            return
+        bucket = self._bucket(client, time.monotonic())
+        bucket[0] -= cost
+        bucket[2] += cost
+
+    async def reconcile(self) -> None:
+        """Exchange the local spending with the other workers of the host.
+
+        Only the clients that spent tokens since the previous reconcile are sent;
+        the shared state file is locked, read and written in a worker thread, and
+        the spending done meanwhile is kept for the next reconcile.
+        """
+        if self.state is None:
+            return
+
+        spent: dict[str, float] = {}
+        for client, bucket in self._buckets.items():
+            if bucket[2]:
+                spent[client] = bucket[2]
+                bucket[2] = 0.0
+        try:
+            levels = await self.state.apply(
+                lambda state: self._merge(state, spent, time.time())
+            )
+        except BaseException:
+            for client, cost in spent.items():
+                self._bucket(client, time.monotonic())[2] += cost
+            raise
+
+        now = time.monotonic()
+        for client, tokens in levels.items():
+            bucket = self._buckets.get(client)
+            if bucket is None:
+                # Throttled by another worker; throttle it here as well
+                self._buckets[client] = [tokens, now, 0.0]
+            else:
+                bucket[0], bucket[1] = tokens - bucket[2], now
+
+    def _merge(
+        self, state: dict[str, Any], spent: dict[str, float], wall_now: float
+    ) -> dict[str, float]:
+        """Apply the spending of this worker to the locked host-wide buckets.
+
+        Returns:
+            dict[str, float]: The host-wide tokens of the clients this worker
+                spent for and of the clients throttled on the host.
+        """
+        levels: dict[str, float] = {}
+        for client, cost in spent.items():
+            tokens, updated_at = state.get(client, (self.burst, wall_now))
+            tokens = min(
+                self.burst,
+                tokens + max(0.0, wall_now - updated_at) * self.rate,
+            )
+            state[client] = (tokens - cost, wall_now)
+
+        for client, (tokens, updated_at) in list(state.items()):
+            tokens = min(
+                self.burst, tokens + max(0.0, wall_now - updated_at) * self.rate
+            )
+            if tokens >= self.burst:
+                # A full bucket is the same as no bucket
+                del state[client]
+                if client not in spent:
+                    continue
+            levels[client] = tokens
+        return levels
+
+    def _bucket(self, client: str, now: float) -> list[float]:
+        bucket = self._buckets.get(client)
+        if bucket is None:
+            if len(self._buckets) >= self.capacity:
+                self._prune(now)
+            bucket = self._buckets[client] = [self.burst, now, 0.0]
+            return bucket
+
+        bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+        bucket[1] = now
+        return bucket
+
+    def _prune(self, now: float) -> None:
+        """Drop the buckets that refilled and have nothing left to reconcile."""
+        self._buckets = {
+            client: bucket
+            for client, bucket in self._buckets.items()
+            if bucket[2] or bucket[0] + (now - bucket[1]) * self.rate < self.burst
+        }
+        if len(self._buckets) >= self.capacity:
+            # Every client is throttled; forget the oldest rather than grow
+            oldest = min(self._buckets, key=lambda client: self._buckets[client][1])
+            del self._buckets[oldest]
@@ -0,0 +1,65 @@
+import asyncio
+import logging
+import random
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PeriodicJob:
+    """Job run by the Scheduler every interval seconds.
+
+    Attributes:
+        name: Name of the job, used in logs
+        interval: Seconds between the end of a run and the start of the next one
+        run: Creates one run of the job
+        initial_delay: Seconds before the first run
+        jitter: Share of the interval randomly added or removed, so the workers of
+            a host do not all wake up at once
+    """
+
+    name: str
+    interval: float
+    run: Callable[[], Awaitable[object]]
+    initial_delay: float = 0.0
+    jitter: float = 0.1
+
+
+@dataclass
+class Scheduler:
+    """In-process scheduler of periodic background jobs, started from the lifespan."""
+
+    jobs: list[PeriodicJob] = field(default_factory=list)
+    _tasks: set[asyncio.Task] = field(default_factory=set, init=False, repr=False)
+
+    def add(self, job: PeriodicJob) -> None:
+        self.jobs.append(job)
+
+    def start(self) -> None:
+        """Start running every job in the background."""
+        for job in self.jobs:
+            task = asyncio.create_task(self._run_periodically(job), name=job.name)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def aclose(self) -> None:
+        """Cancel the jobs and wait for them to stop."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _run_periodically(self, job: PeriodicJob) -> None:
+        await asyncio.sleep(self._jittered(job.initial_delay, job.jitter))
+        while True:
+            try:
+                await job.run()
+            except Exception:
+                logger.exception('Scheduled job %s failed', job.name)
+            await asyncio.sleep(self._jittered(job.interval, job.jitter))
+
+    @staticmethod
+    def _jittered(delay: float, jitter: float) -> float:
+        return max(0.0, delay * (1 + random.uniform(-jitter, jitter)))
@@ -0,0 +1,111 @@
+import asyncio
+import fcntl
+from collections.abc import (
+    Callable,
+    Iterator,
+)
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    TypeVar,
+)
+
+import orjson
+
+
+T = TypeVar('T')
+
+
+@dataclass
+class SharedStateFile:
+    """JSON state shared by the worker processes of one host.
+
+    Every access holds an exclusive ``flock`` on the file, so read-modify-write
+    cycles of different workers never interleave.
+    """
+
+    path: Path
+
+    @contextmanager
+    def locked(self) -> Iterator[dict[str, Any]]:
+        """Lock the state and yield it for reading and updating.
+
+        The state is written back when the block exits without an exception.
+
+        Yields:
+            dict[str, Any]: The current state, empty if it was never written.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a+b') as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                file.seek(0)
+                raw = file.read()
+                state: dict[str, Any] = orjson.loads(raw) if raw else {}
+                yield state
+                file.seek(0)
+                file.truncate()
+                file.write(orjson.dumps(state))
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
+
+    def read(self) -> dict[str, Any]:
+        """Returns a snapshot of the state."""
+        with self.locked() as state:
+            return dict(state)
+
+    async def apply(self, change: Callable[[dict[str, Any]], T]) -> T:
+        """Run a read-modify-write of the state in a worker thread.
+
+        Waiting for the lock of another worker and the file I/O then never block
+        the event loop.
+
+        Args:
+            change: Called with the locked state, which it may update.
+
+        Returns:
+            T: What change returned.
+        """
+
+        def run() -> T:
+            with self.locked() as state:
+                return change(state)
+
+        return await asyncio.to_thread(run)
+
+    async def aread(self) -> dict[str, Any]:
+        """Returns a snapshot of the state, read in a worker thread."""
+        return await asyncio.to_thread(self.read)
+
+
+@dataclass
+class HostLock:
+    """Lock held by at most one worker process of a host at a time.
+
+    Unlike SharedStateFile, it may be held across awaits: it is only ever taken
+    without blocking, so no worker waits on it.
+    """
+
+    path: Path
+
+    @contextmanager
+    def acquire_nowait(self) -> Iterator[bool]:
+        """Try to take the lock for the duration of the block.
+
+        Yields:
+            bool: Whether the lock was taken; False if another process holds it.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a+b') as file:
+            try:
+                fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+
+            try:
+                yield True
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
@@ -0,0 +1,113 @@
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from typing import TypeVar
+
+import orjson
+
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+async def iter_lines(
+    chunks: AsyncIterable[bytes], max_line_length: int = 1024
+) -> AsyncIterator[str]:
+    """Split a byte stream into lines as the bytes arrive.
+
+    Only the current line is buffered, so memory does not grow with the stream. A
+    line longer than max_line_length bytes is cut, and the rest of it is dropped.
+
+    Args:
+        chunks (AsyncIterable[bytes]): The chunks of the stream.
+        max_line_length (int): Bytes kept of a line.
+
+    Yields:
+        str: The lines without their line break, blank lines skipped.
+    """
+    buffer = bytearray()
+    overlong = False
+    async for chunk in chunks:
+        lines = chunk.split(b'\n')
+        for index, line in enumerate(lines):
+            if not overlong:
+                room = max_line_length - len(buffer)
+                buffer += line[:room]
+                overlong = len(line) > room
+            if index < len(lines) - 1:
+                text = buffer.decode(errors='replace').strip()
+                if text:
+                    yield text
+                buffer.clear()
+                overlong = False
+
+    text = buffer.decode(errors='replace').strip()
+    if text:
+        yield text
+
+
+def parse_text_line(line: str) -> str:
+    """Returns the text of a line, decoding it if it is a JSON string."""
+    if line.startswith('"'):
+        try:
+            text = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            return line
+        if isinstance(text, str):
+            return text
+    return line
+
+
+async def map_concurrently(
+    items: AsyncIterable[T],
+    func: Callable[[T], Awaitable[R]],
+    concurrency: int,
+) -> AsyncIterator[R]:
+    """Apply func to a stream of items with at most concurrency calls in flight.
+
+    The next item is only read while there is a free slot, so a fast producer is
+    held back instead of being buffered. Results are yielded as they complete, which
+    is not necessarily the order of the items; pending calls are cancelled when the
+    consumer stops early.
+
+    Args:
+        items (AsyncIterable[T]): The items to process.
+        func (Callable[[T], Awaitable[R]]): Processes one item.
+        concurrency (int): Calls in flight at once.
+
+    Yields:
+        R: The results, in completion order.
+    """
+    iterator = aiter(items)
+
+    async def read_next() -> tuple[bool, T | None]:
+        try:
+            return True, await anext(iterator)
+        except StopAsyncIteration:
+            return False, None
+
+    pending: set[asyncio.Future] = set()
+    reader: asyncio.Future | None = None
+    exhausted = False
+    try:
+        while True:
+            if reader is None and not exhausted and len(pending) < concurrency:
+                reader = asyncio.ensure_future(read_next())
+            waiting = (pending | {reader}) if reader else pending
+            if not waiting:
+                return
+
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            if reader in done:
+                has_item, item = reader.result()
+                if has_item:
+                    pending.add(asyncio.ensure_future(func(item)))
+                else:
+                    exhausted = True
+                reader = None
+
+            for task in done & pending:
+                pending.discard(task)
+                yield task.result()
+    finally:
+        for task in (pending | {reader}) if reader else pending:
+            task.cancel()
@@ -0,0 +1,70 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WorkerPool:
+    """Fixed number of background tasks working through a queue of keys.
+
+    A key is queued at most once at a time, and not while a worker is on it, so
+    periodic rescans can submit every unfinished key without piling up duplicates.
+
+    Attributes:
+        run: Processes the work of one key
+        workers: Tasks running at once
+        name: Name of the pool, used in logs
+    """
+
+    run: Callable[[str], Awaitable[object]]
+    workers: int = 2
+    name: str = 'workers'
+    _queue: asyncio.Queue[str] = field(
+        default_factory=asyncio.Queue, init=False, repr=False
+    )
+    _submitted: set[str] = field(default_factory=set, init=False, repr=False)
+    _tasks: set[asyncio.Task] = field(default_factory=set, init=False, repr=False)
+
+    def submit(self, key: str) -> bool:
+        """Queue a key unless it is queued or being processed already.
+
+        Returns:
+            bool: Whether the key was queued.
+        """
+        if key in self._submitted:
+            return False
+        self._submitted.add(key)
+        self._queue.put_nowait(key)
+        return True
+
+    def start(self) -> None:
+        """Start the workers in the background."""
+        for index in range(self.workers):
+            task = asyncio.create_task(self._work(), name=f'{self.name}-{index}')
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def aclose(self) -> None:
+        """Cancel the workers and wait for them to stop."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def join(self) -> None:
+        """Wait until every submitted key is processed."""
+        await self._queue.join()
+
+    async def _work(self) -> None:
+        while True:
+            key = await self._queue.get()
+            try:
+                await self.run(key)
+            except Exception:
+                logger.exception('Worker of %s failed on %s', self.name, key)
+            finally:
+                self._submitted.discard(key)
+                self._queue.task_done()